@@ -1,7 +1,14 @@
+import gzip
 import json
+import os
 import re
+import shutil
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from queue import Queue, Empty
+from itertools import islice
+from queue import Queue, Empty, SimpleQueue
 from tkinter import filedialog
 
 import paho.mqtt.client as mqtt
@@ -16,6 +23,30 @@ PASSWORD = "Broker2022"
 
 LOG_FILE = "mqtt_full_log.txt"
 
+LOG_MAX_BYTES = 64 * 1024 * 1024
+LOG_ROTATE_HOURLY = True
+LOG_COMPRESS = True
+
+LOG_FLUSH_BYTES = 256 * 1024
+LOG_FLUSH_INTERVAL = 1.0
+
+LOG_INDEX_STEP = 1000
+
+HISTORY_LIMIT = 50000
+HISTORY_PAGE = 500
+HISTORY_PAGES_CACHED = 8
+
+ROW_HEIGHT = 20
+
+CAPTURE_RECORD_RE = re.compile(r"\d{2}:\d{2}:\d{2} \S+")
+
+IO_NAMED_RE = re.compile(r"(Output|Input)\s+(\d+),\s*([A-Za-z0-9_\-]+)\s+turned\s+(On|Off)")
+IO_SIMPLE_RE = re.compile(r"(Output|Input)\s+(\d+)\s+turned\s+(On|Off)")
+CNC_STATE_RE = re.compile(r"Update Cnc State to (\w+)")
+
+UI_TICK_MS = 50
+UI_TICK_BUDGET = 0.025
+
 FILTER_TOPICS = {
     "Phoenix/Phoenix/Uptime",
     "Phoenix/Managed/Uptime"
@@ -39,10 +70,7 @@ def parse_message(payload):
 
 def detect_io(message):
 
-    pattern_named = r"(Output|Input)\s+(\d+),\s*([A-Za-z0-9_\-]+)\s+turned\s+(On|Off)"
-    pattern_simple = r"(Output|Input)\s+(\d+)\s+turned\s+(On|Off)"
-
-    m = re.search(pattern_named, message)
+    m = IO_NAMED_RE.search(message)
 
     if m:
         io_type = m.group(1)
@@ -51,7 +79,7 @@ def detect_io(message):
         state = m.group(4).lower() == "on"
         return io_type, f"{number} {name}", state
 
-    m = re.search(pattern_simple, message)
+    m = IO_SIMPLE_RE.search(message)
 
     if m:
         io_type = m.group(1)
@@ -64,7 +92,7 @@ def detect_io(message):
 
 def detect_state(message):
 
-    m = re.search(r"Update Cnc State to (\w+)", message)
+    m = CNC_STATE_RE.search(message)
 
     if m:
         return m.group(1)
@@ -72,20 +100,52 @@ def detect_state(message):
     return None
 
 
+class MessageDecoder:
+
+    def __init__(self, queue):
+
+        self.queue = queue
+        self.raw = SimpleQueue()
+
+        self.thread = threading.Thread(target=self.run, name="message-decoder", daemon=True)
+        self.thread.start()
+
+    def put(self, topic, payload, ts):
+
+        self.raw.put((topic, payload, ts))
+
+    def close(self):
+
+        self.raw.put(None)
+        self.thread.join()
+
+    def run(self):
+
+        while True:
+
+            item = self.raw.get()
+
+            if item is None:
+                return
+
+            topic, payload, ts = item
+
+            payload = payload.decode(errors="ignore")
+            message, _ = parse_message(payload)
+
+            self.queue.put(("msg", topic, payload, ts, message, detect_state(message), detect_io(message)))
+
+
 class MQTTClient:
 
     def __init__(self, queue):
         self.queue = queue
         self.client = None
+        self.decoder = MessageDecoder(queue)
 
     def connect(self, host):
 
-        if self.client:
-            try:
-                self.client.loop_stop()
-                self.client.disconnect()
-            except:
-                pass
+        self.disconnect()
 
         self.client = mqtt.Client(client_id="phoenix_monitor")
 
@@ -98,6 +158,17 @@ class MQTTClient:
 
         self.client.loop_start()
 
+    def disconnect(self):
+
+        if self.client:
+            try:
+                self.client.loop_stop()
+                self.client.disconnect()
+            except:
+                pass
+
+        self.client = None
+
     def on_connect(self, client, userdata, flags, rc):
 
         client.subscribe("Phoenix/#")
@@ -106,16 +177,332 @@ class MQTTClient:
 
     def on_message(self, client, userdata, msg):
 
-        payload = msg.payload.decode(errors="ignore")
+        self.decoder.put(msg.topic, msg.payload, datetime.now().strftime("%H:%M:%S"))
 
-        self.queue.put(
-            (
-                "msg",
-                msg.topic,
-                payload,
-                datetime.now().strftime("%H:%M:%S")
-            )
-        )
+
+class CaptureWriter:
+
+    def __init__(
+        self,
+        path,
+        max_bytes=LOG_MAX_BYTES,
+        rotate_hourly=LOG_ROTATE_HOURLY,
+        compress=LOG_COMPRESS,
+        flush_bytes=LOG_FLUSH_BYTES,
+        flush_interval=LOG_FLUSH_INTERVAL
+    ):
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_hourly = rotate_hourly
+        self.compress = compress
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+
+        self.lines = SimpleQueue()
+        self.file = None
+        self.size = 0
+        self.hour = None
+        self.opened_at = None
+        self.error = None
+        self.compressions = []
+
+        self.lines_written = 0
+        self.segments = []
+        self.segment = None
+        self.index_lock = threading.Lock()
+
+        self.thread = threading.Thread(target=self.run, name="capture-writer", daemon=True)
+        self.thread.start()
+
+    def write(self, line):
+
+        self.lines.put(line)
+
+    def close(self):
+
+        self.lines.put(None)
+        self.thread.join()
+
+        for thread in self.compressions:
+            thread.join()
+
+    def run(self):
+
+        batch = []
+        batch_size = 0
+        last_flush = time.monotonic()
+        running = True
+
+        while running:
+
+            try:
+                line = self.lines.get(timeout=self.flush_interval)
+            except Empty:
+                line = ""
+
+            if line is None:
+                running = False
+            elif line:
+                batch.append(line)
+                batch_size += len(line)
+
+            if batch and (
+                not running
+                or batch_size >= self.flush_bytes
+                or time.monotonic() - last_flush >= self.flush_interval
+            ):
+                self.flush(batch)
+                batch = []
+                batch_size = 0
+                last_flush = time.monotonic()
+
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def flush(self, batch):
+
+        chunks = [line.encode("utf-8") for line in batch]
+        data = b"".join(chunks)
+
+        try:
+            self.prepare_segment(len(data))
+
+            if self.segment is None:
+                self.segment = {"first": self.lines_written, "path": self.path, "offsets": [], "lines": 0}
+                with self.index_lock:
+                    self.segments.append(self.segment)
+
+            offsets = []
+            position = self.size
+            line = self.segment["lines"]
+
+            for chunk in chunks:
+                if line % LOG_INDEX_STEP == 0:
+                    offsets.append(position)
+                line += 1
+                position += len(chunk)
+
+            self.file.write(data)
+            self.file.flush()
+            self.size += len(data)
+            self.error = None
+
+            with self.index_lock:
+                self.segment["offsets"].extend(offsets)
+                self.segment["lines"] = line
+
+        except OSError as exc:
+            self.error = str(exc)
+            self.segment = None
+            if self.file:
+                self.file.close()
+                self.file = None
+            with self.index_lock:
+                self.segments.append({"first": self.lines_written, "path": None, "offsets": [], "lines": len(batch)})
+
+        self.lines_written += len(batch)
+
+    def prepare_segment(self, incoming):
+
+        now = datetime.now()
+        hour = now.strftime("%Y%m%d%H")
+
+        if self.file and (
+            (self.size and self.size + incoming > self.max_bytes)
+            or (self.rotate_hourly and hour != self.hour)
+        ):
+            self.rotate()
+
+        if not self.file:
+            self.file = open(self.path, "ab")
+            self.size = self.file.tell()
+            self.hour = hour
+            self.opened_at = now
+
+            if self.size and self.size + incoming > self.max_bytes:
+                self.rotate()
+                self.prepare_segment(incoming)
+
+    def rotate(self):
+
+        self.file.close()
+        self.file = None
+        self.segment = None
+
+        if not self.size:
+            return
+
+        base, ext = os.path.splitext(self.path)
+        stamp = self.opened_at.strftime("%Y%m%d_%H%M%S")
+        target = f"{base}_{stamp}{ext}"
+        counter = 1
+
+        while os.path.exists(target) or os.path.exists(target + ".gz"):
+            target = f"{base}_{stamp}_{counter}{ext}"
+            counter += 1
+
+        # Leitores abrem os segmentos sob o mesmo lock, então nenhum abre o novo arquivo ativo por engano.
+        with self.index_lock:
+            os.replace(self.path, target)
+            self.rename_segments(self.path, target)
+
+        self.size = 0
+
+        if self.compress:
+            thread = threading.Thread(target=self.compress_segment, args=(target,), daemon=True)
+            thread.start()
+            self.compressions = [t for t in self.compressions if t.is_alive()] + [thread]
+
+    def compress_segment(self, path):
+
+        try:
+            with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            with self.index_lock:
+                self.rename_segments(path, path + ".gz")
+            os.remove(path)
+        except OSError as exc:
+            self.error = str(exc)
+
+    def rename_segments(self, old, new):
+
+        for segment in self.segments:
+            if segment["path"] == old:
+                segment["path"] = new
+
+    def iter_lines(self, start):
+
+        with self.index_lock:
+            segments = [(segment, segment["first"], segment["lines"], segment["path"] is None) for segment in self.segments]
+
+        for segment, first, lines, lost in segments:
+
+            skip = start - first
+
+            if skip >= lines:
+                continue
+
+            skip = max(skip, 0)
+            start = first + lines
+
+            if lost:
+                yield from [None] * (lines - skip)
+                continue
+
+            checkpoint = skip // LOG_INDEX_STEP
+            records = self.read_records(segment, segment["offsets"][checkpoint], lines - checkpoint * LOG_INDEX_STEP)
+            yield from islice(records, skip - checkpoint * LOG_INDEX_STEP, None)
+
+    def read_records(self, segment, offset, count):
+
+        with self.index_lock:
+            path = segment["path"]
+            opener = gzip.open if path.endswith(".gz") else open
+            try:
+                handle = opener(path, "rb")
+            except FileNotFoundError:
+                # Comprimido depois que a lista de segmentos foi lida.
+                handle = gzip.open(path + ".gz", "rb")
+
+        with handle:
+
+            handle.seek(offset)
+
+            record = None
+
+            for raw in handle:
+
+                line = raw.decode("utf-8", errors="ignore")
+
+                # Um payload com quebras de linha continua até a próxima linha "HH:MM:SS tópico".
+                if record is not None and not CAPTURE_RECORD_RE.match(line):
+                    record += line
+                    continue
+
+                if record is not None:
+                    yield record.rstrip("\n")
+                    count -= 1
+                    if not count:
+                        return
+
+                record = line
+
+            if record is not None and count:
+                yield record.rstrip("\n")
+
+
+class MessageHistory:
+
+    missing = ("", "", "", "(not available in the capture)")
+
+    def __init__(self, capture, limit=HISTORY_LIMIT):
+
+        self.capture = capture
+        self.recent = deque(maxlen=limit)
+        self.total = 0
+        self.pages = OrderedDict()
+
+    @property
+    def first_recent(self):
+
+        return self.total - len(self.recent)
+
+    def append(self, ts, topic, payload, message):
+
+        self.recent.append((ts, topic, payload, message))
+        self.total += 1
+
+    def get(self, index):
+
+        first_recent = self.first_recent
+
+        if index >= first_recent:
+            return self.recent[index - first_recent]
+
+        number, offset = divmod(index, HISTORY_PAGE)
+
+        page = self.pages.get(number)
+
+        if page is None:
+            lines = islice(self.capture.iter_lines(number * HISTORY_PAGE), HISTORY_PAGE)
+            page = self.pages[number] = [self.split(line) for line in lines]
+            if len(self.pages) > HISTORY_PAGES_CACHED:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(number)
+
+        if offset < len(page) and page[offset]:
+            return page[offset]
+
+        return self.missing
+
+    def rows(self, start, count):
+
+        return [self.get(index) for index in range(start, min(start + count, self.total))]
+
+    def __iter__(self):
+
+        first_recent = self.first_recent
+
+        for line in islice(self.capture.iter_lines(0), first_recent):
+            if line:
+                yield self.split(line)
+
+        yield from list(self.recent)
+
+    @staticmethod
+    def split(line):
+
+        if line is None:
+            return None
+
+        ts, _, rest = line.partition(" ")
+        topic, _, payload = rest.partition(" ")
+        message, _ = parse_message(payload)
+
+        return ts, topic, payload, message
 
 
 class LEDIndicator:
@@ -133,8 +520,15 @@ class LEDIndicator:
         self.label = tk.Label(frame, text=name, anchor="w")
         self.label.pack(side="left", padx=4)
 
+        self.state = None
+
     def set_state(self, state):
 
+        if state == self.state:
+            return
+
+        self.state = state
+
         color = "#00ff00" if state else "#550000"
 
         self.canvas.itemconfig(self.circle, fill=color)
@@ -150,8 +544,19 @@ class App:
 
         self.mqtt = MQTTClient(self.queue)
 
-        self.messages = []
-        self.received_messages = []
+        self.capture = CaptureWriter(LOG_FILE)
+
+        self.history = MessageHistory(self.capture)
+
+        self.view_top = 0
+        self.view_rows = 0
+        self.follow_tail = True
+        self.selected = None
+        self.table_dirty = False
+
+        self.pending_state = None
+        self.pending_outputs = {}
+        self.pending_inputs = {}
 
         self.outputs = {}
         self.inputs = {}
@@ -198,11 +603,14 @@ class App:
 
         columns = ("time", "topic", "message")
 
+        ttk.Style().configure("Treeview", rowheight=ROW_HEIGHT)
+
         self.table = ttk.Treeview(
             left,
             columns=columns,
             show="headings",
-            height=30
+            height=30,
+            selectmode="browse"
         )
 
         self.table.heading("time", text="Time")
@@ -213,9 +621,16 @@ class App:
         self.table.column("topic", width=260)
         self.table.column("message", width=480)
 
+        self.scrollbar = ttk.Scrollbar(left, orient="vertical", command=self.scroll_table)
+        self.scrollbar.pack(side="right", fill="y")
+
         self.table.pack(fill="both", expand=True)
 
         self.table.bind("<<TreeviewSelect>>", self.show_message)
+        self.table.bind("<Configure>", self.resize_table)
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.table.bind(sequence, self.wheel_table)
 
         center = tk.Frame(main)
         main.add(center)
@@ -268,6 +683,100 @@ class App:
 
         self.mqtt.connect(self.broker.get())
 
+    def close(self):
+
+        self.mqtt.disconnect()
+
+        self.mqtt.decoder.close()
+        self.drain_queue(None)
+
+        self.capture.close()
+
+        self.root.destroy()
+
+    def resize_table(self, event):
+
+        header = ROW_HEIGHT + 4
+
+        rows = max((event.height - header) // ROW_HEIGHT, 1)
+
+        if rows == self.view_rows:
+            return
+
+        for index in range(self.view_rows, rows):
+            self.table.insert("", "end", iid=str(index), values=("", "", ""))
+
+        for index in range(rows, self.view_rows):
+            self.table.delete(str(index))
+
+        self.view_rows = rows
+
+        self.refresh_table()
+
+    def scroll_table(self, action, amount, unit=None):
+
+        if action == "moveto":
+            top = round(float(amount) * self.history.total)
+        elif unit == "pages":
+            top = self.view_top + int(amount) * self.view_rows
+        else:
+            top = self.view_top + int(amount)
+
+        self.move_view(top)
+
+    def wheel_table(self, event):
+
+        if event.num == 4 or event.delta > 0:
+            step = -3
+        else:
+            step = 3
+
+        self.move_view(self.view_top + step)
+
+        return "break"
+
+    def move_view(self, top):
+
+        last_top = max(self.history.total - self.view_rows, 0)
+
+        self.view_top = min(max(top, 0), last_top)
+        self.follow_tail = self.view_top >= last_top
+
+        self.refresh_table()
+
+    def refresh_table(self):
+
+        self.table_dirty = False
+
+        total = self.history.total
+
+        if self.follow_tail:
+            self.view_top = max(total - self.view_rows, 0)
+
+        rows = self.history.rows(self.view_top, self.view_rows)
+
+        for index in range(self.view_rows):
+
+            if index < len(rows):
+                ts, topic, _, message = rows[index]
+                self.table.item(str(index), values=(ts, topic, message))
+            else:
+                self.table.item(str(index), values=("", "", ""))
+
+        selected = self.selected
+
+        if selected is not None and self.view_top <= selected < self.view_top + len(rows):
+            iid = str(selected - self.view_top)
+            if self.table.selection() != (iid,):
+                self.table.selection_set(iid)
+        elif self.table.selection():
+            self.table.selection_remove(self.table.selection())
+
+        if total:
+            self.scrollbar.set(self.view_top / total, min((self.view_top + self.view_rows) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
     def show_message(self, event):
 
         sel = self.table.selection()
@@ -275,9 +784,14 @@ class App:
         if not sel:
             return
 
-        index = int(sel[0])
+        index = self.view_top + int(sel[0])
 
-        topic, payload, ts = self.messages[index]
+        if index >= self.history.total or index == self.selected:
+            return
+
+        self.selected = index
+
+        ts, topic, payload, _ = self.history.get(index)
 
         self.details.delete("1.0", "end")
 
@@ -298,64 +812,47 @@ class App:
 
         store[name].set_state(state)
 
-    def add_message(self, topic, payload, ts):
-
-        parsed_message, _ = parse_message(payload)
-
-        self.received_messages.append((ts, topic, payload, parsed_message))
+    def add_message(self, topic, payload, ts, message, state, io):
 
         if self.filter_uptime.get() and is_uptime_topic(topic):
             return
 
-        message = parsed_message
-
-        index = len(self.messages)
-
-        self.messages.append((topic, payload, ts))
+        self.history.append(ts, topic, payload, message)
 
-        self.table.insert(
-            "",
-            "end",
-            iid=index,
-            values=(ts, topic, message)
-        )
-
-        state = detect_state(message)
+        self.table_dirty = True
 
         if state:
-            self.cnc_state.set(state)
-
-        io = detect_io(message)
+            self.pending_state = state
 
         if io:
 
-            io_type, name, state = io
+            io_type, name, io_state = io
 
             if io_type == "Output":
+                self.pending_outputs[name] = io_state
+            else:
+                self.pending_inputs[name] = io_state
 
-                self.update_led(
-                    self.outputs_frame,
-                    self.outputs,
-                    name,
-                    state
-                )
+        self.capture.write(f"{ts} {topic} {payload}\n")
 
-            else:
+    def apply_signals(self):
+
+        if self.pending_state:
+            self.cnc_state.set(self.pending_state)
+            self.pending_state = None
 
-                self.update_led(
-                    self.inputs_frame,
-                    self.inputs,
-                    name,
-                    state
-                )
+        for name, state in self.pending_outputs.items():
+            self.update_led(self.outputs_frame, self.outputs, name, state)
 
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
+        for name, state in self.pending_inputs.items():
+            self.update_led(self.inputs_frame, self.inputs, name, state)
 
-            f.write(f"{ts} {topic} {payload}\n")
+        self.pending_outputs.clear()
+        self.pending_inputs.clear()
 
     def export_messages(self):
 
-        if not self.received_messages:
+        if not self.history.total:
             self.status.config(text="No messages to export")
             return
 
@@ -382,24 +879,26 @@ class App:
             return
 
         with open(descriptions_path, "w", encoding="utf-8") as descriptions_file:
-            for ts, topic, payload, parsed_message in self.received_messages:
+            for ts, topic, payload, parsed_message in self.history:
                 if is_uptime_topic(topic):
                     continue
                 descriptions_file.write(f"{ts} | {topic} | {parsed_message}\n")
 
         with open(full_messages_path, "w", encoding="utf-8") as full_messages_file:
-            for ts, topic, payload, _ in self.received_messages:
+            for ts, topic, payload, _ in self.history:
                 if is_uptime_topic(topic):
                     continue
                 full_messages_file.write(f"{ts} {topic} {payload}\n")
 
         self.status.config(text="Export completed")
 
-    def loop(self):
+    def drain_queue(self, budget):
+
+        deadline = None if budget is None else time.perf_counter() + budget
 
         try:
 
-            while True:
+            while deadline is None or time.perf_counter() < deadline:
 
                 ev = self.queue.get_nowait()
 
@@ -409,16 +908,26 @@ class App:
 
                 if ev[0] == "msg":
 
-                    topic = ev[1]
-                    payload = ev[2]
-                    ts = ev[3]
-
-                    self.add_message(topic, payload, ts)
+                    self.add_message(*ev[1:])
 
         except Empty:
-            pass
+            return True
+
+        return False
+
+    def loop(self):
 
-        self.root.after(50, self.loop)
+        drained = self.drain_queue(UI_TICK_BUDGET)
+
+        self.apply_signals()
+
+        if self.table_dirty:
+            self.refresh_table()
+
+        if self.capture.error:
+            self.status.config(text=f"Capture error: {self.capture.error}")
+
+        self.root.after(UI_TICK_MS if drained else 1, self.loop)
 
 
 root = tk.Tk()
@@ -429,4 +938,6 @@ root.geometry("1600x900")
 
 app = App(root)
 
+root.protocol("WM_DELETE_WINDOW", app.close)
+
 root.mainloop()
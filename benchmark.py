@@ -0,0 +1,228 @@
+"""Benchmark das etapas de análise do monitor_app: parse, analyze e resumo.
+
+Roda cada etapa sobre o log_exemplo.txt e sobre logs maiores gerados a partir dele, mede
+tempo de parede, registros/s, MB/s e pico de memória, grava tudo em JSON e, com --baseline,
+falha quando alguma etapa fica mais lenta (ou mais pesada) que o orçamento permitido.
+Não abre janela: funciona em qualquer Linux sem display.
+
+    python3 benchmark.py --output bench/atual.json
+    python3 benchmark.py --baseline bench/main.json --budget 0.25
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from monitor_app import LogParser, MonitorAnalyzer, build_summary_payload
+
+ROOT = Path(__file__).resolve().parent
+SAMPLE_LOG = ROOT / 'log_exemplo.txt'
+STAGES = ('parse', 'analyze', 'summary')
+MB = 1024 * 1024
+
+
+@dataclass
+class StageResult:
+    seconds: float
+    median_seconds: float
+    records_per_s: float
+    mb_per_s: float
+    peak_mb: float
+
+
+@dataclass
+class InputResult:
+    name: str
+    size_mb: float
+    records: int
+    stages: dict[str, StageResult] = field(default_factory=dict)
+
+
+def generate_log(source: Path, target: Path, size_mb: float) -> Path:
+    content = source.read_bytes()
+    if not content.endswith(b'\n'):
+        content += b'\n'
+    copies = max(round(size_mb * MB / len(content)), 1)
+    with target.open('wb') as handle:
+        for _ in range(copies):
+            handle.write(content)
+    return target
+
+
+def measure(stage: Callable[[], Any], repeat: int) -> tuple[list[float], float, Any]:
+    timings = []
+    result = stage()  # aquecimento: caches de regex, imports tardios e páginas do arquivo
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = stage()
+        timings.append(time.perf_counter() - start)
+    # O tracemalloc deixa tudo mais lento, então o pico sai de uma rodada separada.
+    result = None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, peak / MB, result
+
+
+def run_input(name: str, path: Path, repeat: int) -> InputResult:
+    size_mb = path.stat().st_size / MB
+    timings, peak, records = measure(lambda: LogParser(path).parse(), repeat)
+    result = InputResult(name=name, size_mb=round(size_mb, 3), records=len(records))
+    stages: dict[str, tuple[list[float], float]] = {'parse': (timings, peak)}
+
+    timings, peak, analysis = measure(lambda: MonitorAnalyzer(records, source_path=path).analyze(), repeat)
+    stages['analyze'] = (timings, peak)
+    timings, peak, _ = measure(lambda: build_summary_payload(analysis), repeat)
+    stages['summary'] = (timings, peak)
+
+    for stage, (timings, peak) in stages.items():
+        best = min(timings)
+        result.stages[stage] = StageResult(
+            seconds=round(best, 6),
+            median_seconds=round(statistics.median(timings), 6),
+            records_per_s=round(result.records / best, 1) if best else 0.0,
+            mb_per_s=round(size_mb / best, 3) if best else 0.0,
+            peak_mb=round(peak, 3),
+        )
+    return result
+
+
+def git_commit() -> str | None:
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmark(sizes: list[float], repeat: int, source: Path = SAMPLE_LOG) -> dict[str, Any]:
+    results = [run_input(source.name, source, repeat)]
+    with tempfile.TemporaryDirectory(prefix='app_monitor_bench_') as directory:
+        for size_mb in sizes:
+            path = generate_log(source, Path(directory) / f'gerado_{size_mb:g}mb.txt', size_mb)
+            results.append(run_input(f'gerado_{size_mb:g}mb', path, repeat))
+    return {
+        'gerado_em': datetime.now().isoformat(sep=' ', timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'repeticoes': repeat,
+        'entradas': {result.name: asdict(result) for result in results},
+    }
+
+
+def parse_budgets(values: list[str], default: float) -> dict[str, float]:
+    budgets = dict.fromkeys(STAGES, default)
+    for value in values:
+        stage, _, fraction = value.rpartition('=')
+        if stage and stage not in STAGES:
+            raise argparse.ArgumentTypeError(f'Etapa desconhecida no orçamento: {stage!r} (use {", ".join(STAGES)}).')
+        for name in (stage,) if stage else STAGES:
+            budgets[name] = float(fraction)
+    return budgets
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    time_budgets: dict[str, float],
+    memory_budgets: dict[str, float],
+    noise_seconds: float = 0.005,
+    noise_mb: float = 0.5,
+) -> list[dict[str, Any]]:
+    """Diferenças menores que ``noise_seconds`` e ``noise_mb`` não contam: em etapas de poucos
+    milissegundos ou poucos KB a variação relativa é só ruído.
+    """
+    rows = []
+    for name, entry in current['entradas'].items():
+        reference = baseline.get('entradas', {}).get(name)
+        if not reference:
+            continue
+        for stage, measured in entry['stages'].items():
+            before = reference['stages'].get(stage)
+            if not before:
+                continue
+            time_change = measured['seconds'] / before['seconds'] - 1 if before['seconds'] else 0.0
+            memory_change = measured['peak_mb'] / before['peak_mb'] - 1 if before['peak_mb'] else 0.0
+            rows.append({
+                'entrada': name,
+                'etapa': stage,
+                'segundos': [before['seconds'], measured['seconds']],
+                'variacao_tempo': round(time_change, 4),
+                'pico_mb': [before['peak_mb'], measured['peak_mb']],
+                'variacao_memoria': round(memory_change, 4),
+                'estourou': (time_change > time_budgets[stage] and measured['seconds'] - before['seconds'] > noise_seconds)
+                or (memory_change > memory_budgets[stage] and measured['peak_mb'] - before['peak_mb'] > noise_mb),
+            })
+    return rows
+
+
+def print_table(payload: dict[str, Any]) -> None:
+    print(f"{'entrada':<22}{'etapa':<10}{'MB':>8}{'registros':>11}{'s':>10}{'reg/s':>12}{'MB/s':>9}{'pico MB':>10}", file=sys.stderr)
+    for name, entry in payload['entradas'].items():
+        for stage, measured in entry['stages'].items():
+            print(
+                f"{name:<22}{stage:<10}{entry['size_mb']:>8.1f}{entry['records']:>11}{measured['seconds']:>10.4f}"
+                f"{measured['records_per_s']:>12.0f}{measured['mb_per_s']:>9.1f}{measured['peak_mb']:>10.1f}",
+                file=sys.stderr,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark de parse, analyze e resumo do monitor_app.')
+    parser.add_argument('--sizes', type=float, nargs='*', default=[8.0, 32.0], metavar='MB', help='Tamanhos dos logs gerados a partir do log_exemplo.txt (padrão: 8 e 32 MB).')
+    parser.add_argument('--repeat', type=int, default=5, help='Execuções cronometradas por etapa; vale a mais rápida.')
+    parser.add_argument('--source', type=Path, default=SAMPLE_LOG, help='Log usado como entrada e como base dos logs gerados.')
+    parser.add_argument('--output', type=Path, help='Grava o resultado em JSON neste arquivo (sem ele, vai para a saída padrão).')
+    parser.add_argument('--baseline', type=Path, help='Resultado JSON anterior para comparar; sai com código 1 se alguma etapa estourar o orçamento.')
+    parser.add_argument('--budget', action='append', default=[], metavar='[ETAPA=]FRAÇÃO', help='Piora de tempo tolerada (padrão 0.25 = 25%%); pode repetir por etapa, ex. --budget summary=0.3.')
+    parser.add_argument('--noise', type=float, default=0.005, metavar='S', help='Pioras de tempo abaixo deste valor absoluto (s) são ignoradas (padrão 0.005).')
+    parser.add_argument('--memory-noise', type=float, default=0.5, metavar='MB', help='Aumentos de pico de memória abaixo deste valor absoluto (MB) são ignorados (padrão 0.5).')
+    parser.add_argument('--memory-budget', action='append', default=[], metavar='[ETAPA=]FRAÇÃO', help='Aumento tolerado no pico de memória (padrão 0.25).')
+    args = parser.parse_args()
+    try:
+        time_budgets = parse_budgets(args.budget, 0.25)
+        memory_budgets = parse_budgets(args.memory_budget, 0.25)
+    except (argparse.ArgumentTypeError, ValueError) as exc:
+        parser.error(str(exc))
+
+    payload = run_benchmark(args.sizes, max(args.repeat, 1), args.source)
+    print_table(payload)
+    failed = False
+    if args.baseline:
+        rows = compare(payload, json.loads(args.baseline.read_text(encoding='utf-8')), time_budgets, memory_budgets, args.noise, args.memory_noise)
+        payload['comparacao'] = {'baseline': str(args.baseline), 'linhas': rows}
+        for row in rows:
+            flag = 'ESTOUROU' if row['estourou'] else 'ok'
+            print(f"{row['entrada']:<22}{row['etapa']:<10}tempo {row['variacao_tempo']:+.1%}  memória {row['variacao_memoria']:+.1%}  {flag}", file=sys.stderr)
+        failed = any(row['estourou'] for row in rows)
+
+    text = json.dumps(payload, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + '\n', encoding='utf-8')
+    else:
+        print(text)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,62 @@
 import argparse
+import array
+import bisect
+import fnmatch
+import glob
+import hashlib
+import heapq
 import importlib.util
+import itertools
 import json
 import math
+import mmap
+import os
+import pickle
 import re
 import sys
-from collections import Counter, defaultdict
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from datetime import date, datetime, timedelta
+from datetime import time as dt_time
 from pathlib import Path
-from typing import Any, Iterable
+from json.decoder import scanstring
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 HAS_QT = importlib.util.find_spec('PySide6') is not None
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+HAS_PAHO = importlib.util.find_spec('paho') is not None
+
+if HAS_NUMPY:
+    import numpy as np
+
+if HAS_PAHO:
+    import paho.mqtt.client as mqtt
 
 if HAS_QT:
-    from PySide6.QtCore import QEasingCurve, Property, QPropertyAnimation, QRect, Qt
-    from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen
+    from PySide6.QtCore import (
+        QAbstractTableModel,
+        QEasingCurve,
+        QEvent,
+        QModelIndex,
+        Property,
+        QPointF,
+        QPropertyAnimation,
+        QRect,
+        QSortFilterProxyModel,
+        Qt,
+        QThread,
+        QTimer,
+        Signal,
+    )
+    from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen, QPixmap, QPolygonF
     from PySide6.QtWidgets import (
         QApplication,
+        QCheckBox,
+        QDateTimeEdit,
         QFileDialog,
         QFrame,
         QGraphicsDropShadowEffect,
@@ -24,23 +64,51 @@ if HAS_QT:
         QHBoxLayout,
         QHeaderView,
         QLabel,
+        QLineEdit,
         QMainWindow,
         QMessageBox,
         QPushButton,
         QPlainTextEdit,
+        QProgressBar,
         QSizePolicy,
-        QTableWidget,
-        QTableWidgetItem,
+        QTableView,
         QTabWidget,
         QVBoxLayout,
         QWidget,
     )
 
 RECORD_START_RE = re.compile(r'(?m)^(?P<time>\d{2}:\d{2}:\d{2})\s+(?P<topic>\S+)\s*(?P<payload>.*)$')
+RECORD_START_BYTES_RE = re.compile(rb'(?m)(?:^|(?<=\r))\d{2}:\d{2}:\d{2}\s+\S+[^\r\n]*(?P<eol>[\r\n]|\Z)')
 IO_RE = re.compile(r'(Output|Input)\s+(\d+),\s*([A-Za-z0-9_\-]+)\s+turned\s+(On|Off)', re.IGNORECASE)
 STATE_RE = re.compile(r'Update Cnc State to\s+(\w+)', re.IGNORECASE)
 CUT_MODE_RE = re.compile(r'Update Cut Mode to\s+(\w+)', re.IGNORECASE)
+ISO_DATE_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})T')
 STATUS_TOPIC_RE = re.compile(r'^(?P<topic_root>.+)/Status$')
+PLAIN_PAYLOAD_TOPIC_RE = re.compile(r'/(?:Uptime|Status)$')
+TIMESTAMP_DATE_RE = re.compile(r'"Timestamp"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+SEARCH_TOKEN_RE = re.compile(r'\w+')
+SEARCH_TERM_RE = re.compile(r'"(?P<phrase>[^"]*)"?|(?P<word>[^\s"]+)')
+LEVEL_RANKS = {
+    'verbose': 0,
+    'trace': 0,
+    'debug': 1,
+    'information': 2,
+    'info': 2,
+    'warning': 3,
+    'warn': 3,
+    'error': 4,
+    'fatal': 5,
+    'critical': 5,
+}
+SERILOG_FIELDS = ('Message', 'MessageTemplate', 'Level', 'Timestamp', 'SourceContext')
+SERILOG_COLON_RE = re.compile(r'\s*:\s*')
+SERILOG_TOKEN_RE = re.compile(r'"(?P<text>[^"\\]*(?:\\.[^"\\]*)*)"(?P<key>\s*:)?|[{}\[\]]')
+# Contêineres acima de cada chave lida: '' é o objeto raiz.
+SERILOG_KEY_PATHS = {'Message': ('',), 'MessageTemplate': ('',), 'Level': ('',), 'Timestamp': ('',), 'SourceContext': ('', 'Properties')}
+SERILOG_NESTED_FIELDS = {
+    'MessageTemplate': re.compile(r'\{\s*"Text"\s*:\s*'),
+    'SourceContext': re.compile(r'\{\s*"Value"\s*:\s*'),
+}
 VERSION_PATTERNS = [
     re.compile(r'(?P<label>Phoenix version):\s*(?P<value>.+)', re.IGNORECASE),
     re.compile(r'(?P<label>Application version):\s*(?P<value>.+)', re.IGNORECASE),
@@ -80,6 +148,23 @@ CATEGORY_RULES: list[tuple[str, list[re.Pattern[str]]]] = [
     ('Broker / conectividade', [re.compile(r'connected to|mqtt client|status online|status offline', re.IGNORECASE)]),
     ('Inventário / versão', [re.compile(r'\bversion\b|build branch|working directory|operating system', re.IGNORECASE)]),
 ]
+# Palavras-chave (minúsculas) presentes em todo match de cada grupo de regras acima. Servem só
+# de pré-filtro para o RecordClassifier: sem nenhuma delas na mensagem, o grupo nem é testado.
+# Ao mudar um padrão, a palavra-chave correspondente precisa continuar contida em qualquer match.
+CATEGORY_KEYWORDS = [
+    ('collision',),
+    ('stop',),
+    ('xpr', 'cutchart', 'process'),
+    ('error', 'fieldbus', 'ethercat', 'fault', 'wrongwc'),
+    ('homing', 'manualmotion', 'programmedmotion', 'returningtostart'),
+    ('connected', 'mqtt', 'status'),
+    ('version', 'build', 'working', 'operating'),
+]
+ERROR_KEYWORDS = ('error', 'fault', 'alarm', 'collision', 'stop')
+IGNORE_ERROR_KEYWORDS = ('switch', 'fault', 'error')
+VERSION_KEYWORDS = ('version', 'build')
+IO_KEYWORDS = ('turned',)
+STATE_KEYWORDS = ('update',)
 APP_STYLESHEET = """
 QWidget {
     background: #07111f;
@@ -140,7 +225,7 @@ QTabBar::tab:selected {
     background: rgba(37, 99, 235, 0.26);
     border-color: rgba(96, 165, 250, 0.28);
 }
-QTableWidget {
+QTableView {
     background: transparent;
     alternate-background-color: rgba(15, 23, 42, 0.48);
     gridline-color: rgba(148, 163, 184, 0.10);
@@ -155,13 +240,19 @@ QHeaderView::section {
     border-bottom: 1px solid rgba(148, 163, 184, 0.12);
     font-weight: 700;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 8px;
     border-bottom: 1px solid rgba(148, 163, 184, 0.08);
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background: rgba(37, 99, 235, 0.35);
 }
+QLineEdit {
+    background: rgba(2, 6, 23, 0.88);
+    border: 1px solid rgba(148, 163, 184, 0.12);
+    border-radius: 10px;
+    padding: 6px 10px;
+}
 QPlainTextEdit {
     background: rgba(2, 6, 23, 0.88);
     border: 1px solid rgba(148, 163, 184, 0.12);
@@ -171,6 +262,12 @@ QPlainTextEdit {
 }
 QScrollArea { border: none; }
 """
+ROLLUP_BUCKETS = {
+    'minuto': (timedelta(minutes=1), dt_time(0)),
+    'hora': (timedelta(hours=1), dt_time(0)),
+    'turno': (timedelta(hours=8), dt_time(6)),
+}
+CRITICAL_CATEGORIES = ('Colisão', 'Parada de segurança')
 PRIORITY_COLORS = {
     'Crítica': '#ef4444',
     'Alta': '#f97316',
@@ -180,15 +277,76 @@ PRIORITY_COLORS = {
 CATEGORY_COLORS = ['#38bdf8', '#22c55e', '#f97316', '#a855f7', '#ef4444', '#facc15', '#14b8a6', '#f472b6']
 
 
-@dataclass
+_PENDING: Any = object()
+
+
 class LogRecord:
-    sequence: int
-    timestamp: datetime
-    topic: str
-    payload: str
-    message: str
-    level: str | None
-    raw_data: dict[str, Any] | None = None
+    __slots__ = ('sequence', 'timestamp', 'topic', 'message', 'level', 'source_context', 'category', 'offset', 'length', '_payload', '_raw_data', '_source')
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: datetime,
+        topic: str,
+        payload: str | None,
+        message: str,
+        level: str | None,
+        raw_data: dict[str, Any] | None = None,
+        source_context: str | None = None,
+        offset: int = -1,
+        length: int = 0,
+        source: 'MappedLogFile | None' = None,
+    ):
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.topic = topic
+        self.message = message
+        self.level = level
+        if source_context is None and isinstance(raw_data, dict):
+            source_context = extract_source_context(raw_data)
+        self.source_context = source_context
+        self.category: str | None = None
+        self.offset = offset
+        self.length = length
+        self._payload = payload
+        self._raw_data = raw_data
+        self._source = source
+
+    @property
+    def payload(self) -> str:
+        if self._payload is not None or self._source is None:
+            return self._payload or ''
+        split = split_record_block(self.raw_text or '')
+        return split[2] if split else ''
+
+    @property
+    def raw_data(self) -> dict[str, Any] | None:
+        if self._source is not None:
+            return decode_json_payload(self.payload)
+        if self._raw_data is _PENDING:
+            self._raw_data = decode_json_payload(self.payload)
+        return self._raw_data
+
+    @property
+    def raw_text(self) -> str | None:
+        if self._source is None or self.offset < 0:
+            return None
+        return self._source.read(self.offset, self.length)
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        pending = self._raw_data is _PENDING
+        raw_data = None if pending else self._raw_data
+        return (self.sequence, self.timestamp, self.topic, self.message, self.level, self.source_context,
+                self.category, self.offset, self.length, self._payload, raw_data, pending)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        (self.sequence, self.timestamp, self.topic, self.message, self.level, self.source_context,
+         self.category, self.offset, self.length, self._payload, raw_data, pending) = state
+        self._raw_data = _PENDING if pending else raw_data
+        self._source = None
+
+    def __repr__(self) -> str:
+        return f'LogRecord(sequence={self.sequence}, timestamp={self.timestamp!r}, topic={self.topic!r}, message={self.message!r}, level={self.level!r})'
 
 
 @dataclass
@@ -214,6 +372,8 @@ class ProgramSession:
     states: list[str] = field(default_factory=list)
     cut_mode: str | None = None
     events: list[LogRecord] = field(default_factory=list)
+    first_row: int = 0
+    last_row: int | None = None
 
     @property
     def duration(self) -> timedelta:
@@ -266,6 +426,500 @@ class VersionEntry:
     timestamp: datetime
 
 
+@dataclass(slots=True, frozen=True)
+class RecordClassification:
+    category: str
+    is_error: bool
+    is_warning: bool
+    versions: tuple[tuple[str, str], ...] = ()
+    service_status: tuple[str, str] | None = None
+    cut_mode: str | None = None
+    state: str | None = None
+    io_signal: tuple[str, str, str, bool] | None = None
+
+
+@dataclass
+class RecordFilter:
+    topics: tuple[str, ...] = ()
+    min_level: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    source_contexts: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        if self.min_level and self.min_level.lower() not in LEVEL_RANKS:
+            raise ValueError(f'Nível desconhecido: {self.min_level}')
+        self._min_rank = LEVEL_RANKS[self.min_level.lower()] if self.min_level else None
+        self._topic_re = self._compile_globs(self.topics)
+        self._source_context_re = self._compile_globs(self.source_contexts)
+        self._topic_cache: dict[str, bool] = {}
+
+    @staticmethod
+    def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+        if not patterns:
+            return None
+        return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+    @property
+    def has_window(self) -> bool:
+        return self.start is not None or self.end is not None
+
+    def accepts_topic(self, topic: str) -> bool:
+        if self._topic_re is None:
+            return True
+        accepted = self._topic_cache.get(topic)
+        if accepted is None:
+            accepted = self._topic_cache[topic] = self._topic_re.match(topic) is not None
+        return accepted
+
+    def accepts_time(self, timestamp: datetime, margin: timedelta = timedelta(0)) -> bool:
+        """Janela [start, end); ``margin`` alarga a janela para checagens com data ainda provisória."""
+        if self.start is not None and timestamp < self.start - margin:
+            return False
+        return self.end is None or timestamp < self.end + margin
+
+    def accepts_fields(self, level: str | None, source_context: str | None) -> bool:
+        if self._min_rank is not None and LEVEL_RANKS.get((level or '').lower(), -1) < self._min_rank:
+            return False
+        if self._source_context_re is not None and not (source_context and self._source_context_re.match(source_context)):
+            return False
+        return True
+
+    def describe(self) -> dict[str, Any]:
+        description: dict[str, Any] = {}
+        if self.topics:
+            description['topicos'] = list(self.topics)
+        if self.min_level:
+            description['nivel_minimo'] = self.min_level
+        if self.start:
+            description['inicio'] = self.start.isoformat(sep=' ')
+        if self.end:
+            description['fim'] = self.end.isoformat(sep=' ')
+        if self.source_contexts:
+            description['source_context'] = list(self.source_contexts)
+        return description
+
+
+def search_tokens(text: str | None) -> list[str]:
+    return SEARCH_TOKEN_RE.findall(text.casefold()) if text else []
+
+
+def parse_search_query(query: str) -> list[tuple[tuple[str, ...], bool]]:
+    terms = []
+    for match in SEARCH_TERM_RE.finditer(query):
+        tokens = tuple(search_tokens(match.group('phrase') if match.group('word') is None else match.group('word')))
+        if tokens:
+            terms.append((tokens, match.group('word') is not None))
+    return terms
+
+
+def header_date(payload: str) -> date | None:
+    match = TIMESTAMP_DATE_RE.search(payload) or ISO_DATE_RE.search(payload)
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+ERROR_FLAG = 1
+WARNING_FLAG = 2
+
+
+class StringTable:
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values: list[str | None] = []
+        self.codes: dict[str | None, int] = {}
+
+    def code(self, value: str | None) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __getstate__(self) -> list[str | None]:
+        return self.values
+
+    def __setstate__(self, values: list[str | None]) -> None:
+        self.values = values
+        self.codes = {value: code for code, value in enumerate(values)}
+
+
+class TextIndex:
+    def __init__(self):
+        self.postings: dict[str, dict[str, array.array]] = {}
+        self.indexed: dict[str, int] = {}
+        self._vocabulary: dict[str, list[str]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'postings': self.postings, 'indexed': self.indexed}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state, _vocabulary={})
+
+    def update(self, name: str, table: StringTable) -> None:
+        postings = self.postings.setdefault(name, {})
+        start = self.indexed.get(name, 0)
+        values = table.values
+        end = len(values)
+        for code in range(start, end):
+            for token in set(search_tokens(values[code])):
+                codes = postings.get(token)
+                if codes is None:
+                    codes = postings[token] = array.array('I')
+                    self._vocabulary.pop(name, None)
+                codes.append(code)
+        self.indexed[name] = end
+
+    def lookup(self, name: str, table: StringTable, tokens: tuple[str, ...], prefix: bool) -> set[int]:
+        postings = self.postings.get(name, {})
+        codes: set[int] | None = None
+        for position, token in enumerate(tokens):
+            if prefix and position == len(tokens) - 1:
+                found: set[int] = set()
+                for word in self._prefixed(name, token):
+                    found.update(postings[word])
+            else:
+                found = set(postings.get(token, ()))
+            codes = found if codes is None else codes & found
+            if not codes:
+                return set()
+        if len(tokens) > 1:
+            phrase = ' ' + ' '.join(tokens) + ('' if prefix else ' ')
+            codes = {code for code in codes if phrase in ' ' + ' '.join(search_tokens(table.values[code])) + ' '}
+        return codes
+
+    def _prefixed(self, name: str, prefix: str) -> list[str]:
+        vocabulary = self._vocabulary.get(name)
+        if vocabulary is None:
+            vocabulary = self._vocabulary[name] = sorted(self.postings.get(name, ()))
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        return vocabulary[start:end]
+
+
+class RecordColumns:
+    """Registros em colunas: arrays tipados e códigos inteiros no lugar de objetos por registro.
+
+    Cópias de snapshot() compartilham os arrays e só enxergam as linhas que existiam no
+    momento do retrato. A sequência é o número do registro no log, que difere da posição na
+    coluna quando um RecordFilter descarta registros.
+    """
+
+    _column_names = ('timestamps', 'topics', 'levels', 'source_contexts', 'categories', 'messages', 'flags', 'sequences', 'offsets', 'lengths')
+    _tables = {'topics': 'topic_table', 'levels': 'level_table', 'source_contexts': 'source_context_table', 'categories': 'category_table'}
+    _searchable = {'messages': 'message_table', 'topics': 'topic_table', 'categories': 'category_table'}
+
+    def __init__(self, source_path: str | Path = ''):
+        self.source_path = Path(source_path)
+        self.timestamps = array.array('q')
+        self.topics = array.array('I')
+        self.levels = array.array('I')
+        self.source_contexts = array.array('I')
+        self.categories = array.array('I')
+        self.messages = array.array('I')
+        self.flags = array.array('B')
+        self.sequences = array.array('I')
+        self.offsets = array.array('q')
+        self.lengths = array.array('I')
+        self.topic_table = StringTable()
+        self.level_table = StringTable()
+        self.source_context_table = StringTable()
+        self.category_table = StringTable()
+        self.message_table = StringTable()
+        self.text_index = TextIndex()
+        self._size: int | None = None
+        self._time_index: tuple[int, Any, Any] | None = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps) if self._size is None else self._size
+
+    def append(self, record: LogRecord, traits: RecordClassification) -> None:
+        self.timestamps.append((record.timestamp - EPOCH) // ONE_MICROSECOND)
+        self.topics.append(self.topic_table.code(record.topic))
+        self.levels.append(self.level_table.code(record.level))
+        self.source_contexts.append(self.source_context_table.code(record.source_context))
+        self.categories.append(self.category_table.code(traits.category))
+        self.messages.append(self.message_table.code(record.message))
+        self.flags.append((ERROR_FLAG if traits.is_error else 0) | (WARNING_FLAG if traits.is_warning else 0))
+        self.sequences.append(record.sequence)
+        self.offsets.append(record.offset)
+        self.lengths.append(record.length)
+
+    def snapshot(self) -> 'RecordColumns':
+        frozen = object.__new__(RecordColumns)
+        frozen.__dict__.update(self.__dict__)
+        frozen._size = len(self)
+        return frozen
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        size = len(self)
+        for name in self._column_names:
+            state[name] = state[name][:size]
+        state['_size'] = None
+        state['_time_index'] = None
+        return state
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).itemsize * len(self) for name in self._column_names)
+
+    def timestamp(self, index: int) -> datetime:
+        return EPOCH + timedelta(microseconds=self.timestamps[index])
+
+    def topic(self, index: int) -> str:
+        return self.topic_table.values[self.topics[index]]
+
+    def level(self, index: int) -> str | None:
+        return self.level_table.values[self.levels[index]]
+
+    def message(self, index: int) -> str:
+        return self.message_table.values[self.messages[index]]
+
+    def category(self, index: int) -> str:
+        return self.category_table.values[self.categories[index]]
+
+    def source_context(self, index: int) -> str | None:
+        return self.source_context_table.values[self.source_contexts[index]]
+
+    def column(self, name: str) -> 'array.array | np.ndarray':
+        values = getattr(self, name)[:len(self)]
+        return np.frombuffer(values, dtype=values.typecode) if HAS_NUMPY else values
+
+    def select(
+        self,
+        topics: Iterable[str] | None = None,
+        levels: Iterable[str | None] | None = None,
+        categories: Iterable[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        errors_only: bool = False,
+    ) -> list[int]:
+        checks: list[tuple[str, set[int]]] = []
+        for name, table, values in (
+            ('topics', self.topic_table, topics),
+            ('levels', self.level_table, levels),
+            ('categories', self.category_table, categories),
+        ):
+            if values is not None:
+                checks.append((name, {table.codes[value] for value in values if value in table.codes}))
+        return self._scan(checks, [], start, end, errors_only)
+
+    def search(
+        self,
+        query: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        errors_only: bool = False,
+    ) -> list[int]:
+        index = self.update_text_index()
+        terms: list[list[tuple[str, set[int]]]] = []
+        for tokens, prefix in parse_search_query(query):
+            alternatives = [
+                (name, codes)
+                for name, table_name in self._searchable.items()
+                if (codes := index.lookup(name, getattr(self, table_name), tokens, prefix))
+            ]
+            if not alternatives:
+                return []
+            terms.append(alternatives)
+        return self._scan([], terms, start, end, errors_only)
+
+    def update_text_index(self) -> TextIndex:
+        for name, table_name in self._searchable.items():
+            self.text_index.update(name, getattr(self, table_name))
+        return self.text_index
+
+    def _scan(
+        self,
+        checks: list[tuple[str, set[int]]],
+        alternatives: list[list[tuple[str, set[int]]]],
+        start: datetime | None,
+        end: datetime | None,
+        errors_only: bool,
+    ) -> list[int]:
+        low = (start - EPOCH) // ONE_MICROSECOND if start else None
+        high = (end - EPOCH) // ONE_MICROSECOND if end else None
+        if HAS_NUMPY:
+            mask = np.ones(len(self), dtype=bool)
+            for name, codes in checks:
+                mask &= np.isin(self.column(name), list(codes))
+            for group in alternatives:
+                group_mask = np.zeros(len(self), dtype=bool)
+                for name, codes in group:
+                    group_mask |= np.isin(self.column(name), list(codes))
+                mask &= group_mask
+            timestamps = self.column('timestamps')
+            if low is not None:
+                mask &= timestamps >= low
+            if high is not None:
+                mask &= timestamps < high
+            if errors_only:
+                mask &= (self.column('flags') & ERROR_FLAG) != 0
+            return np.flatnonzero(mask).tolist()
+        columns = [(getattr(self, name), codes) for name, codes in checks]
+        groups = [[(getattr(self, name), codes) for name, codes in group] for group in alternatives]
+        timestamps = self.timestamps
+        flags = self.flags
+        selected = []
+        for index in range(len(self)):
+            if low is not None and timestamps[index] < low or high is not None and timestamps[index] >= high:
+                continue
+            if errors_only and not flags[index] & ERROR_FLAG:
+                continue
+            if not all(any(column[index] in codes for column, codes in group) for group in groups):
+                continue
+            if all(column[index] in codes for column, codes in columns):
+                selected.append(index)
+        return selected
+
+    def counts(self, name: str, indices: Iterable[int] | None = None) -> Counter[str]:
+        table = getattr(self, self._tables[name])
+        codes = getattr(self, name)
+        if HAS_NUMPY:
+            column = self.column(name)
+            if isinstance(indices, range) and indices.step == 1:
+                column = column[indices.start:indices.stop]
+            elif indices is not None:
+                column = column[np.asarray(list(indices), dtype=np.int64)]
+            tally = np.bincount(column, minlength=len(table.values)) if len(column) else []
+            return Counter({table.values[code]: int(count) for code, count in enumerate(tally) if count and table.values[code] is not None})
+        selected = range(len(self)) if indices is None else indices
+        tally = Counter(codes[index] for index in selected)
+        return Counter({table.values[code]: count for code, count in tally.items() if table.values[code] is not None})
+
+    @property
+    def is_monotonic(self) -> bool:
+        return self._sorted_times()[1] is None
+
+    def rows_between(self, start: datetime | None = None, end: datetime | None = None) -> Sequence[int]:
+        times, order = self._sorted_times()
+        bounds = [(value - EPOCH) // ONE_MICROSECOND if value else None for value in (start, end)]
+        if HAS_NUMPY:
+            low, high = (int(np.searchsorted(times, bound)) if bound is not None else default for bound, default in zip(bounds, (0, len(times))))
+        else:
+            low, high = (bisect.bisect_left(times, bound) if bound is not None else default for bound, default in zip(bounds, (0, len(times))))
+        if high <= low:
+            return range(0)
+        if order is None:
+            return range(low, high)
+        return sorted(order[low:high].tolist() if HAS_NUMPY else order[low:high])
+
+    def time_bounds(self) -> tuple[datetime, datetime] | None:
+        times, _ = self._sorted_times()
+        if not len(times):
+            return None
+        return EPOCH + timedelta(microseconds=int(times[0])), EPOCH + timedelta(microseconds=int(times[-1]))
+
+    def _sorted_times(self) -> tuple[Any, Any]:
+        size = len(self)
+        if self._time_index is None or self._time_index[0] != size:
+            times = self.column('timestamps')
+            if HAS_NUMPY:
+                monotonic = bool((times[1:] >= times[:-1]).all())
+            else:
+                monotonic = all(times[index] <= times[index + 1] for index in range(size - 1))
+            if monotonic:
+                order = None
+            elif HAS_NUMPY:
+                order = np.argsort(times, kind='stable')
+                times = times[order]
+            else:
+                order = sorted(range(size), key=times.__getitem__)
+                times = array.array('q', (times[index] for index in order))
+            self._time_index = (size, times, order)
+        return self._time_index[1], self._time_index[2]
+
+    def time_span(self) -> timedelta:
+        if not len(self):
+            return timedelta(0)
+        return timedelta(microseconds=self.timestamps[len(self) - 1] - self.timestamps[0])
+
+    def record(self, index: int, source: 'MappedLogFile | None' = None) -> LogRecord:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        offset, length = self.offsets[index], self.lengths[index]
+        topic = self.topic(index)
+        payload = None
+        if offset < 0:
+            payload = ''
+        elif source is None:
+            with self.source_path.open('rb') as handle:
+                handle.seek(offset)
+                parts = split_record_block(_decode_block(handle.read(length)))
+            payload = parts[2] if parts else ''
+        record = LogRecord(
+            sequence=self.sequences[index],
+            timestamp=self.timestamp(index),
+            topic=topic,
+            payload=payload,
+            message=self.message(index),
+            level=self.level(index),
+            raw_data=None if offset < 0 or PLAIN_PAYLOAD_TOPIC_RE.search(topic) else _PENDING,
+            source_context=self.source_context(index),
+            offset=offset,
+            length=length,
+            source=source,
+        )
+        record.category = self.category(index)
+        return record
+
+
+@dataclass
+class SearchHit:
+    index: int
+    sequence: int
+    timestamp: datetime
+    topic: str
+    level: str | None
+    category: str
+    message: str
+    session: int | None
+
+
+def compute_health_score(errors: int, warnings: int, critical_events: int, incomplete_programs: bool) -> int:
+    score = 100
+    score -= min(errors * 4, 36)
+    score -= min(warnings * 2, 10)
+    score -= min(critical_events * 5, 20)
+    if incomplete_programs:
+        score -= 8
+    return max(score, 12)
+
+
+@dataclass
+class RollupTotals:
+    start: datetime
+    end: datetime
+    records: int = 0
+    programs: int = 0
+    completed_programs: int = 0
+    program_seconds: float = 0.0
+    arc_seconds: float = 0.0
+    errors: int = 0
+    warnings: int = 0
+    critical_events: int = 0
+    errors_by_category: Counter[str] = field(default_factory=Counter)
+    state_seconds: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def arc_efficiency(self) -> float:
+        return self.arc_seconds / self.program_seconds if self.program_seconds > 0 else 0.0
+
+    @property
+    def health_score(self) -> int:
+        return compute_health_score(self.errors, self.warnings, self.critical_events, self.completed_programs < self.programs)
+
+
 @dataclass
 class InsightItem:
     title: str
@@ -274,163 +928,649 @@ class InsightItem:
     metric: str
 
 
+class _HistoryView(Sequence):
+    """Os itens que uma lista só de anexação tinha na criação; o que for anexado depois fica fora."""
+
+    __slots__ = ('_items', '_size')
+
+    def __init__(self, items: list[Any]):
+        self._items = items
+        self._size = len(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1:
+                return self._items[start:stop]
+            return [self._items[position] for position in range(start, stop, step)]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('índice fora do retrato')
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.islice(self._items, self._size)
+
+    def __add__(self, other: Iterable[Any]) -> list[Any]:
+        return [*self, *other]
+
+    def __radd__(self, other: Iterable[Any]) -> list[Any]:
+        return [*other, *self]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, _HistoryView)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return list, (list(self),)
+
+
 @dataclass
 class LogAnalysis:
     source_path: Path
-    records: list[LogRecord]
+    records: Sequence[LogRecord]
     sessions: list[ProgramSession]
-    unassigned_errors: list[LogRecord]
-    cut_mode_history: list[tuple[datetime, str]]
-    state_history: list[tuple[datetime, str]]
-    service_status_history: list[ServiceStatusEvent]
-    version_inventory: list[VersionEntry]
+    unassigned_errors: Sequence[LogRecord]
+    cut_mode_history: Sequence[tuple[datetime, str]]
+    state_history: Sequence[tuple[datetime, str]]
+    service_status_history: Sequence[ServiceStatusEvent]
+    version_inventory: Sequence[VersionEntry]
     source_context_counts: Counter[str]
     topic_counts: Counter[str]
     category_counts: Counter[str]
     state_duration_seconds: dict[str, float]
     recommendations: list[InsightItem]
+    record_count: int = 0
+    first_timestamp: datetime | None = None
+    last_timestamp: datetime | None = None
+    columns: RecordColumns | None = None
+    record_filter: RecordFilter | None = None
+    window_start: datetime | None = None
+    window_end: datetime | None = None
+    _rollups: dict[str, 'KpiRollup'] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     def total_programs(self) -> int:
         return len(self.sessions)
 
-    @property
+    @cached_property
     def completed_programs(self) -> int:
         return sum(1 for session in self.sessions if session.end)
 
-    @property
+    @cached_property
     def total_arc_openings(self) -> int:
         return sum(session.arc_openings for session in self.sessions)
 
-    @property
+    @cached_property
     def total_arc_time(self) -> timedelta:
         return sum((session.total_arc_time for session in self.sessions), timedelta(0))
 
-    @property
+    @cached_property
     def total_errors(self) -> int:
         return sum(len(session.errors) for session in self.sessions) + len(self.unassigned_errors)
 
-    @property
+    @cached_property
     def total_warnings(self) -> int:
         return sum(len(session.warnings) for session in self.sessions)
 
     @property
     def total_runtime(self) -> timedelta:
-        if not self.records:
+        if self.first_timestamp is None or self.last_timestamp is None:
             return timedelta(0)
-        return self.records[-1].timestamp - self.records[0].timestamp
+        return self.last_timestamp - self.first_timestamp
 
-    @property
+    @cached_property
     def average_session_duration(self) -> timedelta:
         if not self.sessions:
             return timedelta(0)
         total = sum((session.duration for session in self.sessions), timedelta(0))
         return total / len(self.sessions)
 
-    @property
+    @cached_property
     def arc_efficiency(self) -> float:
         programmed_time = sum((session.duration for session in self.sessions), timedelta(0)).total_seconds()
         if programmed_time <= 0:
             return 0.0
         return self.total_arc_time.total_seconds() / programmed_time
 
-    @property
+    @cached_property
     def health_score(self) -> int:
-        score = 100
-        score -= min(self.total_errors * 4, 36)
-        score -= min(self.total_warnings * 2, 10)
-        critical_events = self.category_counts.get('Colisão', 0) + self.category_counts.get('Parada de segurança', 0)
-        score -= min(critical_events * 5, 20)
-        if self.completed_programs < self.total_programs:
-            score -= 8
-        return max(score, 12)
+        critical_events = sum(self.category_counts.get(category, 0) for category in CRITICAL_CATEGORIES)
+        return compute_health_score(self.total_errors, self.total_warnings, critical_events, self.completed_programs < self.total_programs)
 
-    @property
+    @cached_property
     def service_status_summary(self) -> dict[str, str]:
         latest: dict[str, str] = {}
         for event in self.service_status_history:
             latest[event.service] = event.status
         return latest
 
+    @property
+    def is_window(self) -> bool:
+        return self.window_start is not None or self.window_end is not None
+
+    def rows(self) -> Sequence[int]:
+        if self.columns is None:
+            return range(0)
+        if not self.is_window:
+            return range(len(self.columns))
+        return self.columns.rows_between(self.window_start, self.window_end)
+
+    def window(self, start: datetime | None = None, end: datetime | None = None) -> 'LogAnalysis':
+        if self.columns is None:
+            raise ValueError('A análise não tem colunas de registros para recortar.')
+        if self.window_start and (start is None or start < self.window_start):
+            start = self.window_start
+        if self.window_end and (end is None or end > self.window_end):
+            end = self.window_end
+        columns = self.columns
+        ordered = columns.is_monotonic
+        rows = columns.rows_between(start, end)
+        if not rows:
+            first_timestamp = last_timestamp = None
+        elif ordered:
+            first_timestamp, last_timestamp = columns.timestamp(rows[0]), columns.timestamp(rows[-1])
+        else:
+            times = [columns.timestamps[row] for row in rows]
+            first_timestamp = EPOCH + timedelta(microseconds=min(times))
+            last_timestamp = EPOCH + timedelta(microseconds=max(times))
+
+        def clip(items: list[Any], key: Callable[[Any], datetime]) -> list[Any]:
+            return _slice_by_time(items, start, end, key, ordered)
+
+        if ordered:
+            low = bisect.bisect_left(self.sessions, start, key=lambda session: session.end or datetime.max) if start else 0
+            high = bisect.bisect_left(self.sessions, end, key=lambda session: session.start) if end else len(self.sessions)
+            sessions = self.sessions[low:high]
+        else:
+            sessions = [
+                session for session in self.sessions
+                if (end is None or session.start < end) and (start is None or session.end is None or session.end >= start)
+            ]
+        state_history = clip(self.state_history, lambda item: item[0])
+        service_status_history = clip(self.service_status_history, lambda event: event.timestamp)
+        version_inventory = clip(self.version_inventory, lambda entry: entry.timestamp)
+        unassigned_errors = clip(self.unassigned_errors, lambda record: record.timestamp)
+        category_counts = columns.counts('categories', rows)
+        source_context_counts = columns.counts('source_contexts', rows)
+        return replace(
+            self,
+            records=clip(self.records, lambda record: record.timestamp),
+            sessions=sessions,
+            unassigned_errors=unassigned_errors,
+            cut_mode_history=clip(self.cut_mode_history, lambda item: item[0]),
+            state_history=state_history,
+            service_status_history=service_status_history,
+            version_inventory=version_inventory,
+            source_context_counts=source_context_counts,
+            topic_counts=columns.counts('topics', rows),
+            category_counts=category_counts,
+            state_duration_seconds=_window_state_durations(self.state_history, state_history, first_timestamp, last_timestamp, ordered),
+            recommendations=MonitorAnalyzer._build_recommendations(
+                sessions=sessions,
+                service_status_history=service_status_history,
+                version_inventory=version_inventory,
+                category_counts=category_counts,
+                source_context_counts=source_context_counts,
+                unassigned_errors=unassigned_errors,
+            ),
+            record_count=len(rows),
+            first_timestamp=first_timestamp,
+            last_timestamp=last_timestamp,
+            window_start=start,
+            window_end=end,
+        )
+
+    def rollup(self, bucket: str = 'hora') -> 'KpiRollup':
+        rollup = self._rollups.get(bucket)
+        if rollup is None:
+            width, origin = ROLLUP_BUCKETS[bucket]
+            rollup = self._rollups[bucket] = KpiRollup(self, width, origin)
+        return rollup
 
-class LogParser:
+    def session_of(self, index: int) -> ProgramSession | None:
+        position = bisect.bisect_right(self.sessions, index, key=lambda session: session.first_row)
+        if not position:
+            return None
+        session = self.sessions[position - 1]
+        return session if session.last_row is None or index <= session.last_row else None
+
+    def search(
+        self,
+        query: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        errors_only: bool = False,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        if self.columns is None:
+            return []
+        columns = self.columns
+        if self.window_start and (start is None or start < self.window_start):
+            start = self.window_start
+        if self.window_end and (end is None or end > self.window_end):
+            end = self.window_end
+        hits = []
+        for index in columns.search(query, start, end, errors_only)[:limit]:
+            session = self.session_of(index)
+            hits.append(SearchHit(
+                index=index,
+                sequence=columns.sequences[index],
+                timestamp=columns.timestamp(index),
+                topic=columns.topic(index),
+                level=columns.level(index),
+                category=columns.category(index),
+                message=columns.message(index),
+                session=session.index if session else None,
+            ))
+        return hits
+
+
+def _slice_by_time(
+    items: list[Any],
+    start: datetime | None,
+    end: datetime | None,
+    key: Callable[[Any], datetime],
+    ordered: bool,
+) -> list[Any]:
+    if ordered:
+        low = bisect.bisect_left(items, start, key=key) if start else 0
+        high = bisect.bisect_left(items, end, key=key) if end else len(items)
+        return items[low:high]
+    return [item for item in items if (start is None or key(item) >= start) and (end is None or key(item) < end)]
+
+
+def _window_state_durations(
+    history: list[tuple[datetime, str]],
+    window_history: list[tuple[datetime, str]],
+    first_timestamp: datetime | None,
+    last_timestamp: datetime | None,
+    ordered: bool,
+) -> dict[str, float]:
+    if first_timestamp is None or last_timestamp is None:
+        return {}
+    changes = list(window_history)
+    if ordered:
+        position = bisect.bisect_left(history, first_timestamp, key=lambda item: item[0])
+        if position and (not changes or changes[0][0] > first_timestamp):
+            changes.insert(0, (first_timestamp, history[position - 1][1]))
+    totals: defaultdict[str, float] = defaultdict(float)
+    for (timestamp, state), (next_timestamp, _) in zip(changes, changes[1:] + [(last_timestamp, '')]):
+        totals[state] += max((next_timestamp - timestamp).total_seconds(), 0.0)
+    return dict(totals)
+
+
+class KpiRollup:
+    metrics = ('records', 'programs', 'completed_programs', 'program_seconds', 'arc_seconds', 'errors', 'warnings', 'critical_events')
+
+    def __init__(self, analysis: LogAnalysis, bucket: timedelta, origin: dt_time = dt_time(0)):
+        self.bucket = bucket
+        bounds = None
+        if analysis.columns is not None and analysis.record_count and not analysis.is_window:
+            bounds = analysis.columns.time_bounds()
+        first, last = bounds or (analysis.first_timestamp, analysis.last_timestamp)
+        if first is None or last is None:
+            first = last = datetime.combine(date.today(), origin)
+        anchor = datetime.combine(first.date(), origin)
+        if anchor > first:
+            anchor -= timedelta(days=1)
+        self.origin = anchor + (first - anchor) // bucket * bucket
+        self.size = (last - self.origin) // bucket + 1
+        values = {name: [0.0] * self.size for name in self.metrics}
+        categories: defaultdict[str, list[float]] = defaultdict(lambda: [0.0] * self.size)
+        states: defaultdict[str, list[float]] = defaultdict(lambda: [0.0] * self.size)
+
+        self._count_rows(analysis, values)
+        for session in analysis.sessions:
+            values['programs'][self._clamp(session.start)] += 1
+            if session.end:
+                values['completed_programs'][self._clamp(session.start)] += 1
+                self._spread(values['program_seconds'], session.start, session.end)
+            for arc in session.arc_events:
+                if arc.end:
+                    self._spread(values['arc_seconds'], arc.start, arc.end)
+            for record in session.warnings:
+                values['warnings'][self._clamp(record.timestamp)] += 1
+        errors = itertools.chain(itertools.chain.from_iterable(session.errors for session in analysis.sessions), analysis.unassigned_errors)
+        for record in errors:
+            position = self._clamp(record.timestamp)
+            values['errors'][position] += 1
+            categories[record.category or 'Outros'][position] += 1
+        history = analysis.state_history
+        if history and analysis.last_timestamp:
+            for (timestamp, state), (next_timestamp, _) in zip(history, history[1:] + [(analysis.last_timestamp, '')]):
+                self._spread(states[state], timestamp, next_timestamp)
+
+        self._prefix = {name: list(itertools.accumulate(series, initial=0.0)) for name, series in values.items()}
+        self._category_prefix = {name: list(itertools.accumulate(series, initial=0.0)) for name, series in categories.items()}
+        self._state_prefix = {name: list(itertools.accumulate(series, initial=0.0)) for name, series in states.items()}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def bucket_start(self, position: int) -> datetime:
+        return self.origin + position * self.bucket
+
+    def totals(self, start: datetime | None = None, end: datetime | None = None) -> RollupTotals:
+        low = 0 if start is None else min(max(-((self.origin - start) // self.bucket), 0), self.size)
+        high = self.size if end is None else min(max(-((self.origin - end) // self.bucket), low), self.size)
+        return self._between(low, high)
+
+    def series(self) -> list[RollupTotals]:
+        return [self._between(position, position + 1) for position in range(self.size)]
+
+    def _between(self, low: int, high: int) -> RollupTotals:
+        def delta(prefix: list[float]) -> float:
+            return prefix[high] - prefix[low]
+
+        totals: dict[str, Any] = {name: delta(self._prefix[name]) for name in self.metrics}
+        for name in ('records', 'programs', 'completed_programs', 'errors', 'warnings', 'critical_events'):
+            totals[name] = round(totals[name])
+        return RollupTotals(
+            start=self.bucket_start(low),
+            end=self.bucket_start(high),
+            errors_by_category=Counter({name: round(count) for name, prefix in self._category_prefix.items() if (count := delta(prefix))}),
+            state_seconds={name: seconds for name, prefix in self._state_prefix.items() if (seconds := delta(prefix)) > 0},
+            **totals,
+        )
+
+    def _clamp(self, timestamp: datetime) -> int:
+        return min(max((timestamp - self.origin) // self.bucket, 0), self.size - 1)
+
+    def _spread(self, series: list[float], start: datetime, end: datetime) -> None:
+        position = self._clamp(start)
+        while start < end and position < self.size:
+            bucket_end = self.bucket_start(position + 1)
+            series[position] += (min(end, bucket_end) - start).total_seconds()
+            start = bucket_end
+            position += 1
+
+    def _count_rows(self, analysis: LogAnalysis, values: dict[str, list[float]]) -> None:
+        columns = analysis.columns
+        if columns is None:
+            return
+        rows = analysis.rows()
+        width = self.bucket // ONE_MICROSECOND
+        origin = (self.origin - EPOCH) // ONE_MICROSECOND
+        critical = {columns.category_table.codes[name] for name in CRITICAL_CATEGORIES if name in columns.category_table.codes}
+        if HAS_NUMPY:
+            selector = slice(rows.start, rows.stop) if isinstance(rows, range) else np.asarray(rows, dtype=np.int64)
+            positions = np.clip((columns.column('timestamps')[selector] - origin) // width, 0, self.size - 1)
+            values['records'] = np.bincount(positions, minlength=self.size).astype(float).tolist()
+            if critical:
+                flagged = np.isin(columns.column('categories')[selector], list(critical))
+                values['critical_events'] = np.bincount(positions[flagged], minlength=self.size).astype(float).tolist()
+            return
+        timestamps, codes = columns.timestamps, columns.categories
+        records, critical_events = values['records'], values['critical_events']
+        for row in rows:
+            position = min(max((timestamps[row] - origin) // width, 0), self.size - 1)
+            records[position] += 1
+            if codes[row] in critical:
+                critical_events[position] += 1
+
+
+def split_record_block(block: str) -> tuple[str, str, str] | None:
+    block = block.strip()
+    line_match = RECORD_START_RE.match(block)
+    if not line_match:
+        return None
+    payload = block[line_match.end('topic'):].strip().replace('\ufeff', '').replace('\x00', '').strip()
+    return line_match.group('time'), line_match.group('topic'), payload
+
+
+def decode_json_payload(payload: str) -> dict[str, Any] | None:
+    cleaned = payload.strip()
+    if not cleaned.startswith('{'):
+        return None
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        return None
+
+
+def extract_source_context(raw_data: dict[str, Any] | None) -> str | None:
+    if not raw_data:
+        return None
+    properties = raw_data.get('Properties') or {}
+    source_context = properties.get('SourceContext')
+    if isinstance(source_context, dict):
+        value = source_context.get('Value')
+        if value:
+            return str(value)
+    return None
+
+
+def scan_serilog_fields(payload: str) -> tuple[str | None, str | None, str | None, str | None] | None:
+    if not payload.endswith('}'):
+        return None
+    positions: dict[str, int] = {}
+    stack: list[str] = []
+    pending = ''
+    for token in SERILOG_TOKEN_RE.finditer(payload):
+        name = token.group('text')
+        if name is None:
+            if token.group() in '{[':
+                stack.append(pending)
+                pending = ''
+            elif not stack:
+                return None
+            else:
+                stack.pop()
+            continue
+        if token.group('key') is None:
+            continue
+        pending = name
+        if SERILOG_KEY_PATHS.get(name) == tuple(stack):
+            if name in positions:
+                return None
+            positions[name] = token.start('key')
+    if stack:
+        return None
+    values: dict[str, str | None] = dict.fromkeys(SERILOG_FIELDS)
+    try:
+        for key, position in positions.items():
+            value_start = SERILOG_COLON_RE.match(payload, position).end()
+            if key in SERILOG_NESTED_FIELDS:
+                if payload.startswith('{', value_start):
+                    nested = SERILOG_NESTED_FIELDS[key].match(payload, value_start)
+                    if not nested:
+                        return None
+                    value_start = nested.end()
+                elif key == 'SourceContext':
+                    continue
+            if not payload.startswith('"', value_start):
+                return None
+            values[key] = scanstring(payload, value_start + 1)[0]
+    except (AttributeError, ValueError):
+        return None
+    message = values['Message'] or values['MessageTemplate']
+    return message, values['Level'], values['Timestamp'], values['SourceContext'] or None
+
+
+class MappedLogFile:
     def __init__(self, path: str | Path):
         self.path = Path(path)
+        with self.path.open('rb') as handle:
+            size = handle.seek(0, 2)
+            self.data: mmap.mmap | bytes = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
 
-    def parse(self) -> list[LogRecord]:
-        raw_text = self.path.read_text(encoding='utf-8', errors='ignore')
-        matches = list(RECORD_START_RE.finditer(raw_text))
-        if not matches:
-            raise ValueError('Nenhum registro reconhecido no arquivo informado.')
+    def read_bytes(self, offset: int, length: int) -> bytes:
+        return self.data[offset:offset + length]
 
-        records: list[LogRecord] = []
-        current_date: date | None = self._extract_first_date(raw_text)
-        previous_dt: datetime | None = None
+    def read(self, offset: int, length: int) -> str:
+        return _decode_block(self.read_bytes(offset, length))
 
-        for index, match in enumerate(matches):
-            start = match.start()
-            end = matches[index + 1].start() if index + 1 < len(matches) else len(raw_text)
-            block = raw_text[start:end].strip()
-            line_match = RECORD_START_RE.match(block)
-            if not line_match:
-                continue
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
 
-            time_text = line_match.group('time')
-            topic = line_match.group('topic')
-            payload = block[line_match.end('topic'):].strip().replace('\ufeff', '').replace('\x00', '').strip()
-            message, level, raw_data = self._extract_message(payload)
-
-            explicit_date = self._extract_date(raw_data, payload)
-            if explicit_date:
-                current_date = explicit_date
-            elif current_date is None:
-                current_date = date.today()
-
-            timestamp = datetime.combine(current_date, datetime.strptime(time_text, '%H:%M:%S').time())
-            if previous_dt and timestamp < previous_dt:
-                current_date = current_date + timedelta(days=1)
-                timestamp = datetime.combine(current_date, timestamp.time())
-
-            previous_dt = timestamp
-            records.append(
-                LogRecord(
-                    sequence=len(records) + 1,
-                    timestamp=timestamp,
-                    topic=topic,
-                    payload=payload,
-                    message=message,
-                    level=level,
-                    raw_data=raw_data,
-                )
-            )
 
+class LogParser:
+    chunk_size = 1 << 20
+    shard_bytes = 8 << 20
+    scan_threshold = 1024
+
+    def __init__(
+        self,
+        path: str | Path,
+        chunk_size: int | None = None,
+        mapped: bool = False,
+        lazy_json: bool = False,
+        record_filter: RecordFilter | None = None,
+    ):
+        self.path = Path(path)
+        if chunk_size:
+            self.chunk_size = chunk_size
+        self.mapped = mapped
+        self.lazy_json = lazy_json
+        self.record_filter = record_filter
+
+    def parse(self) -> list[LogRecord]:
+        records = list(self.iter_records())
+        if not records:
+            raise ValueError('Nenhum registro reconhecido no arquivo informado.')
         return records
 
-    def _extract_first_date(self, text: str) -> date | None:
-        match = re.search(r'\b(\d{4}-\d{2}-\d{2})T', text)
-        return datetime.strptime(match.group(1), '%Y-%m-%d').date() if match else None
+    def iter_records(self) -> Iterator[LogRecord]:
+        builder = _RecordBuilder(self)
+        builder.current_date = self._scan_first_date()
+        if self.mapped:
+            builder.source = MappedLogFile(self.path)
+            blocks = self._iter_mapped_blocks(builder.source.data)
+        else:
+            blocks = self._iter_blocks()
+        for offset, length, block in blocks:
+            if record := builder.build(block, offset, length):
+                yield record
+
+    def _iter_blocks(self, start: int = 0, final: bool = True, end: int | None = None) -> Iterator[tuple[int, int, str]]:
+        """Um início de registro só é aceito quando a linha inteira já está no buffer, então
+        payloads JSON multilinha podem atravessar a fronteira entre blocos lidos. Com
+        final=False o último bloco fica retido, pois ainda pode estar sendo escrito.
+        """
+        buffer = b''
+        buffer_offset = start
+        # Início da última linha do buffer: o que vem antes já foi varrido, então um registro
+        # maior que chunk_size não faz cada leitura nova repassar o prefixo inteiro.
+        scanned = 0
+        with self.path.open('rb') as handle:
+            handle.seek(start)
+            position = start
+            while True:
+                size = self.chunk_size if end is None else min(self.chunk_size, end - position)
+                chunk = handle.read(size) if size > 0 else b''
+                position += len(chunk)
+                previous = len(buffer)
+                buffer += chunk
+                cut = 0
+                for match in RECORD_START_BYTES_RE.finditer(buffer, scanned):
+                    if (chunk or not final) and not match.group('eol'):
+                        break
+                    if match.start() > cut:
+                        yield buffer_offset + cut, match.start() - cut, _decode_block(buffer[cut:match.start()])
+                    cut = match.start()
+                line_start = max(buffer.rfind(b'\n', previous), buffer.rfind(b'\r', previous)) + 1
+                scanned = max((line_start or scanned) - cut, 0)
+                buffer = buffer[cut:]
+                buffer_offset += cut
+                if not chunk:
+                    break
+        if buffer and final:
+            yield buffer_offset, len(buffer), _decode_block(buffer)
+
+    def _iter_mapped_blocks(self, data: mmap.mmap | bytes, start: int = 0) -> Iterator[tuple[int, int, str]]:
+        cut = start
+        for match in RECORD_START_BYTES_RE.finditer(data, start):
+            if match.start() > cut:
+                yield cut, match.start() - cut, _decode_block(data[cut:match.start()])
+            cut = match.start()
+        if len(data) > cut:
+            yield cut, len(data) - cut, _decode_block(data[cut:])
+
+    def plan_shards(self, count: int, start: int = 0) -> list[tuple[int, int]]:
+        size = self.path.stat().st_size
+        boundaries = [start]
+        with self.path.open('rb') as handle:
+            for index in range(1, count):
+                boundary = self._next_record_start(handle, start + (size - start) * index // count)
+                if boundary is not None and boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+        boundaries.append(size)
+        return list(zip(boundaries, boundaries[1:]))
+
+    def _next_record_start(self, handle: Any, offset: int) -> int | None:
+        """Primeiro início de registro confirmado a partir de ``offset``, que pode cair no meio de uma linha."""
+        if offset <= 0:
+            return 0
+        start = offset - 1
+        handle.seek(start)
+        data = b''
+        while True:
+            chunk = handle.read(self.chunk_size)
+            data += chunk
+            newline = min((index for index in (data.find(b'\n'), data.find(b'\r')) if index >= 0), default=-1)
+            if newline >= 0:
+                for match in RECORD_START_BYTES_RE.finditer(data, newline + 1):
+                    if match.group('eol') or not chunk:
+                        return start + match.start()
+                    break
+            if not chunk:
+                return None
+
+    def _scan_first_date(self) -> date | None:
+        # Varre o arquivo em blocos até a primeira data ISO; a sobreposição cobre datas
+        # cortadas entre dois blocos e o primeiro caractere dela serve só de contexto para o \b.
+        tail = ''
+        with self.path.open('r', encoding='utf-8', errors='ignore') as handle:
+            while chunk := handle.read(self.chunk_size):
+                match = ISO_DATE_RE.search(tail + chunk, 1 if tail else 0)
+                if match:
+                    return datetime.strptime(match.group(1), '%Y-%m-%d').date()
+                tail = (tail + chunk)[-16:]
+        return None
 
     def _extract_message(self, payload: str) -> tuple[str, str | None, dict[str, Any] | None]:
         cleaned = payload.strip()
-        if cleaned.startswith('{'):
-            try:
-                data = json.loads(cleaned)
-                message = data.get('Message')
-                if not message:
-                    template = data.get('MessageTemplate')
-                    if isinstance(template, dict):
-                        message = template.get('Text')
-                    elif isinstance(template, str):
-                        message = template
-                return str(message or cleaned), data.get('Level'), data
-            except json.JSONDecodeError:
-                pass
+        data = decode_json_payload(cleaned)
+        if data is not None:
+            message = data.get('Message')
+            if not message:
+                template = data.get('MessageTemplate')
+                if isinstance(template, dict):
+                    message = template.get('Text')
+                elif isinstance(template, str):
+                    message = template
+            return str(message or cleaned), data.get('Level'), data
         return cleaned, None, None
 
-    def _extract_date(self, raw_data: dict[str, Any] | None, payload: str) -> date | None:
-        timestamp_value = raw_data.get('Timestamp') if raw_data else None
+    def _extract_fields(self, topic: str, payload: str) -> tuple[str, str | None, Any, Any, str | None]:
+        cleaned = payload.strip()
+        if PLAIN_PAYLOAD_TOPIC_RE.search(topic) or not cleaned.startswith('{'):
+            return cleaned, None, None, None, None
+        # Abaixo de ~1 KB o json.loads em C ainda é mais rápido que a varredura seletiva;
+        # nesse caso o dicionário é descartado e só volta a ser montado se raw_data for lido.
+        if len(cleaned) >= self.scan_threshold and (fields := scan_serilog_fields(cleaned)):
+            message, level, timestamp_value, source_context = fields
+            return message or cleaned, level, _PENDING, timestamp_value, source_context
+        message, level, raw_data = self._extract_message(cleaned)
+        if raw_data is None:
+            return message, level, None, None, None
+        return message, level, _PENDING, raw_data.get('Timestamp'), extract_source_context(raw_data)
+
+    def _extract_date(self, timestamp_value: Any, payload: str) -> date | None:
         if not timestamp_value:
-            match = re.search(r'\b(\d{4}-\d{2}-\d{2})T', payload)
+            match = ISO_DATE_RE.search(payload)
             if match:
                 timestamp_value = match.group(1)
         if not timestamp_value:
@@ -443,114 +1583,739 @@ class LogParser:
         return None
 
 
+def _decode_block(data: bytes) -> str:
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+class _RecordBuilder:
+    def __init__(self, parser: LogParser):
+        self.parser = parser
+        self.current_date: date | None = None
+        self.previous_dt: datetime | None = None
+        self.sequence = 0
+        self.source: MappedLogFile | None = None
+        self.mapped = parser.mapped
+
+    def build(self, block: str, offset: int = -1, length: int = 0) -> LogRecord | None:
+        decoded = self.decode(block, offset, length)
+        if not decoded:
+            return None
+        return self.resolve(*decoded)
+
+    def decode(self, block: str, offset: int = -1, length: int = 0) -> tuple[LogRecord | None, dt_time, date | None] | None:
+        split = split_record_block(block)
+        if not split:
+            return None
+
+        time_text, topic, payload = split
+        return self.decode_fields(datetime.strptime(time_text, '%H:%M:%S').time(), topic, payload, offset, length)
+
+    def decode_fields(
+        self,
+        time_of_day: dt_time,
+        topic: str,
+        payload: str,
+        offset: int = -1,
+        length: int = 0,
+    ) -> tuple[LogRecord | None, dt_time, date | None]:
+        record_filter = self.parser.record_filter
+        if record_filter:
+            if not record_filter.accepts_topic(topic):
+                return None, time_of_day, header_date(payload)
+            if record_filter.has_window and self.current_date is not None:
+                # A data do cabeçalho é provisória (a virada de dia só é resolvida em resolve()),
+                # por isso a janela ganha um dia de folga aqui e a checagem exata fica para depois.
+                explicit_date = header_date(payload)
+                if not record_filter.accepts_time(self._peek(time_of_day, explicit_date), margin=timedelta(days=1)):
+                    return None, time_of_day, explicit_date
+
+        if self.parser.lazy_json:
+            message, level, raw_data, timestamp_value, source_context = self.parser._extract_fields(topic, payload)
+        else:
+            message, level, raw_data = self.parser._extract_message(payload)
+            timestamp_value = raw_data.get('Timestamp') if raw_data else None
+            source_context = extract_source_context(raw_data)
+
+        explicit_date = self.parser._extract_date(timestamp_value, payload)
+        if record_filter and not record_filter.accepts_fields(level, source_context):
+            return None, time_of_day, explicit_date
+        record = LogRecord(
+            sequence=0,
+            timestamp=datetime.min,
+            topic=sys.intern(topic),
+            payload=None if self.mapped else payload,
+            message=message,
+            level=sys.intern(level) if isinstance(level, str) else level,
+            raw_data=None if self.mapped else raw_data,
+            source_context=source_context,
+            offset=offset,
+            length=length,
+            source=self.source,
+        )
+        return record, time_of_day, explicit_date
+
+    def resolve(self, record: LogRecord | None, time_of_day: dt_time, explicit_date: date | None) -> LogRecord | None:
+        """Registros descartados (``None``) ou fora da janela do filtro também avançam data e
+        sequência, para a virada de dia não se perder.
+        """
+        if explicit_date:
+            self.current_date = explicit_date
+        elif self.current_date is None:
+            self.current_date = date.today()
+
+        timestamp = datetime.combine(self.current_date, time_of_day)
+        if self.previous_dt and timestamp < self.previous_dt:
+            self.current_date = self.current_date + timedelta(days=1)
+            timestamp = datetime.combine(self.current_date, time_of_day)
+
+        self.previous_dt = timestamp
+        self.sequence += 1
+        if record is None:
+            return None
+        record_filter = self.parser.record_filter
+        if record_filter and record_filter.has_window and not record_filter.accepts_time(timestamp):
+            return None
+        record.sequence = self.sequence
+        record.timestamp = timestamp
+        return record
+
+    def _peek(self, time_of_day: dt_time, explicit_date: date | None) -> datetime:
+        current_date = explicit_date or self.current_date or date.today()
+        timestamp = datetime.combine(current_date, time_of_day)
+        if self.previous_dt and timestamp < self.previous_dt:
+            timestamp = datetime.combine(current_date + timedelta(days=1), time_of_day)
+        return timestamp
+
+
+class LogFollower:
+    """O último registro do arquivo só é entregue quando o próximo começa, porque o payload
+    ainda pode estar sendo escrito. Truncamento e rotação recomeçam do byte zero, mantendo
+    data e sequência correntes.
+    """
+
+    head_size = 64
+
+    def __init__(self, path: str | Path, lazy_json: bool = False, record_filter: RecordFilter | None = None):
+        self.parser = LogParser(path, lazy_json=lazy_json, record_filter=record_filter)
+        self.path = self.parser.path
+        self.offset = 0
+        self.rotations = 0
+        self._builder = _RecordBuilder(self.parser)
+        self._identity: tuple[int, int] | None = None
+        self._head = b''
+
+    def poll(self) -> list[LogRecord]:
+        return list(self.iter_new())
+
+    def iter_new(self) -> Iterator[LogRecord]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+        identity = (stat.st_dev, stat.st_ino)
+        head = self._read_head()
+        if self._identity is not None and (
+            identity != self._identity or stat.st_size < self.offset or head[:len(self._head)] != self._head
+        ):
+            self.offset = 0
+            self.rotations += 1
+        self._identity = identity
+        self._head = head
+        if self._builder.current_date is None:
+            self._builder.current_date = self.parser._scan_first_date()
+        if stat.st_size <= self.offset:
+            return
+
+        for offset, length, block in self.parser._iter_blocks(self.offset, final=False):
+            self.offset = offset + length
+            if record := self._builder.build(block, offset, length):
+                yield record
+
+    def _read_head(self) -> bytes:
+        with self.path.open('rb') as handle:
+            return handle.read(self.head_size)
+
+
+LIVE_FRAME_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class MqttSettings:
+    host: str
+    port: int = 1884
+    topic: str = 'Phoenix/#'
+    username: str | None = None
+    password: str | None = None
+
+    @classmethod
+    def parse(cls, address: str, **options: Any) -> 'MqttSettings':
+        host, _, port = address.strip().rpartition(':') if ':' in address else (address.strip(), '', '')
+        if not host:
+            raise ValueError('Informe o endereço do broker MQTT.')
+        if port:
+            try:
+                options['port'] = int(port)
+            except ValueError as exc:
+                raise ValueError(f'Porta MQTT inválida: {port!r}') from exc
+        return cls(host=host, **options)
+
+    @property
+    def label(self) -> str:
+        return f'{self.host}:{self.port}'
+
+
+class LiveIngest:
+    """receive() roda na thread do cliente MQTT e drain() na thread dona do analisador.
+
+    receive() decodifica com um _RecordBuilder próprio, que nunca passa por resolve() e por
+    isso não lê a data corrente que drain() está alterando.
+    """
+
+    max_pending = 200_000
+
+    def __init__(
+        self,
+        source_name: str,
+        lazy_json: bool = False,
+        record_filter: RecordFilter | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+        retain_records: bool = False,
+    ):
+        self.parser = LogParser(source_name, lazy_json=lazy_json, record_filter=record_filter)
+        self.analyzer = MonitorAnalyzer(source_path=source_name, retain_records=retain_records, record_filter=record_filter)
+        self.clock = clock
+        self.received = 0
+        self.dropped = 0
+        self.observer: Callable[[str, str | bytes], None] | None = None
+        self._builder = _RecordBuilder(self.parser)
+        self._decoder = _RecordBuilder(self.parser)
+        self._pending: deque[tuple[LogRecord | None, dt_time, date, RecordClassification | None]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def receive(self, topic: str, payload: bytes | str, received_at: datetime | None = None) -> None:
+        received_at = received_at or self.clock()
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8', errors='ignore')
+        payload = payload.strip().replace('\ufeff', '').replace('\x00', '').strip()
+        record, time_of_day, _ = self._decoder.decode_fields(received_at.time(), topic, payload)
+        traits = self.analyzer.classify(record) if record else None
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append((record, time_of_day, received_at.date(), traits))
+            self.received += 1
+
+    def drain(self) -> int:
+        with self._lock:
+            batch, self._pending = self._pending, deque()
+        fed = 0
+        observer = self.observer
+        for record, time_of_day, received_date, traits in batch:
+            if record := self._builder.resolve(record, time_of_day, received_date):
+                self.analyzer.feed(record, traits)
+                fed += 1
+                if observer:
+                    observer(record.topic, record.payload)
+        return fed
+
+
+class MqttLiveSource:
+    def __init__(self, settings: MqttSettings, ingest: LiveIngest, client_factory: Callable[[], Any] | None = None):
+        self.settings = settings
+        self.ingest = ingest
+        self.client_factory = client_factory or self._create_client
+        self.status = 'desconectado'
+        self.subscribed = threading.Event()
+        self.client: Any = None
+
+    @staticmethod
+    def _create_client() -> Any:
+        if not HAS_PAHO:
+            raise RuntimeError('A leitura ao vivo usa paho-mqtt. Instale com: python3 -m pip install paho-mqtt')
+        if hasattr(mqtt, 'CallbackAPIVersion'):
+            return mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        return mqtt.Client()
+
+    def start(self) -> None:
+        self.stop()
+        client = self.client = self.client_factory()
+        if self.settings.username:
+            client.username_pw_set(self.settings.username, self.settings.password)
+        client.on_connect = self._on_connect
+        client.on_disconnect = self._on_disconnect
+        client.on_connect_fail = self._on_connect_fail
+        client.on_subscribe = self._on_subscribe
+        client.on_message = self._on_message
+        self.status = 'conectando'
+        client.connect_async(self.settings.host, self.settings.port, 60)
+        client.loop_start()
+
+    def stop(self) -> None:
+        if self.client is None:
+            return
+        client, self.client = self.client, None
+        client.disconnect()
+        client.loop_stop()
+        self.status = 'desconectado'
+
+    def _on_connect(self, client: Any, _userdata: Any, _flags: Any, reason_code: Any, _properties: Any = None) -> None:
+        if reason_code != 0:
+            self.status = f'recusado pelo broker ({reason_code})'
+            return
+        client.subscribe(self.settings.topic)
+        self.status = 'conectado'
+
+    def _on_disconnect(self, *_args: Any) -> None:
+        if self.client is not None:
+            self.status = 'reconectando'
+
+    def _on_connect_fail(self, *_args: Any) -> None:
+        self.status = 'broker inacessível, tentando de novo'
+
+    def _on_subscribe(self, *_args: Any) -> None:
+        self.subscribed.set()
+
+    def _on_message(self, _client: Any, _userdata: Any, message: Any) -> None:
+        self.ingest.receive(message.topic, message.payload)
+
+
+class ReplayProbe:
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.sent = 0
+        self.seen = 0
+        self.latencies: list[float] = []
+        self.first_sent: float | None = None
+        self.last_seen: float | None = None
+        self._in_flight: defaultdict[tuple[str, bytes], deque[float]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    @property
+    def outstanding(self) -> int:
+        return self.sent - self.seen
+
+    def mark_sent(self, topic: str, payload: bytes) -> None:
+        now = self.clock()
+        with self._lock:
+            if self.first_sent is None:
+                self.first_sent = now
+            self._in_flight[topic, payload].append(now)
+            self.sent += 1
+
+    def mark_seen(self, topic: str, payload: str | bytes) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        now = self.clock()
+        with self._lock:
+            pending = self._in_flight.get((topic, payload))
+            if not pending:
+                return
+            self.latencies.append(now - pending.popleft())
+            if not pending:
+                del self._in_flight[topic, payload]
+            self.seen += 1
+            self.last_seen = now
+
+
+@dataclass
+class ReplayReport:
+    source: str
+    target: str
+    speed: float
+    sent: int
+    seen: int
+    elapsed: float
+    latencies: list[float] = field(default_factory=list, repr=False)
+    consumer_elapsed: float = 0.0
+
+    @property
+    def dropped(self) -> int:
+        return self.sent - self.seen
+
+    @property
+    def rate(self) -> float:
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def consumer_rate(self) -> float:
+        return self.seen / self.consumer_elapsed if self.consumer_elapsed > 0 else 0.0
+
+    def percentile(self, fraction: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def to_payload(self) -> dict[str, Any]:
+        def milliseconds(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            'arquivo': self.source,
+            'destino': self.target,
+            'velocidade': self.speed or 'sem pausas',
+            'enviadas': self.sent,
+            'recebidas': self.seen,
+            'perdidas': self.dropped,
+            'duracao_s': round(self.elapsed, 3),
+            'mensagens_por_segundo': {'publicadas': round(self.rate, 1), 'consumidas': round(self.consumer_rate, 1)},
+            'latencia_ms': {
+                'p50': milliseconds(self.percentile(0.50)),
+                'p95': milliseconds(self.percentile(0.95)),
+                'p99': milliseconds(self.percentile(0.99)),
+                'max': milliseconds(max(self.latencies, default=None)),
+            },
+        }
+
+
+class LogReplayer:
+    def __init__(self, path: str | Path, speed: float = 1.0, record_filter: RecordFilter | None = None):
+        self.path = Path(path)
+        self.speed = speed
+        self.record_filter = record_filter
+
+    def iter_messages(self) -> Iterator[tuple[float, str, bytes]]:
+        first: datetime | None = None
+        for record in LogParser(self.path, record_filter=self.record_filter).iter_records():
+            first = first or record.timestamp
+            yield (record.timestamp - first).total_seconds(), record.topic, record.payload.encode('utf-8')
+
+    def run(
+        self,
+        publish: Callable[[str, bytes], None],
+        probe: ReplayProbe | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        limit: int | None = None,
+    ) -> tuple[int, float]:
+        sent = 0
+        start = time.perf_counter()
+        for offset, topic, payload in itertools.islice(self.iter_messages(), limit):
+            if self.speed > 0:
+                delay = start + offset / self.speed - time.perf_counter()
+                if delay > 0:
+                    sleep(delay)
+            if probe:
+                probe.mark_sent(topic, payload)
+            publish(topic, payload)
+            sent += 1
+        return sent, time.perf_counter() - start
+
+
+class RecordClassifier:
+    cache_size = 1 << 16
+
+    def __init__(self, cache_size: int | None = None):
+        self.classify = lru_cache(maxsize=cache_size or self.cache_size)(self._classify)
+        groups: dict[str, set[Any]] = defaultdict(set)
+        for index, keywords in enumerate(CATEGORY_KEYWORDS):
+            for keyword in keywords:
+                groups[keyword].add(index)
+        for name, keywords in (
+            ('error', ERROR_KEYWORDS),
+            ('ignore', IGNORE_ERROR_KEYWORDS),
+            ('version', VERSION_KEYWORDS),
+            ('io', IO_KEYWORDS),
+            ('state', STATE_KEYWORDS),
+        ):
+            for keyword in keywords:
+                groups[keyword].add(name)
+        # Na alternação vence a palavra mais longa numa posição; ela herda os grupos das
+        # palavras que são prefixo dela, que também estão presentes ali.
+        keywords = sorted(groups, key=len, reverse=True)
+        self._keyword_groups = {
+            keyword: frozenset().union(*(groups[other] for other in keywords if keyword.startswith(other)))
+            for keyword in keywords
+        }
+        alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+        self._keyword_re = re.compile(alternation)
+        self._overlapping_keyword_re = re.compile(f'(?=({alternation}))')
+        self._all_groups = frozenset().union(*self._keyword_groups.values())
+        self._topic_categories: dict[str, frozenset[int]] = {}
+        self._topic_status_roots: dict[str, str | None] = {}
+
+    def cache_info(self) -> Any:
+        return self.classify.cache_info()
+
+    def _classify(self, message: str, topic: str, level: str | None) -> RecordClassification:
+        groups = self._groups(message)
+        is_error = self.is_error(message, level, groups)
+        return RecordClassification(
+            category=self.categorize(message, topic, is_error, groups),
+            is_error=is_error,
+            is_warning=bool(level and level.lower() == 'warning'),
+            versions=self._versions(message) if 'version' in groups else (),
+            service_status=self._service_status(message, topic),
+            cut_mode=self._search_group(CUT_MODE_RE, message) if 'state' in groups else None,
+            state=self._search_group(STATE_RE, message) if 'state' in groups else None,
+            io_signal=self._io(message) if 'io' in groups else None,
+        )
+
+    def categorize(self, message: str, topic: str, is_error: bool, groups: frozenset[Any] | set[Any] | None = None) -> str:
+        if groups is None:
+            groups = self._groups(message)
+        topic_categories = self._topic_categories.get(topic)
+        if topic_categories is None:
+            topic_categories = self._topic_categories[topic] = frozenset(
+                index for index, (_, patterns) in enumerate(CATEGORY_RULES) if any(pattern.search(topic) for pattern in patterns)
+            )
+        for index, (category, patterns) in enumerate(CATEGORY_RULES):
+            if index in topic_categories or index in groups and any(pattern.search(message) for pattern in patterns):
+                return category
+        return 'Erros diversos' if is_error else 'Operação geral'
+
+    def is_error(self, message: str, level: str | None, groups: frozenset[Any] | set[Any] | None = None) -> bool:
+        if groups is None:
+            groups = self._groups(message)
+        if 'ignore' in groups and any(pattern.search(message) for pattern in IGNORE_ERROR_PATTERNS):
+            return False
+        if level and level.lower() in {'error', 'fatal', 'critical'}:
+            return True
+        return 'error' in groups and any(pattern.search(message) for pattern in ERROR_PATTERNS)
+
+    def _groups(self, message: str) -> frozenset[Any] | set[Any]:
+        if not message.isascii():
+            return self._all_groups
+        text = message.lower()
+        first = self._keyword_re.search(text)
+        if first is None:
+            return frozenset()
+        groups: set[Any] = set()
+        for keyword in self._overlapping_keyword_re.findall(text, first.start()):
+            groups |= self._keyword_groups[keyword]
+        return groups
+
+    def _service_status(self, message: str, topic: str) -> tuple[str, str] | None:
+        if topic in self._topic_status_roots:
+            root = self._topic_status_roots[topic]
+        else:
+            match = STATUS_TOPIC_RE.match(topic)
+            root = self._topic_status_roots[topic] = match.group('topic_root').split('/')[-1] if match else None
+        if root is None:
+            return None
+        status = message.strip().title()
+        if status not in {'Online', 'Offline'}:
+            return None
+        return root, status
+
+    @staticmethod
+    def _search_group(pattern: re.Pattern[str], message: str) -> str | None:
+        match = pattern.search(message)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _io(message: str) -> tuple[str, str, str, bool] | None:
+        match = IO_RE.search(message)
+        if not match:
+            return None
+        return match.group(1).title(), match.group(2), match.group(3), match.group(4).lower() == 'on'
+
+    @staticmethod
+    def _versions(message: str) -> tuple[tuple[str, str], ...]:
+        versions: list[tuple[str, str]] = []
+        for pattern in VERSION_PATTERNS:
+            match = pattern.search(message)
+            if not match:
+                continue
+            label = match.groupdict().get('label') or 'Cutchart version'
+            value = match.groupdict().get('value')
+            if value:
+                versions.append((label.strip(), value.strip()))
+        return tuple(versions)
+
+
+CLASSIFIER = RecordClassifier()
+
+
 class MonitorAnalyzer:
-    def __init__(self, records: Iterable[LogRecord], source_path: str | Path):
-        self.records = list(records)
+    def __init__(
+        self,
+        records: Iterable[LogRecord] = (),
+        source_path: str | Path = '',
+        retain_records: bool = True,
+        record_filter: RecordFilter | None = None,
+    ):
+        self.records = records
         self.source_path = Path(source_path)
+        self.retain_records = retain_records
+        self.record_filter = record_filter
+        self._consumed = False
+        self._retained: list[LogRecord] = []
+        self._sessions: list[ProgramSession] = []
+        self._unassigned_errors: list[LogRecord] = []
+        self._cut_mode_history: list[tuple[datetime, str]] = []
+        self._state_history: list[tuple[datetime, str]] = []
+        self._state_totals: defaultdict[str, float] = defaultdict(float)
+        self._service_status_history: list[ServiceStatusEvent] = []
+        self._version_inventory: list[VersionEntry] = []
+        self._source_context_counts: Counter[str] = Counter()
+        self._topic_counts: Counter[str] = Counter()
+        self._category_counts: Counter[str] = Counter()
+        self._active_session: ProgramSession | None = None
+        self._active_arc: ArcEvent | None = None
+        self._current_cut_mode: str | None = None
+        self._columns = RecordColumns(source_path)
+        self.record_count = 0
+        self.first_timestamp: datetime | None = None
+        self.last_timestamp: datetime | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state['records'] = ()
+        return state
+
+    def attach_source(self, source: MappedLogFile) -> None:
+        containers: list[Iterable[LogRecord]] = [self._retained, self._unassigned_errors]
+        for session in self._sessions:
+            containers.extend([session.events, session.errors, session.warnings])
+        for container in containers:
+            for record in container:
+                record._source = source
 
     def analyze(self) -> LogAnalysis:
-        sessions: list[ProgramSession] = []
-        unassigned_errors: list[LogRecord] = []
-        cut_mode_history: list[tuple[datetime, str]] = []
-        state_history: list[tuple[datetime, str]] = []
-        service_status_history: list[ServiceStatusEvent] = []
-        version_inventory: list[VersionEntry] = []
-        source_context_counts: Counter[str] = Counter()
-        topic_counts: Counter[str] = Counter()
-        category_counts: Counter[str] = Counter()
-        active_session: ProgramSession | None = None
-        active_arc: ArcEvent | None = None
-        current_cut_mode: str | None = None
-
-        for record in self.records:
-            topic_counts[record.topic] += 1
-            category_counts[self._categorize_record(record)] += 1
-
-            if source_context := self._extract_source_context(record):
-                source_context_counts[source_context] += 1
-
-            version_inventory.extend(self._extract_versions(record))
-
-            if status_event := self._detect_service_status(record):
-                service_status_history.append(status_event)
-
-            if cut_mode := self._detect_cut_mode(record.message):
-                current_cut_mode = cut_mode
-                cut_mode_history.append((record.timestamp, cut_mode))
-                if active_session and active_session.cut_mode is None:
-                    active_session.cut_mode = cut_mode
-
-            if state := self._detect_state(record.message):
-                state_history.append((record.timestamp, state))
-                if active_session and (not active_session.states or active_session.states[-1] != state):
-                    active_session.states.append(state)
-
-            io_signal = self._detect_io(record.message)
-            if io_signal == ('Output', '6', 'Program_Running', True):
-                if active_session and active_session.end is None:
-                    active_session.end = record.timestamp
-                    if active_arc and active_arc.end is None:
-                        active_arc.end = record.timestamp
-                        active_session.arc_events.append(active_arc)
-                        active_arc = None
-                active_session = ProgramSession(index=len(sessions) + 1, start=record.timestamp, cut_mode=current_cut_mode)
-                sessions.append(active_session)
-                active_session.events.append(record)
-                continue
+        if not self._consumed:
+            self._consumed = True
+            self.feed_many(self.records)
+        return self.snapshot()
 
-            if active_session:
-                active_session.events.append(record)
-
-            if io_signal == ('Output', '6', 'Program_Running', False):
-                if active_session:
-                    active_session.end = record.timestamp
-                    if active_arc and active_arc.end is None:
-                        active_arc.end = record.timestamp
-                        active_session.arc_events.append(active_arc)
-                        active_arc = None
-                    active_session.events.append(record)
-                    active_session = None
-                continue
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    def feed_many(self, records: Iterable[LogRecord]) -> None:
+        for record in records:
+            self.feed(record)
+
+    def feed(self, record: LogRecord, classification: RecordClassification | None = None) -> None:
+        traits = classification or self.classify(record)
+        if self.retain_records:
+            self._retained.append(record)
+        record.category = traits.category
+        self._columns.append(record, traits)
+        self.record_count += 1
+        if self.first_timestamp is None:
+            self.first_timestamp = record.timestamp
+        self.last_timestamp = record.timestamp
+        self._topic_counts[record.topic] += 1
+        self._category_counts[traits.category] += 1
+
+        if record.source_context:
+            self._source_context_counts[record.source_context] += 1
+
+        self._version_inventory.extend(VersionEntry(label=label, value=value, timestamp=record.timestamp) for label, value in traits.versions)
+
+        if traits.service_status:
+            service, status = traits.service_status
+            self._service_status_history.append(ServiceStatusEvent(timestamp=record.timestamp, service=service, status=status))
+
+        active_session = self._active_session
+        if cut_mode := traits.cut_mode:
+            self._current_cut_mode = cut_mode
+            self._cut_mode_history.append((record.timestamp, cut_mode))
+            if active_session and active_session.cut_mode is None:
+                active_session.cut_mode = cut_mode
+
+        if state := traits.state:
+            if self._state_history:
+                previous_timestamp, previous_state = self._state_history[-1]
+                self._state_totals[previous_state] += max((record.timestamp - previous_timestamp).total_seconds(), 0.0)
+            self._state_history.append((record.timestamp, state))
+            if active_session and (not active_session.states or active_session.states[-1] != state):
+                active_session.states.append(state)
+
+        io_signal = traits.io_signal
+        row = self.record_count - 1
+        if io_signal == ('Output', '6', 'Program_Running', True):
+            if active_session and active_session.end is None:
+                active_session.end = record.timestamp
+                active_session.last_row = row - 1
+                self._close_arc(active_session, record.timestamp)
+            active_session = ProgramSession(
+                index=len(self._sessions) + 1,
+                start=record.timestamp,
+                cut_mode=self._current_cut_mode,
+                first_row=row,
+            )
+            self._sessions.append(active_session)
+            self._active_session = active_session
+            active_session.events.append(record)
+            return
 
-            if io_signal == ('Output', '1', 'Cut_Control', True):
-                if active_session and active_arc is None:
-                    active_arc = ArcEvent(start=record.timestamp)
-                continue
+        if active_session:
+            active_session.events.append(record)
 
-            if io_signal == ('Output', '1', 'Cut_Control', False):
-                if active_session and active_arc:
-                    active_arc.end = record.timestamp
-                    active_session.arc_events.append(active_arc)
-                    active_arc = None
-                continue
+        if io_signal == ('Output', '6', 'Program_Running', False):
+            if active_session:
+                active_session.end = record.timestamp
+                active_session.last_row = row
+                self._close_arc(active_session, record.timestamp)
+                active_session.events.append(record)
+                self._active_session = None
+            return
 
-            if self._is_error(record):
-                if active_session:
-                    active_session.errors.append(record)
-                else:
-                    unassigned_errors.append(record)
-                continue
+        if io_signal == ('Output', '1', 'Cut_Control', True):
+            if active_session and self._active_arc is None:
+                self._active_arc = ArcEvent(start=record.timestamp)
+            return
 
-            if self._is_warning(record) and active_session:
-                active_session.warnings.append(record)
+        if io_signal == ('Output', '1', 'Cut_Control', False):
+            if active_session and self._active_arc:
+                self._close_arc(active_session, record.timestamp)
+            return
 
-        if active_session and active_arc and active_arc.end is None:
-            active_arc.end = active_session.end or self.records[-1].timestamp
-            active_session.arc_events.append(active_arc)
+        if traits.is_error:
+            if active_session:
+                active_session.errors.append(record)
+            else:
+                self._unassigned_errors.append(record)
+            return
+
+        if traits.is_warning and active_session:
+            active_session.warnings.append(record)
+
+    def classify(self, record: LogRecord) -> RecordClassification:
+        return CLASSIFIER.classify(record.message, record.topic, record.level)
+
+    def snapshot(self) -> LogAnalysis:
+        sessions = list(self._sessions)
+        active_session = self._active_session
+        if active_session:
+            # A sessão ativa continua recebendo eventos, então o retrato leva uma cópia
+            # com o arco aberto fechado no último registro, como no fim de um arquivo.
+            arc_events = list(active_session.arc_events)
+            if self._active_arc and self._active_arc.end is None:
+                arc_events.append(ArcEvent(start=self._active_arc.start, end=active_session.end or self.last_timestamp))
+            sessions[-1] = replace(
+                active_session,
+                arc_events=arc_events,
+                errors=_HistoryView(active_session.errors),
+                warnings=_HistoryView(active_session.warnings),
+                states=_HistoryView(active_session.states),
+                events=_HistoryView(active_session.events),
+            )
 
+        service_status_history = _HistoryView(self._service_status_history)
+        version_inventory = _HistoryView(self._version_inventory)
+        unassigned_errors = _HistoryView(self._unassigned_errors)
+        source_context_counts = Counter(self._source_context_counts)
+        category_counts = Counter(self._category_counts)
         return LogAnalysis(
             source_path=self.source_path,
-            records=self.records,
+            records=_HistoryView(self._retained),
             sessions=sessions,
             unassigned_errors=unassigned_errors,
-            cut_mode_history=cut_mode_history,
-            state_history=state_history,
+            cut_mode_history=_HistoryView(self._cut_mode_history),
+            state_history=_HistoryView(self._state_history),
             service_status_history=service_status_history,
             version_inventory=version_inventory,
             source_context_counts=source_context_counts,
-            topic_counts=topic_counts,
+            topic_counts=Counter(self._topic_counts),
             category_counts=category_counts,
-            state_duration_seconds=self._compute_state_durations(state_history),
+            state_duration_seconds=self._compute_state_durations(),
             recommendations=self._build_recommendations(
                 sessions=sessions,
                 service_status_history=service_status_history,
@@ -559,84 +2324,40 @@ class MonitorAnalyzer:
                 source_context_counts=source_context_counts,
                 unassigned_errors=unassigned_errors,
             ),
+            record_count=self.record_count,
+            first_timestamp=self.first_timestamp,
+            last_timestamp=self.last_timestamp,
+            columns=self._columns.snapshot(),
+            record_filter=self.record_filter,
         )
 
-    def _detect_io(self, message: str) -> tuple[str, str, str, bool] | None:
-        match = IO_RE.search(message)
-        if not match:
-            return None
-        return match.group(1).title(), match.group(2), match.group(3), match.group(4).lower() == 'on'
-
-    def _detect_state(self, message: str) -> str | None:
-        match = STATE_RE.search(message)
-        return match.group(1) if match else None
-
-    def _detect_cut_mode(self, message: str) -> str | None:
-        match = CUT_MODE_RE.search(message)
-        return match.group(1) if match else None
-
-    def _detect_service_status(self, record: LogRecord) -> ServiceStatusEvent | None:
-        match = STATUS_TOPIC_RE.match(record.topic)
-        if not match:
-            return None
-        status = record.message.strip().title()
-        if status not in {'Online', 'Offline'}:
-            return None
-        service_name = match.group('topic_root').split('/')[-1]
-        return ServiceStatusEvent(timestamp=record.timestamp, service=service_name, status=status)
-
-    def _extract_source_context(self, record: LogRecord) -> str | None:
-        if not record.raw_data:
-            return None
-        properties = record.raw_data.get('Properties') or {}
-        source_context = properties.get('SourceContext')
-        if isinstance(source_context, dict):
-            value = source_context.get('Value')
-            if value:
-                return str(value)
-        return None
-
-    def _extract_versions(self, record: LogRecord) -> list[VersionEntry]:
-        versions: list[VersionEntry] = []
-        for pattern in VERSION_PATTERNS:
-            match = pattern.search(record.message)
-            if not match:
-                continue
-            label = match.groupdict().get('label') or 'Cutchart version'
-            value = match.groupdict().get('value')
-            if value:
-                versions.append(VersionEntry(label=label.strip(), value=value.strip(), timestamp=record.timestamp))
-        return versions
+    def _close_arc(self, session: ProgramSession, timestamp: datetime) -> None:
+        if self._active_arc and self._active_arc.end is None:
+            self._active_arc.end = timestamp
+            session.arc_events.append(self._active_arc)
+            self._active_arc = None
 
-    def _categorize_record(self, record: LogRecord) -> str:
-        for category, patterns in CATEGORY_RULES:
-            if any(pattern.search(record.message) or pattern.search(record.topic) for pattern in patterns):
-                return category
-        if self._is_error(record):
-            return 'Erros diversos'
-        return 'Operação geral'
+    def _categorize_record(self, record: LogRecord, is_error: bool | None = None) -> str:
+        if is_error is None:
+            is_error = self._is_error(record)
+        return CLASSIFIER.categorize(record.message, record.topic, is_error)
 
     def _is_error(self, record: LogRecord) -> bool:
-        if any(pattern.search(record.message) for pattern in IGNORE_ERROR_PATTERNS):
-            return False
-        if record.level and record.level.lower() in {'error', 'fatal', 'critical'}:
-            return True
-        return any(pattern.search(record.message) for pattern in ERROR_PATTERNS)
+        return CLASSIFIER.is_error(record.message, record.level)
 
     def _is_warning(self, record: LogRecord) -> bool:
         return bool(record.level and record.level.lower() == 'warning')
 
-    def _compute_state_durations(self, history: list[tuple[datetime, str]]) -> dict[str, float]:
-        totals: defaultdict[str, float] = defaultdict(float)
-        if not history:
+    def _compute_state_durations(self) -> dict[str, float]:
+        if not self._state_history or self.last_timestamp is None:
             return {}
-        for index, (timestamp, state) in enumerate(history):
-            next_timestamp = history[index + 1][0] if index + 1 < len(history) else self.records[-1].timestamp
-            totals[state] += max((next_timestamp - timestamp).total_seconds(), 0.0)
-        return dict(totals)
+        totals = dict(self._state_totals)
+        timestamp, state = self._state_history[-1]
+        totals[state] = totals.get(state, 0.0) + max((self.last_timestamp - timestamp).total_seconds(), 0.0)
+        return totals
 
+    @staticmethod
     def _build_recommendations(
-        self,
         sessions: list[ProgramSession],
         service_status_history: list[ServiceStatusEvent],
         version_inventory: list[VersionEntry],
@@ -704,6 +2425,315 @@ class MonitorAnalyzer:
         return recommendations
 
 
+PROGRESS_INTERVAL = 4096
+
+
+class AnalysisCancelled(Exception):
+    pass
+
+
+@dataclass
+class AnalysisProgress:
+    bytes_read: int
+    total_bytes: int
+    record_count: int
+    session_count: int
+    first_timestamp: datetime | None
+    last_timestamp: datetime | None
+
+    @property
+    def fraction(self) -> float:
+        return min(self.bytes_read / self.total_bytes, 1.0) if self.total_bytes else 1.0
+
+
+DecodedRecord = tuple[int, LogRecord | None, dt_time, date | None, RecordClassification | None]
+
+
+def _process_shard(
+    path: str,
+    start: int,
+    end: int,
+    mapped: bool,
+    lazy_json: bool,
+    record_filter: RecordFilter | None = None,
+) -> list[DecodedRecord]:
+    parser = LogParser(path, mapped=mapped, lazy_json=lazy_json, record_filter=record_filter)
+    builder = _RecordBuilder(parser)
+    analyzer = MonitorAnalyzer()
+    results: list[DecodedRecord] = []
+    for offset, length, block in parser._iter_blocks(start, end=end):
+        if decoded := builder.decode(block, offset, length):
+            record, time_of_day, explicit_date = decoded
+            classification = None
+            if record is not None:
+                classification = analyzer.classify(record)
+                if record._raw_data is not None:
+                    record._raw_data = _PENDING
+            results.append((offset, record, time_of_day, explicit_date, classification))
+    return results
+
+
+def analyze_file(
+    path: str | Path,
+    workers: int = 1,
+    mapped: bool = False,
+    lazy_json: bool = False,
+    retain_records: bool = True,
+    cache: 'AnalysisCache | None' = None,
+    record_filter: RecordFilter | None = None,
+    progress: Callable[[AnalysisProgress], None] | None = None,
+    cancel: threading.Event | None = None,
+) -> LogAnalysis:
+    """Com workers > 1 os trechos voltam em ordem para um único analisador, que resolve virada
+    de dia e sessões como na leitura sequencial.
+
+    O cache guarda o estado antes do último registro, que ainda pode estar incompleto; numa
+    nova abertura só ele e o que foi anexado depois são lidos.
+    """
+    parser = LogParser(path, mapped=mapped, lazy_json=lazy_json, record_filter=record_filter)
+    options = (mapped, lazy_json, retain_records, json.dumps(record_filter.describe() if record_filter else None))
+    source = MappedLogFile(parser.path) if mapped else None
+    builder = _RecordBuilder(parser)
+    cached = cache.load(parser.path, options) if cache else None
+    if cached:
+        analyzer, (builder.current_date, builder.previous_dt, builder.sequence), start = cached
+        analyzer.source_path = analyzer._columns.source_path = Path(path)
+        if source:
+            analyzer.attach_source(source)
+    else:
+        analyzer = MonitorAnalyzer(source_path=path, retain_records=retain_records, record_filter=record_filter)
+        builder.current_date = parser._scan_first_date()
+        start = 0
+    builder.source = source
+
+    pending: DecodedRecord | None = None
+    fed = 0
+    total_bytes = parser.path.stat().st_size if progress else 0
+    for decoded in _iter_decoded(parser, builder, start, workers):
+        if pending:
+            _feed_decoded(analyzer, builder, pending)
+            fed += 1
+            if not fed % PROGRESS_INTERVAL:
+                if cancel and cancel.is_set():
+                    raise AnalysisCancelled('Análise cancelada.')
+                if progress:
+                    progress(AnalysisProgress(
+                        bytes_read=decoded[0],
+                        total_bytes=total_bytes,
+                        record_count=analyzer.record_count,
+                        session_count=analyzer.session_count,
+                        first_timestamp=analyzer.first_timestamp,
+                        last_timestamp=analyzer.last_timestamp,
+                    ))
+        pending = decoded
+    if pending:
+        if cache and (fed or not cached):
+            analyzer._columns.update_text_index()
+            cache.store(parser.path, options, analyzer, builder, pending[0])
+        _feed_decoded(analyzer, builder, pending)
+    analysis = analyzer.snapshot()
+    if not analysis.record_count:
+        if record_filter:
+            raise ValueError('Nenhum registro do arquivo atende ao filtro informado.')
+        raise ValueError('Nenhum registro reconhecido no arquivo informado.')
+    return analysis
+
+
+def _feed_decoded(analyzer: MonitorAnalyzer, builder: _RecordBuilder, decoded: DecodedRecord) -> None:
+    _, record, time_of_day, explicit_date, classification = decoded
+    if record := builder.resolve(record, time_of_day, explicit_date):
+        analyzer.feed(record, classification)
+
+
+def catch_up_follow(
+    path: str | Path,
+    lazy_json: bool = False,
+    cache: 'AnalysisCache | None' = None,
+    record_filter: RecordFilter | None = None,
+    progress: Callable[[AnalysisProgress], None] | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[LogFollower, MonitorAnalyzer]:
+    """O cache de analyze_file para no início do último registro, que é onde o seguidor continua."""
+    follower = LogFollower(path, lazy_json=lazy_json, record_filter=record_filter)
+    options = (False, lazy_json, False, json.dumps(record_filter.describe() if record_filter else None))
+    cached = cache.load(follower.path, options) if cache else None
+    if cached:
+        analyzer, builder_state, follower.offset = cached
+        builder = follower._builder
+        builder.current_date, builder.previous_dt, builder.sequence = builder_state
+        analyzer.source_path = analyzer._columns.source_path = Path(path)
+    else:
+        analyzer = MonitorAnalyzer(source_path=path, retain_records=False, record_filter=record_filter)
+    total_bytes = follower.path.stat().st_size if progress else 0
+    for fed, record in enumerate(follower.iter_new(), 1):
+        analyzer.feed(record)
+        if not fed % PROGRESS_INTERVAL:
+            if cancel and cancel.is_set():
+                raise AnalysisCancelled('Análise cancelada.')
+            if progress:
+                progress(AnalysisProgress(
+                    bytes_read=follower.offset,
+                    total_bytes=total_bytes,
+                    record_count=analyzer.record_count,
+                    session_count=analyzer.session_count,
+                    first_timestamp=analyzer.first_timestamp,
+                    last_timestamp=analyzer.last_timestamp,
+                ))
+    return follower, analyzer
+
+
+def _iter_decoded(
+    parser: LogParser,
+    builder: _RecordBuilder,
+    start: int,
+    workers: int,
+) -> Iterator[DecodedRecord]:
+    if workers <= 1:
+        blocks = parser._iter_mapped_blocks(builder.source.data, start) if builder.source else parser._iter_blocks(start)
+        for offset, length, block in blocks:
+            if decoded := builder.decode(block, offset, length):
+                yield (offset, *decoded, None)
+        return
+    # Trechos de até shard_bytes e no máximo workers + 1 em andamento: cada trecho volta
+    # inteiro como lista, então a memória fica limitada pelos trechos pendentes e não pelo arquivo.
+    count = max(workers * 2, -(-(parser.path.stat().st_size - start) // parser.shard_bytes))
+    shards = iter(parser.plan_shards(count, start))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Any] = deque()
+
+        def submit_next() -> None:
+            if (shard := next(shards, None)) is not None:
+                pending.append(
+                    executor.submit(
+                        _process_shard, str(parser.path), *shard, parser.mapped, parser.lazy_json, parser.record_filter
+                    )
+                )
+
+        for _ in range(workers + 1):
+            submit_next()
+        while pending:
+            results = pending.popleft().result()
+            submit_next()
+            for decoded in results:
+                if decoded[1] is not None:
+                    decoded[1]._source = builder.source
+                yield decoded
+            del results
+
+
+class AnalysisCache:
+    version = 6
+    fingerprint_size = 64 * 1024
+    fingerprint_samples = 32
+    sample_size = 4 * 1024
+
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = 512 * 1024 * 1024):
+        default = os.environ.get('APP_MONITOR_CACHE_DIR') or Path.home() / '.cache' / 'app_monitor'
+        self.directory = Path(directory or default)
+        self.max_bytes = max_bytes
+
+    def load(self, path: Path, options: tuple[bool, ...]) -> tuple[MonitorAnalyzer, tuple[Any, ...], int] | None:
+        entry_path = self._entry_path(path, options)
+        try:
+            with entry_path.open('rb') as handle:
+                entry = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            entry_path.unlink(missing_ok=True)
+            return None
+        try:
+            stat = path.stat()
+            valid = (
+                entry.get('version') == self.version
+                and stat.st_size >= entry['offset']
+                and (stat.st_size != entry['size'] or stat.st_mtime_ns == entry['mtime_ns'])
+                and self._fingerprint(path, entry['offset']) == entry['fingerprint']
+            )
+        except (OSError, KeyError):
+            valid = False
+        if not valid:
+            entry_path.unlink(missing_ok=True)
+            return None
+        os.utime(entry_path)
+        return entry['analyzer'], entry['builder'], entry['offset']
+
+    def store(self, path: Path, options: tuple[bool, ...], analyzer: MonitorAnalyzer, builder: '_RecordBuilder', offset: int) -> None:
+        stat = path.stat()
+        entry = {
+            'version': self.version,
+            'path': str(path.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'offset': offset,
+            'fingerprint': self._fingerprint(path, offset),
+            'builder': (builder.current_date, builder.previous_dt, builder.sequence),
+            'analyzer': analyzer,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(path, options)
+        temporary = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+        with temporary.open('wb') as handle:
+            pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, entry_path)
+        self._evict()
+
+    def clear(self) -> None:
+        for entry_path in self.directory.glob('*.pickle'):
+            entry_path.unlink(missing_ok=True)
+
+    def _entry_path(self, path: Path, options: tuple[bool, ...]) -> Path:
+        key = hashlib.sha1(f'{path.resolve()}|{options}'.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.pickle'
+
+    def _fingerprint(self, path: Path, offset: int) -> tuple[str, str, str]:
+        samples = hashlib.sha1()
+        with path.open('rb') as handle:
+            head = handle.read(min(self.fingerprint_size, offset))
+            handle.seek(max(offset - self.fingerprint_size, 0))
+            tail = handle.read(min(self.fingerprint_size, offset))
+            if offset > 2 * self.fingerprint_size:
+                span = offset - 2 * self.fingerprint_size - self.sample_size
+                for index in range(self.fingerprint_samples):
+                    handle.seek(self.fingerprint_size + max(span, 0) * index // (self.fingerprint_samples - 1))
+                    samples.update(handle.read(min(self.sample_size, offset - handle.tell())))
+        return hashlib.sha1(head).hexdigest(), hashlib.sha1(tail).hexdigest(), samples.hexdigest()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry_path in self.directory.glob('*.pickle'):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+
+
+def decimate_min_max(values: Sequence[float], columns: int) -> list[int]:
+    count = len(values)
+    if count <= 2 * columns:
+        return list(range(count))
+    kept: list[int] = []
+    for column in range(columns):
+        low, high = column * count // columns, (column + 1) * count // columns
+        if low >= high:
+            continue
+        lowest = min(range(low, high), key=values.__getitem__)
+        highest = max(range(low, high), key=values.__getitem__)
+        kept.extend(sorted({lowest, highest}))
+    if kept[0] != 0:
+        kept.insert(0, 0)
+    if kept[-1] != count - 1:
+        kept.append(count - 1)
+    return kept
+
+
 if HAS_QT:
 
     class GlassFrame(QFrame):
@@ -717,7 +2747,52 @@ if HAS_QT:
             self.setGraphicsEffect(effect)
 
 
-    class AnimatedGauge(QWidget):
+    @lru_cache(maxsize=None)
+    def chart_font(point_size: int, bold: bool = False) -> QFont:
+        return QFont('Segoe UI', point_size, QFont.Bold if bold else QFont.Normal)
+
+
+    @lru_cache(maxsize=None)
+    def ring_pen(color: str, width: int) -> QPen:
+        pen = QPen(QColor(color), width)
+        pen.setCapStyle(Qt.RoundCap)
+        return pen
+
+
+    class LayeredWidget(QWidget):
+        layer_refresh_events = (QEvent.StyleChange, QEvent.PaletteChange, QEvent.FontChange)
+
+        def __init__(self):
+            super().__init__()
+            self._layers: dict[str, tuple[tuple[Any, ...], QPixmap]] = {}
+
+        def invalidate_layers(self) -> None:
+            self._layers.clear()
+            self.update()
+
+        def layer(self, name: str, key: tuple[Any, ...], render: Callable[[QPainter], None]) -> QPixmap:
+            ratio = self.devicePixelRatioF()
+            full_key = (self.width(), self.height(), ratio, *key)
+            cached = self._layers.get(name)
+            if cached is not None and cached[0] == full_key:
+                return cached[1]
+            pixmap = QPixmap(max(round(self.width() * ratio), 1), max(round(self.height() * ratio), 1))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            render(painter)
+            painter.end()
+            self._layers[name] = (full_key, pixmap)
+            return pixmap
+
+        def changeEvent(self, event: Any) -> None:
+            if event.type() in self.layer_refresh_events:
+                self._layers.clear()
+            super().changeEvent(event)
+
+
+    class AnimatedGauge(LayeredWidget):
         def __init__(self, title: str):
             super().__init__()
             self.title = title
@@ -745,48 +2820,51 @@ if HAS_QT:
             animation.start()
             self._animation = animation
 
-        def paintEvent(self, _event) -> None:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
+        def _arc_rect(self) -> QRect:
+            rect = self.rect().adjusted(20, 16, -20, -16)
+            return QRect(rect.left() + 34, rect.top() + 48, 160, 160)
+
+        def _render_static(self, painter: QPainter) -> None:
             rect = self.rect().adjusted(20, 16, -20, -16)
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor('#0f172a'))
             painter.drawRoundedRect(rect, 22, 22)
 
             painter.setPen(QColor('#f8fafc'))
-            painter.setFont(QFont('Segoe UI', 11, QFont.Bold))
+            painter.setFont(chart_font(11, True))
             painter.drawText(rect.adjusted(18, 12, -18, 0), self.title)
 
-            arc_rect = QRect(rect.left() + 34, rect.top() + 48, 160, 160)
-            base_pen = QPen(QColor('#1e293b'), 16)
-            base_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(base_pen)
+            arc_rect = self._arc_rect()
+            painter.setPen(ring_pen('#1e293b', 16))
             painter.drawArc(arc_rect, 0, 360 * 16)
 
-            color = QColor('#10b981' if self._value >= 80 else '#f59e0b' if self._value >= 60 else '#ef4444')
-            active_pen = QPen(color, 16)
-            active_pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(active_pen)
-            painter.drawArc(arc_rect, 90 * 16, -int(self._value / 100 * 360 * 16))
-
-            painter.setPen(QColor('#ffffff'))
-            painter.setFont(QFont('Segoe UI', 26, QFont.Bold))
-            painter.drawText(arc_rect, Qt.AlignCenter, f'{self._value:.0f}')
-
             painter.setPen(QColor('#94a3b8'))
-            painter.setFont(QFont('Segoe UI', 10))
+            painter.setFont(chart_font(10))
             painter.drawText(arc_rect.adjusted(0, 54, 0, 0), Qt.AlignCenter, 'score')
 
             subtitle_rect = QRect(rect.left() + 218, rect.top() + 64, rect.width() - 240, 120)
             painter.setPen(QColor('#e2e8f0'))
-            painter.setFont(QFont('Segoe UI', 11, QFont.Bold))
+            painter.setFont(chart_font(11, True))
             painter.drawText(subtitle_rect.adjusted(0, 0, 0, -62), Qt.TextWordWrap, self.subtitle)
             painter.setPen(QColor('#94a3b8'))
-            painter.setFont(QFont('Segoe UI', 10))
+            painter.setFont(chart_font(10))
             painter.drawText(subtitle_rect.adjusted(0, 50, 0, 0), Qt.TextWordWrap, 'Quanto mais perto de 100, melhor a saúde operacional do período analisado.')
 
+        def paintEvent(self, _event) -> None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self.layer('static', (self.title, self.subtitle), self._render_static))
+            painter.setRenderHint(QPainter.Antialiasing)
+            arc_rect = self._arc_rect()
+            color = '#10b981' if self._value >= 80 else '#f59e0b' if self._value >= 60 else '#ef4444'
+            painter.setPen(ring_pen(color, 16))
+            painter.drawArc(arc_rect, 90 * 16, -int(self._value / 100 * 360 * 16))
+
+            painter.setPen(QColor('#ffffff'))
+            painter.setFont(chart_font(26, True))
+            painter.drawText(arc_rect, Qt.AlignCenter, f'{self._value:.0f}')
 
-    class MiniBarChart(QWidget):
+
+    class MiniBarChart(LayeredWidget):
         def __init__(self, title: str, unit: str):
             super().__init__()
             self.title = title
@@ -796,23 +2874,23 @@ if HAS_QT:
 
         def set_series(self, series: list[tuple[str, float, str]]) -> None:
             self.series = series
-            self.update()
+            self.invalidate_layers()
 
         def paintEvent(self, _event) -> None:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
+            QPainter(self).drawPixmap(0, 0, self.layer('chart', (), self._render_chart))
+
+        def _render_chart(self, painter: QPainter) -> None:
             rect = self.rect().adjusted(16, 16, -16, -16)
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(15, 23, 42, 220))
             painter.drawRoundedRect(rect, 20, 20)
 
             painter.setPen(QColor('#f8fafc'))
-            painter.setFont(QFont('Segoe UI', 11, QFont.Bold))
+            painter.setFont(chart_font(11, True))
             painter.drawText(rect.adjusted(18, 14, -18, 0), self.title)
             if not self.series:
                 painter.setPen(QColor('#94a3b8'))
-                painter.setFont(QFont('Segoe UI', 10))
+                painter.setFont(chart_font(10))
                 painter.drawText(rect, Qt.AlignCenter, 'Sem dados suficientes para o gráfico.')
                 return
 
@@ -822,8 +2900,7 @@ if HAS_QT:
             bottom = chart.bottom() - 24
             height = chart.height() - 50
 
-            axis_pen = QPen(QColor('#334155'), 1)
-            painter.setPen(axis_pen)
+            painter.setPen(QPen(QColor('#334155'), 1))
             painter.drawLine(chart.left(), bottom, chart.right(), bottom)
 
             for index, (label, value, color) in enumerate(self.series):
@@ -839,14 +2916,14 @@ if HAS_QT:
                 painter.setBrush(grad)
                 painter.drawRoundedRect(x, y, bar_width, bar_height, 10, 10)
                 painter.setPen(QColor('#cbd5e1'))
-                painter.setFont(QFont('Segoe UI', 9, QFont.Bold))
+                painter.setFont(chart_font(9, True))
                 painter.drawText(QRect(int(x), int(y - 26), int(bar_width), 18), Qt.AlignCenter, f'{value:.1f} {self.unit}')
-                painter.setFont(QFont('Segoe UI', 9))
+                painter.setFont(chart_font(9))
                 painter.setPen(QColor('#94a3b8'))
                 painter.drawText(QRect(int(x - 6), int(bottom + 6), int(bar_width + 12), 32), Qt.AlignHCenter | Qt.TextWordWrap, label[:18])
 
 
-    class DonutChart(QWidget):
+    class DonutChart(LayeredWidget):
         def __init__(self, title: str):
             super().__init__()
             self.title = title
@@ -855,22 +2932,23 @@ if HAS_QT:
 
         def set_items(self, items: list[tuple[str, float, str]]) -> None:
             self.items = items
-            self.update()
+            self.invalidate_layers()
 
         def paintEvent(self, _event) -> None:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
+            QPainter(self).drawPixmap(0, 0, self.layer('chart', (), self._render_chart))
+
+        def _render_chart(self, painter: QPainter) -> None:
             rect = self.rect().adjusted(16, 16, -16, -16)
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(15, 23, 42, 220))
             painter.drawRoundedRect(rect, 20, 20)
 
             painter.setPen(QColor('#f8fafc'))
-            painter.setFont(QFont('Segoe UI', 11, QFont.Bold))
+            painter.setFont(chart_font(11, True))
             painter.drawText(rect.adjusted(18, 14, -18, 0), self.title)
             if not self.items:
                 painter.setPen(QColor('#94a3b8'))
-                painter.setFont(QFont('Segoe UI', 10))
+                painter.setFont(chart_font(10))
                 painter.drawText(rect, Qt.AlignCenter, 'Sem categorias suficientes para desenhar.')
                 return
 
@@ -879,9 +2957,7 @@ if HAS_QT:
             start = 90 * 16
             for label, value, color in self.items:
                 span = -int(value / total * 360 * 16)
-                pen = QPen(QColor(color), 18)
-                pen.setCapStyle(Qt.RoundCap)
-                painter.setPen(pen)
+                painter.setPen(ring_pen(color, 18))
                 painter.drawArc(donut, start, span)
                 start += span
 
@@ -889,10 +2965,10 @@ if HAS_QT:
             center_path.addEllipse(donut.adjusted(34, 34, -34, -34))
             painter.fillPath(center_path, QColor('#020617'))
             painter.setPen(QColor('#ffffff'))
-            painter.setFont(QFont('Segoe UI', 20, QFont.Bold))
+            painter.setFont(chart_font(20, True))
             painter.drawText(donut, Qt.AlignCenter, str(int(total)))
             painter.setPen(QColor('#94a3b8'))
-            painter.setFont(QFont('Segoe UI', 9))
+            painter.setFont(chart_font(9))
             painter.drawText(donut.adjusted(0, 54, 0, 0), Qt.AlignCenter, 'eventos')
 
             legend_x = donut.right() + 28
@@ -902,99 +2978,157 @@ if HAS_QT:
                 painter.setBrush(QColor(color))
                 painter.drawEllipse(legend_x, y, 12, 12)
                 painter.setPen(QColor('#e2e8f0'))
-                painter.setFont(QFont('Segoe UI', 9, QFont.Bold))
+                painter.setFont(chart_font(9, True))
                 painter.drawText(legend_x + 20, y + 10, f'{label}')
                 painter.setPen(QColor('#94a3b8'))
                 painter.drawText(legend_x + 150, y + 10, f'{value:.0f}')
 
 
-    class TrendLines(QWidget):
-        def __init__(self, title: str):
+    class TrendLines(LayeredWidget):
+        label_spacing = 56
+        marker_spacing = 12
+
+        def __init__(
+            self,
+            title: str,
+            legends: tuple[str, str] = ('duração (min)', 'eficiência (%)'),
+            empty_text: str = 'Sem sessões suficientes para desenhar a tendência.',
+        ):
             super().__init__()
             self.title = title
+            self.legends = legends
+            self.empty_text = empty_text
             self.primary: list[float] = []
             self.secondary: list[float] = []
             self.labels: list[str] = []
+            self.view: tuple[int, int] | None = None
+            self._drag: tuple[float, tuple[int, int]] | None = None
             self.setMinimumHeight(280)
 
         def set_data(self, labels: list[str], primary: list[float], secondary: list[float]) -> None:
             self.labels = labels
             self.primary = primary
             self.secondary = secondary
+            self.view = None
+            self.invalidate_layers()
+
+        def visible_range(self) -> tuple[int, int]:
+            return self.view or (0, len(self.labels))
+
+        def set_view(self, start: int, end: int) -> None:
+            count = len(self.labels)
+            span = min(max(end - start, min(2, count)), count)
+            start = min(max(start, 0), count - span)
+            self.view = None if span >= count else (start, start + span)
             self.update()
 
+        def wheelEvent(self, event: Any) -> None:
+            if len(self.labels) < 3:
+                return
+            start, end = self.visible_range()
+            chart = self._chart_rect()
+            anchor = min(max((event.position().x() - chart.left()) / max(chart.width(), 1), 0.0), 1.0)
+            factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+            span = max(round((end - start) * factor), 2)
+            center = start + anchor * (end - start)
+            self.set_view(round(center - anchor * span), round(center - anchor * span) + span)
+            event.accept()
+
+        def mousePressEvent(self, event: Any) -> None:
+            if event.button() == Qt.LeftButton and self.view:
+                self._drag = (event.position().x(), self.view)
+
+        def mouseMoveEvent(self, event: Any) -> None:
+            if not self._drag:
+                return
+            origin_x, (start, end) = self._drag
+            shift = round((origin_x - event.position().x()) * (end - start) / max(self._chart_rect().width(), 1))
+            self.set_view(start + shift, end + shift)
+
+        def mouseReleaseEvent(self, _event: Any) -> None:
+            self._drag = None
+
+        def mouseDoubleClickEvent(self, _event: Any) -> None:
+            self.view = None
+            self.update()
+
+        def _chart_rect(self) -> QRect:
+            return self.rect().adjusted(16, 16, -16, -16).adjusted(24, 54, -24, -28)
+
         def paintEvent(self, _event) -> None:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
+            painter.drawPixmap(0, 0, self.layer('chrome', (self.title, self.legends), self._render_chrome))
+            painter.drawPixmap(0, 0, self.layer('plot', (self.visible_range(),), self._render_plot))
+
+        def _render_chrome(self, painter: QPainter) -> None:
             rect = self.rect().adjusted(16, 16, -16, -16)
             painter.setPen(Qt.NoPen)
             painter.setBrush(QColor(15, 23, 42, 220))
             painter.drawRoundedRect(rect, 20, 20)
 
             painter.setPen(QColor('#f8fafc'))
-            painter.setFont(QFont('Segoe UI', 11, QFont.Bold))
+            painter.setFont(chart_font(11, True))
             painter.drawText(rect.adjusted(18, 14, -18, 0), self.title)
+            painter.setPen(QColor('#38bdf8'))
+            painter.setFont(chart_font(9, True))
+            painter.drawText(rect.right() - 148, rect.top() + 24, f'● {self.legends[0]}')
+            painter.setPen(QColor('#22c55e'))
+            painter.drawText(rect.right() - 148, rect.top() + 46, f'● {self.legends[1]}')
 
+        def _render_plot(self, painter: QPainter) -> None:
+            rect = self.rect().adjusted(16, 16, -16, -16)
             if not self.labels:
                 painter.setPen(QColor('#94a3b8'))
-                painter.setFont(QFont('Segoe UI', 10))
-                painter.drawText(rect, Qt.AlignCenter, 'Sem sessões suficientes para desenhar a tendência.')
+                painter.setFont(chart_font(10))
+                painter.drawText(rect, Qt.AlignCenter, self.empty_text)
                 return
 
-            chart = rect.adjusted(24, 54, -24, -28)
-            bottom = chart.bottom() - 24
-            left = chart.left() + 8
-            right = chart.right()
-            painter.setPen(QPen(QColor('#334155'), 1))
-            for step in range(4):
-                y = chart.top() + step * (chart.height() - 24) / 3
-                painter.drawLine(left, int(y), right, int(y))
-
-            all_values = self.primary + self.secondary
+            chart = self._chart_rect()
+            start, end = self.visible_range()
+            primary, secondary = self.primary[start:end], self.secondary[start:end]
+            columns = max(chart.width(), 1)
+            all_values = primary + secondary
             max_value = max(all_values) if all_values else 1.0
-            points_a = self._build_points(chart, self.primary, max_value)
-            points_b = self._build_points(chart, self.secondary, max_value)
+            count = end - start
+            step = chart.width() / max(count - 1, 1)
+            baseline = chart.bottom() - 24
+            height = chart.height() - 56
 
-            self._draw_curve(painter, points_a, QColor('#38bdf8'))
-            self._draw_curve(painter, points_b, QColor('#22c55e'))
-            for idx, label in enumerate(self.labels):
-                x = int(chart.left() + idx * (chart.width() / max(len(self.labels) - 1, 1))) if len(self.labels) > 1 else chart.center().x()
-                painter.setPen(QColor('#94a3b8'))
-                painter.setFont(QFont('Segoe UI', 8))
-                painter.drawText(QRect(x - 24, bottom + 8, 48, 22), Qt.AlignCenter, label)
+            def position(index: int, value: float) -> tuple[float, float]:
+                x = chart.center().x() if count == 1 else chart.left() + index * step
+                return x, baseline - (0 if max_value == 0 else value / max_value * height)
 
-            painter.setPen(QColor('#38bdf8'))
-            painter.setFont(QFont('Segoe UI', 9, QFont.Bold))
-            painter.drawText(rect.right() - 148, rect.top() + 24, '● duração (min)')
-            painter.setPen(QColor('#22c55e'))
-            painter.drawText(rect.right() - 148, rect.top() + 46, '● eficiência (%)')
+            painter.setPen(QPen(QColor('#334155'), 1))
+            for row in range(4):
+                y = chart.top() + row * (chart.height() - 24) / 3
+                painter.drawLine(chart.left() + 8, int(y), chart.right(), int(y))
 
-        def _build_points(self, rect: QRect, values: list[float], max_value: float) -> list[tuple[float, float]]:
-            if not values:
-                return []
-            if len(values) == 1:
-                return [(rect.center().x(), rect.bottom() - 24 - (values[0] / max_value * (rect.height() - 56)))]
-            points = []
-            for index, value in enumerate(values):
-                x = rect.left() + index * (rect.width() / (len(values) - 1))
-                y = rect.bottom() - 24 - (0 if max_value == 0 else value / max_value * (rect.height() - 56))
-                points.append((x, y))
-            return points
-
-        def _draw_curve(self, painter: QPainter, points: list[tuple[float, float]], color: QColor) -> None:
-            if not points:
+            for values, color in ((primary, QColor('#38bdf8')), (secondary, QColor('#22c55e'))):
+                points = [position(index, values[index]) for index in decimate_min_max(values, columns)]
+                markers = points if count * self.marker_spacing <= columns else []
+                self._draw_curve(painter, QPolygonF([QPointF(x, y) for x, y in points]), markers, color)
+
+            painter.setPen(QColor('#94a3b8'))
+            painter.setFont(chart_font(8))
+            stride = max(math.ceil(count * self.label_spacing / columns), 1)
+            for index in range(0, count, stride):
+                x = int(position(index, 0)[0])
+                painter.drawText(QRect(x - 24, baseline + 8, 48, 22), Qt.AlignCenter, self.labels[start + index])
+            if self.view:
+                painter.drawText(rect.adjusted(18, 36, -18, 0), f'{start + 1}–{end} de {len(self.labels)} pontos • duplo clique mostra tudo')
+
+        def _draw_curve(self, painter: QPainter, polyline: QPolygonF, markers: list[tuple[float, float]], color: QColor) -> None:
+            if polyline.isEmpty():
                 return
             pen = QPen(color, 3)
             pen.setCapStyle(Qt.RoundCap)
+            pen.setJoinStyle(Qt.RoundJoin)
             painter.setPen(pen)
-            path = QPainterPath()
-            path.moveTo(*points[0])
-            for point in points[1:]:
-                path.lineTo(*point)
-            painter.drawPath(path)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(polyline)
             painter.setPen(Qt.NoPen)
             painter.setBrush(color)
-            for x, y in points:
+            for x, y in markers:
                 painter.drawEllipse(int(x - 4), int(y - 4), 8, 8)
 
 
@@ -1028,15 +3162,209 @@ if HAS_QT:
             self.caption_label.setText(caption)
 
 
+    TableColumn = tuple[str, Callable[[Any], str], Callable[[Any], Any] | None]
+
+    class RowTableModel(QAbstractTableModel):
+        sort_role = Qt.UserRole
+
+        def __init__(self, columns: list[TableColumn], colors: dict[int, Callable[[Any], str | None]] | None = None, parent: Any = None):
+            super().__init__(parent)
+            self.columns = columns
+            self.colors = colors or {}
+            self.rows: Sequence[Any] = ()
+
+        def set_rows(self, rows: Sequence[Any]) -> None:
+            self.beginResetModel()
+            self.rows = rows
+            self.endResetModel()
+
+        def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.rows)
+
+        def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.columns)
+
+        def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+            if not index.isValid():
+                return None
+            row = self.rows[index.row()]
+            _, text, key = self.columns[index.column()]
+            if role == Qt.DisplayRole:
+                return text(row)
+            if role == self.sort_role:
+                return key(row) if key else text(row)
+            if role == Qt.ForegroundRole and index.column() in self.colors:
+                color = self.colors[index.column()](row)
+                return QColor(color) if color else None
+            return None
+
+        def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+            if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+                return self.columns[section][0]
+            return None
+
+    class RecordBrowserModel(QAbstractTableModel):
+        headers = ['#', 'Horário', 'Programa', 'Tópico', 'Nível', 'Categoria', 'Mensagem']
+
+        def __init__(self, parent: Any = None):
+            super().__init__(parent)
+            self.analysis: LogAnalysis | None = None
+            self.columns: RecordColumns | None = None
+            self.all_rows: Sequence[int] = ()
+            self.indices: Sequence[int] = ()
+            self.recent: int | None = None
+
+        def set_analysis(self, analysis: LogAnalysis | None, recent: int | None = None) -> None:
+            self.beginResetModel()
+            self.analysis = analysis
+            self.columns = analysis.columns if analysis else None
+            self.recent = recent
+            rows = analysis.rows() if analysis else ()
+            self.all_rows = self.indices = rows[-recent:] if recent else rows
+            self.endResetModel()
+
+        def set_filter(self, query: str = '', errors_only: bool = False) -> None:
+            if not self.columns:
+                return
+            self.beginResetModel()
+            start, end = self.analysis.window_start, self.analysis.window_end
+            if query:
+                indices = self.columns.search(query, start, end, errors_only=errors_only)
+            elif errors_only:
+                indices = self.columns.select(start=start, end=end, errors_only=True)
+            else:
+                indices = self.all_rows
+            if self.recent and indices is not self.all_rows:
+                indices = indices[bisect.bisect_left(indices, self.all_rows[0]):] if self.all_rows else []
+            self.indices = indices
+            self.endResetModel()
+
+        def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.indices)
+
+        def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self.headers)
+
+        def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+            if not index.isValid() or self.columns is None:
+                return None
+            row = self.indices[index.row()]
+            column = index.column()
+            if role == Qt.DisplayRole:
+                if column == 0:
+                    return str(self.columns.sequences[row])
+                if column == 1:
+                    return f'{self.columns.timestamp(row):%Y-%m-%d %H:%M:%S}'
+                if column == 2:
+                    session = self.analysis.session_of(row)
+                    return f'Prog. {session.index}' if session else '-'
+                if column == 3:
+                    return self.columns.topic(row)
+                if column == 4:
+                    return self.columns.level(row) or '-'
+                if column == 5:
+                    return self.columns.category(row)
+                return self.columns.message(row)[:300]
+            if role == Qt.ForegroundRole and self.columns.flags[row] & ERROR_FLAG:
+                return QColor('#f87171')
+            return None
+
+        def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+            if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+                return self.headers[section]
+            return None
+
+    class AnalysisLoader(QThread):
+        progressed = Signal(object)
+        loaded = Signal(object)
+        failed = Signal(str)
+        cancelled = Signal()
+
+        report_interval = 0.1
+
+        def __init__(self, path: str, options: dict[str, Any], parent: QWidget | None = None, target: Callable[..., Any] = analyze_file):
+            super().__init__(parent)
+            self.path = path
+            self.options = options
+            self.target = target
+            self.cancel_event = threading.Event()
+            self._last_report = 0.0
+
+        def cancel(self) -> None:
+            self.cancel_event.set()
+
+        def run(self) -> None:
+            try:
+                analysis = self.target(self.path, progress=self._report, cancel=self.cancel_event, **self.options)
+            except AnalysisCancelled:
+                self.cancelled.emit()
+            except Exception as exc:
+                self.failed.emit(str(exc))
+            else:
+                if self.cancel_event.is_set():
+                    self.cancelled.emit()
+                else:
+                    self.loaded.emit(analysis)
+
+        def _report(self, progress: AnalysisProgress) -> None:
+            now = time.monotonic()
+            if now - self._last_report >= self.report_interval:
+                self._last_report = now
+                self.progressed.emit(progress)
+
     class MonitorMainWindow(QMainWindow):
-        def __init__(self, initial_path: str | None = None):
+        trend_bucket_limit = 96
+        live_frame_ms = int(LIVE_FRAME_SECONDS * 1000)
+        live_recent_rows = 5000
+        live_full_frames = 10
+        live_full_share = 0.1
+
+        def __init__(
+            self,
+            initial_path: str | None = None,
+            mapped: bool = False,
+            lazy_json: bool = False,
+            follow: bool = False,
+            follow_interval: float = 2.0,
+            workers: int = 1,
+            cache: AnalysisCache | None = None,
+            record_filter: RecordFilter | None = None,
+            mqtt_settings: MqttSettings | None = None,
+            live: bool = False,
+        ):
             super().__init__()
             self.analysis: LogAnalysis | None = None
+            self.visible_analysis: LogAnalysis | None = None
+            self.time_window: tuple[datetime, datetime] | None = None
+            self.mapped = mapped
+            self.lazy_json = lazy_json
+            self.workers = workers
+            self.cache = cache
+            self.record_filter = record_filter
+            self.loader: AnalysisLoader | None = None
+            self.follower: LogFollower | None = None
+            self.follow_analyzer: MonitorAnalyzer | None = None
+            self.follow_timer = QTimer(self)
+            self.follow_timer.setInterval(int(follow_interval * 1000))
+            self.follow_timer.timeout.connect(self._poll_follow)
+            self.mqtt_settings = mqtt_settings
+            self.live_source: MqttLiveSource | None = None
+            self.live_rate = (0, 0.0)
+            self.live_frames = 0
+            self.live_next_full = 1
+            self.stale_tabs: set[int] = set()
+            self.live_timer = QTimer(self)
+            self.live_timer.setInterval(self.live_frame_ms)
+            self.live_timer.timeout.connect(self._poll_live)
             self.setWindowTitle('APP Monitor Next | Phoenix Command Center')
             self.resize(1680, 1040)
             self.setStyleSheet(APP_STYLESHEET)
             self._build_ui()
-            if initial_path:
+            if live and mqtt_settings:
+                self.start_live(mqtt_settings)
+            elif initial_path and follow:
+                self.follow_file(initial_path)
+            elif initial_path:
                 self.load_file(initial_path)
 
         def _build_ui(self) -> None:
@@ -1066,15 +3394,43 @@ if HAS_QT:
             open_button.clicked.connect(self.choose_file)
             export_button = QPushButton('Exportar JSON')
             export_button.clicked.connect(self.export_summary)
+            self.follow_button = QPushButton('Seguir log')
+            self.follow_button.setCheckable(True)
+            self.follow_button.toggled.connect(self.toggle_follow)
+            self.cancel_button = QPushButton('Cancelar')
+            self.cancel_button.clicked.connect(self.cancel_load)
+            self.cancel_button.hide()
+            self.broker_edit = QLineEdit(self.mqtt_settings.label if self.mqtt_settings else '')
+            self.broker_edit.setPlaceholderText('broker:porta')
+            self.broker_edit.setFixedWidth(180)
+            self.live_button = QPushButton('Ao vivo')
+            self.live_button.setCheckable(True)
+            self.live_button.toggled.connect(self.toggle_live)
+            self.live_label = QLabel()
+            self.live_label.setStyleSheet('font-size: 12px; color: #93c5fd; background: transparent;')
+            self.live_label.hide()
             button_row.addWidget(open_button)
             button_row.addWidget(export_button)
+            button_row.addWidget(self.follow_button)
+            button_row.addWidget(self.cancel_button)
+            button_row.addSpacing(12)
+            button_row.addWidget(self.broker_edit)
+            button_row.addWidget(self.live_button)
+            button_row.addWidget(self.live_label)
             button_row.addStretch(1)
+            self.load_progress = QProgressBar()
+            self.load_progress.setRange(0, 1000)
+            self.load_progress.setTextVisible(False)
+            self.load_progress.setFixedHeight(6)
+            self.load_progress.hide()
 
             info_col.addWidget(title)
             info_col.addWidget(subtitle)
             info_col.addSpacing(10)
             info_col.addLayout(button_row)
+            info_col.addWidget(self.load_progress)
             info_col.addWidget(self.file_label)
+            info_col.addLayout(self._build_window_row())
             hero_layout.addLayout(info_col, 3)
 
             accent = GlassFrame('AccentCard')
@@ -1121,6 +3477,35 @@ if HAS_QT:
             self.tabs.addTab(self.sessions_tab, 'Programas')
             self.tabs.addTab(self.alerts_tab, 'Alertas e timeline')
             self.tabs.addTab(self.deep_tab, 'Inventário técnico')
+            self.records_tab = self._build_records_tab()
+            self.tabs.addTab(self.records_tab, 'Registros')
+            self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        def _build_window_row(self) -> QHBoxLayout:
+            row = QHBoxLayout()
+            label = QLabel('Janela de tempo')
+            label.setStyleSheet('font-size: 12px; color: #94a3b8; background: transparent;')
+            self.window_start_edit = QDateTimeEdit()
+            self.window_end_edit = QDateTimeEdit()
+            self.window_timer = QTimer(self)
+            self.window_timer.setSingleShot(True)
+            self.window_timer.setInterval(200)
+            self.window_timer.timeout.connect(self._apply_time_window)
+            for edit in (self.window_start_edit, self.window_end_edit):
+                edit.setDisplayFormat('dd/MM/yyyy HH:mm:ss')
+                edit.setCalendarPopup(True)
+                edit.setEnabled(False)
+                edit.dateTimeChanged.connect(self.window_timer.start)
+            self.window_reset_button = QPushButton('Log inteiro')
+            self.window_reset_button.setEnabled(False)
+            self.window_reset_button.clicked.connect(self.reset_time_window)
+            row.addWidget(label)
+            row.addWidget(self.window_start_edit)
+            row.addWidget(QLabel('→'))
+            row.addWidget(self.window_end_edit)
+            row.addWidget(self.window_reset_button)
+            row.addStretch(1)
+            return row
 
         def _build_overview_tab(self) -> QWidget:
             page = QWidget()
@@ -1157,6 +3542,12 @@ if HAS_QT:
             chart_row.addWidget(self.state_chart, 2)
             chart_row.addWidget(self.category_chart, 2)
             layout.addLayout(chart_row)
+            self.health_trend = TrendLines(
+                'Saúde x eficiência de arco ao longo do tempo',
+                legends=('score (0-100)', 'eficiência (%)'),
+                empty_text='Sem registros suficientes para desenhar a evolução.',
+            )
+            layout.addWidget(self.health_trend)
             return page
 
         def _build_sessions_tab(self) -> QWidget:
@@ -1170,8 +3561,17 @@ if HAS_QT:
             session_layout.setContentsMargins(18, 18, 18, 18)
             label = QLabel('Programas detectados')
             label.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.session_table = self._create_table(['#', 'Início', 'Duração', 'Modo', 'Arcos', 'Eficiência', 'Status', 'Erros'])
-            self.session_table.itemSelectionChanged.connect(self.on_session_selected)
+            self.session_table = self._create_table([
+                ('#', lambda session: str(session.index), lambda session: session.index),
+                ('Início', lambda session: session.start.strftime('%H:%M:%S'), lambda session: session.start.isoformat()),
+                ('Duração', lambda session: format_timedelta(session.duration), lambda session: session.duration.total_seconds()),
+                ('Modo', lambda session: session.cut_mode or '-', None),
+                ('Arcos', lambda session: str(session.arc_openings), lambda session: session.arc_openings),
+                ('Eficiência', lambda session: f'{session.arc_efficiency * 100:.1f}%', lambda session: session.arc_efficiency),
+                ('Status', lambda session: session.status, None),
+                ('Erros', lambda session: str(len(session.errors)), lambda session: len(session.errors)),
+            ])
+            self.session_table.selectionModel().selectionChanged.connect(self.on_session_selected)
             session_layout.addWidget(label)
             session_layout.addWidget(self.session_table)
 
@@ -1189,9 +3589,13 @@ if HAS_QT:
             event_card = GlassFrame()
             event_layout = QVBoxLayout(event_card)
             event_layout.setContentsMargins(18, 18, 18, 18)
-            event_title = QLabel('Últimos eventos da sessão')
+            event_title = QLabel('Eventos da sessão')
             event_title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.session_events = self._create_table(['Horário', 'Categoria', 'Mensagem'])
+            self.session_events = self._create_table([
+                ('Horário', lambda event: event.timestamp.strftime('%H:%M:%S'), lambda event: event.timestamp.isoformat()),
+                ('Categoria', self._categorize, None),
+                ('Mensagem', lambda event: event.message[:180], None),
+            ])
             event_layout.addWidget(event_title)
             event_layout.addWidget(self.session_events)
 
@@ -1213,8 +3617,15 @@ if HAS_QT:
             rec_layout.setContentsMargins(18, 18, 18, 18)
             rec_title = QLabel('Ações recomendadas')
             rec_title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.recommendations_table = self._create_table(['Prioridade', 'Título', 'Métrica'])
-            self.recommendations_table.itemSelectionChanged.connect(self.on_recommendation_selected)
+            self.recommendations_table = self._create_table(
+                [
+                    ('Prioridade', lambda item: item.priority, lambda item: list(PRIORITY_COLORS).index(item.priority) if item.priority in PRIORITY_COLORS else len(PRIORITY_COLORS)),
+                    ('Título', lambda item: item.title, None),
+                    ('Métrica', lambda item: item.metric, None),
+                ],
+                colors={0: lambda item: PRIORITY_COLORS.get(item.priority, '#e2e8f0')},
+            )
+            self.recommendations_table.selectionModel().selectionChanged.connect(self.on_recommendation_selected)
             self.recommendation_details = QPlainTextEdit()
             self.recommendation_details.setReadOnly(True)
             rec_layout.addWidget(rec_title)
@@ -1226,8 +3637,14 @@ if HAS_QT:
             err_layout.setContentsMargins(18, 18, 18, 18)
             err_title = QLabel('Falhas e incidentes')
             err_title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.error_table = self._create_table(['Horário', 'Origem', 'Categoria', 'Mensagem'])
+            self.error_table = self._create_table([
+                ('Horário', lambda row: row[0].strftime('%Y-%m-%d %H:%M:%S'), None),
+                ('Origem', lambda row: row[1], None),
+                ('Categoria', lambda row: self._categorize(row[2]), None),
+                ('Mensagem', lambda row: row[2].message, None),
+            ])
             err_layout.addWidget(err_title)
+            err_layout.addWidget(self._create_filter_edit(self.error_table, 'Filtrar falhas…'))
             err_layout.addWidget(self.error_table)
 
             upper.addWidget(recommendations, 2)
@@ -1239,8 +3656,13 @@ if HAS_QT:
             lower_layout.setContentsMargins(18, 18, 18, 18)
             lower_title = QLabel('Timeline de estados e serviços')
             lower_title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.timeline_table = self._create_table(['Horário', 'Tipo', 'Valor'])
+            self.timeline_table = self._create_table([
+                ('Horário', lambda row: row[0].strftime('%Y-%m-%d %H:%M:%S'), None),
+                ('Tipo', lambda row: row[1], None),
+                ('Valor', lambda row: row[2], None),
+            ])
             lower_layout.addWidget(lower_title)
+            lower_layout.addWidget(self._create_filter_edit(self.timeline_table, 'Filtrar timeline…'))
             lower_layout.addWidget(self.timeline_table)
             layout.addWidget(lower, 2)
             return page
@@ -1256,7 +3678,11 @@ if HAS_QT:
             left_layout.setContentsMargins(18, 18, 18, 18)
             title = QLabel('Inventário e versões')
             title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.version_table = self._create_table(['Horário', 'Item', 'Valor'])
+            self.version_table = self._create_table([
+                ('Horário', lambda entry: entry.timestamp.strftime('%H:%M:%S'), lambda entry: entry.timestamp.isoformat()),
+                ('Item', lambda entry: entry.label, None),
+                ('Valor', lambda entry: entry.value, None),
+            ])
             left_layout.addWidget(title)
             left_layout.addWidget(self.version_table)
 
@@ -1266,7 +3692,11 @@ if HAS_QT:
             top_layout.setContentsMargins(18, 18, 18, 18)
             top_title = QLabel('Top tópicos e módulos')
             top_title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
-            self.topic_table = self._create_table(['Tipo', 'Nome', 'Ocorrências'])
+            self.topic_table = self._create_table([
+                ('Tipo', lambda row: row[0], None),
+                ('Nome', lambda row: row[1], None),
+                ('Ocorrências', lambda row: str(row[2]), lambda row: row[2]),
+            ])
             top_layout.addWidget(top_title)
             top_layout.addWidget(self.topic_table)
 
@@ -1286,17 +3716,101 @@ if HAS_QT:
             layout.addLayout(right, 2)
             return page
 
-        def _create_table(self, headers: list[str]) -> QTableWidget:
-            table = QTableWidget(0, len(headers))
-            table.setHorizontalHeaderLabels(headers)
+        def _build_records_tab(self) -> QWidget:
+            page = QWidget()
+            layout = QVBoxLayout(page)
+            layout.setContentsMargins(16, 16, 16, 16)
+            layout.setSpacing(16)
+
+            card = GlassFrame()
+            card_layout = QVBoxLayout(card)
+            card_layout.setContentsMargins(18, 18, 18, 18)
+            title = QLabel('Todos os registros')
+            title.setStyleSheet('font-size: 16px; font-weight: 800; color: white; background: transparent;')
+            filter_row = QHBoxLayout()
+            self.browser_search = QLineEdit()
+            self.browser_search.setPlaceholderText('Buscar palavras ou "frase exata" em mensagens, tópicos e categorias…')
+            self.browser_search.setClearButtonEnabled(True)
+            self.browser_errors_only = QCheckBox('Só erros')
+            self.browser_count = QLabel('')
+            self.browser_count.setStyleSheet('font-size: 12px; color: #94a3b8; background: transparent;')
+            filter_row.addWidget(self.browser_search, 1)
+            filter_row.addWidget(self.browser_errors_only)
+            filter_row.addWidget(self.browser_count)
+            self.browser_filter_timer = QTimer(self)
+            self.browser_filter_timer.setSingleShot(True)
+            self.browser_filter_timer.setInterval(250)
+            self.browser_filter_timer.timeout.connect(self._apply_browser_filter)
+            self.browser_search.textChanged.connect(self.browser_filter_timer.start)
+            self.browser_errors_only.toggled.connect(self._apply_browser_filter)
+
+            self.record_browser_model = RecordBrowserModel(self)
+            self.record_browser = QTableView()
+            self.record_browser.setModel(self.record_browser_model)
+            self._configure_view(self.record_browser)
+            header = self.record_browser.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.Interactive)
+            header.setStretchLastSection(True)
+            for column, width in enumerate([80, 160, 90, 220, 100, 170]):
+                header.resizeSection(column, width)
+
+            card_layout.addWidget(title)
+            card_layout.addLayout(filter_row)
+            card_layout.addWidget(self.record_browser)
+            layout.addWidget(card)
+            return page
+
+        def _create_table(self, columns: list[TableColumn], colors: dict[int, Callable[[Any], str | None]] | None = None) -> QTableView:
+            model = RowTableModel(columns, colors, self)
+            proxy = QSortFilterProxyModel(self)
+            proxy.setSourceModel(model)
+            proxy.setSortRole(RowTableModel.sort_role)
+            proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+            proxy.setFilterKeyColumn(-1)
+            table = QTableView()
+            table.setModel(proxy)
+            self._configure_view(table)
+            table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            table.setSortingEnabled(True)
+            return table
+
+        def _configure_view(self, table: QTableView) -> None:
             table.setAlternatingRowColors(True)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
-            table.setSelectionMode(QTableWidget.SingleSelection)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)
+            table.setSelectionBehavior(QTableView.SelectRows)
+            table.setSelectionMode(QTableView.SingleSelection)
+            table.setEditTriggers(QTableView.NoEditTriggers)
+            table.setWordWrap(False)
             table.verticalHeader().setVisible(False)
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            table.verticalHeader().setDefaultSectionSize(34)
             table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
             table.horizontalHeader().setMinimumSectionSize(80)
-            return table
+
+        def _create_filter_edit(self, table: QTableView, placeholder: str) -> QLineEdit:
+            edit = QLineEdit()
+            edit.setPlaceholderText(placeholder)
+            edit.setClearButtonEnabled(True)
+            edit.textChanged.connect(table.model().setFilterFixedString)
+            return edit
+
+        def _set_rows(self, table: QTableView, rows: Sequence[Any]) -> None:
+            table.model().sourceModel().set_rows(rows)
+            table.clearSelection()
+
+        def _selected_row(self, table: QTableView) -> Any | None:
+            index = table.currentIndex()
+            if not index.isValid():
+                return None
+            source = table.model().sourceModel()
+            row = table.model().mapToSource(index).row()
+            return source.rows[row] if 0 <= row < len(source.rows) else None
+
+        def _apply_browser_filter(self) -> None:
+            self.record_browser_model.set_filter(self.browser_search.text().strip(), self.browser_errors_only.isChecked())
+            model = self.record_browser_model
+            total = len(model.all_rows)
+            recent = f' (últimos de {len(model.columns)})' if model.recent and model.columns is not None and len(model.columns) > total else ''
+            self.browser_count.setText(f'{model.rowCount()} de {total} registros{recent}')
 
         def choose_file(self) -> None:
             path, _ = QFileDialog.getOpenFileName(self, 'Selecionar log', str(Path.cwd()), 'Logs (*.txt *.log *.json);;Todos (*.*)')
@@ -1304,20 +3818,313 @@ if HAS_QT:
                 self.load_file(path)
 
         def load_file(self, path: str) -> None:
-            try:
-                records = LogParser(path).parse()
-                analysis = MonitorAnalyzer(records, path).analyze()
-            except Exception as exc:
-                QMessageBox.critical(self, 'Erro ao carregar', str(exc))
+            self._stop_follow()
+            self._stop_live()
+            self.cancel_load()
+            options = {
+                'workers': self.workers,
+                'mapped': self.mapped,
+                'lazy_json': self.lazy_json,
+                'retain_records': False,
+                'cache': self.cache,
+                'record_filter': self.record_filter,
+            }
+            self._start_loader(AnalysisLoader(path, options, self), self._on_loaded)
+
+        def _start_loader(self, loader: 'AnalysisLoader', on_loaded: Callable[['AnalysisLoader', Any], None]) -> None:
+            self.loader = loader
+            path = loader.path
+            loader.progressed.connect(lambda progress: self._on_load_progress(loader, progress))
+            loader.loaded.connect(lambda result: on_loaded(loader, result))
+            loader.failed.connect(lambda message: self._on_load_failed(loader, message))
+            loader.cancelled.connect(lambda: self._on_load_cancelled(loader))
+            loader.finished.connect(loader.deleteLater)
+            self.file_label.setText(f'Carregando: {path}')
+            self.hero_badge.setText('Carregando log…')
+            self.hero_meta.setText('Os indicadores aparecem aqui conforme o arquivo é lido.')
+            self.load_progress.setValue(0)
+            self.load_progress.show()
+            self.cancel_button.show()
+            loader.start()
+
+        def cancel_load(self) -> None:
+            if self.loader:
+                self.loader.cancel()
+                self._end_load()
+
+        def _end_load(self) -> None:
+            self.loader = None
+            self.load_progress.hide()
+            self.cancel_button.hide()
+
+        def _on_load_progress(self, loader: AnalysisLoader, progress: AnalysisProgress) -> None:
+            if loader is not self.loader:
                 return
+            self.load_progress.setValue(int(progress.fraction * 1000))
+            self.hero_badge.setText(f'Carregando… {progress.record_count} registros • {progress.session_count} programas até aqui')
+            window = ''
+            if progress.first_timestamp and progress.last_timestamp:
+                window = f'Janela: {progress.first_timestamp:%d/%m/%Y %H:%M:%S} → {progress.last_timestamp:%d/%m/%Y %H:%M:%S} | '
+            self.hero_meta.setText(f'{window}{progress.bytes_read / 1048576:.1f} de {progress.total_bytes / 1048576:.1f} MB lidos')
+
+        def _on_loaded(self, loader: AnalysisLoader, analysis: LogAnalysis) -> None:
+            if loader is not self.loader:
+                return
+            self._end_load()
+            self.time_window = None
+            self._apply_analysis(analysis)
 
+        def _on_load_failed(self, loader: AnalysisLoader, message: str) -> None:
+            if loader is not self.loader:
+                return
+            self._end_load()
+            if loader.target is catch_up_follow:
+                self._set_follow_checked(False)
+            self._restore_summary()
+            QMessageBox.critical(self, 'Erro ao carregar', message)
+
+        def _on_load_cancelled(self, loader: AnalysisLoader) -> None:
+            if loader is self.loader:
+                self._end_load()
+            if self.loader is None:
+                if loader.target is catch_up_follow and not self.follower:
+                    self._set_follow_checked(False)
+                self._restore_summary()
+
+        def _restore_summary(self) -> None:
+            if self.analysis:
+                self._apply_analysis(self.analysis)
+            else:
+                self.file_label.setText('Nenhum log carregado.')
+                self.hero_badge.setText('Pronto para analisar produção, estados e incidentes.')
+                self.hero_meta.setText('Carregue um log para preencher as visões executiva, técnica e operacional.')
+
+        def closeEvent(self, event: Any) -> None:
+            self._stop_live()
+            self.cancel_load()
+            for loader in self.findChildren(AnalysisLoader):
+                loader.cancel()
+                loader.wait()
+            super().closeEvent(event)
+
+        def follow_file(self, path: str | Path) -> None:
+            self._stop_follow()
+            self._stop_live()
+            self.cancel_load()
+            options = {'lazy_json': self.lazy_json, 'cache': self.cache, 'record_filter': self.record_filter}
+            self._start_loader(AnalysisLoader(str(path), options, self, target=catch_up_follow), self._on_follow_ready)
+            self._set_follow_checked(True)
+
+        def _on_follow_ready(self, loader: AnalysisLoader, result: tuple[LogFollower, MonitorAnalyzer]) -> None:
+            if loader is not self.loader:
+                return
+            self._end_load()
+            self.follower, self.follow_analyzer = result
+            self.time_window = None
+            self.live_frames = 0
+            self.live_next_full = 1
+            self._apply_analysis(self.follow_analyzer.snapshot())
+            self.follow_timer.start()
+
+        def toggle_follow(self, enabled: bool) -> None:
+            if not enabled:
+                self._stop_follow()
+                return
+            if not self.analysis or not self.analysis.source_path.is_file():
+                QMessageBox.information(self, 'Sem dados', 'Carregue um arquivo antes de seguir o log.')
+                self.follow_button.setChecked(False)
+                return
+            self.follow_file(self.analysis.source_path)
+
+        def _stop_follow(self) -> None:
+            self.follow_timer.stop()
+            if self.loader and self.loader.target is catch_up_follow:
+                self.cancel_load()
+            self.follower = None
+            self.follow_analyzer = None
+            self._set_follow_checked(False)
+
+        def _set_follow_checked(self, checked: bool) -> None:
+            self.follow_button.blockSignals(True)
+            self.follow_button.setChecked(checked)
+            self.follow_button.blockSignals(False)
+
+        def _poll_follow(self) -> None:
+            if not self.follower or not self.follow_analyzer:
+                return
+            try:
+                new_records = self.follower.poll()
+            except OSError as exc:
+                self._stop_follow()
+                QMessageBox.critical(self, 'Erro ao seguir log', str(exc))
+                return
+            if not new_records:
+                return
+            self.follow_analyzer.feed_many(new_records)
+            self._apply_frame(self.follow_analyzer.snapshot())
+
+        def start_live(self, settings: MqttSettings) -> None:
+            self._stop_follow()
+            self._stop_live()
+            self.cancel_load()
+            ingest = LiveIngest(settings.label, lazy_json=self.lazy_json, record_filter=self.record_filter)
+            source = MqttLiveSource(settings, ingest)
+            try:
+                source.start()
+            except (OSError, RuntimeError) as exc:
+                self._set_live_checked(False)
+                QMessageBox.critical(self, 'Erro ao conectar', str(exc))
+                return
+            self.mqtt_settings = settings
+            self.live_source = source
+            self.live_rate = (0, time.monotonic())
+            self.live_frames = 0
+            self.live_next_full = 1
+            self.time_window = None
+            self.broker_edit.setText(settings.label)
+            self.broker_edit.setEnabled(False)
+            self._set_live_checked(True)
+            self.live_label.show()
+            self._poll_live()
+            self.live_timer.start()
+
+        def toggle_live(self, enabled: bool) -> None:
+            if not enabled:
+                self._stop_live()
+                return
+            base = self.mqtt_settings
+            options = {'topic': base.topic, 'username': base.username, 'password': base.password} if base else {}
+            try:
+                settings = MqttSettings.parse(self.broker_edit.text(), **options)
+            except ValueError as exc:
+                self._set_live_checked(False)
+                QMessageBox.information(self, 'Broker inválido', str(exc))
+                return
+            self.start_live(settings)
+
+        def _stop_live(self) -> None:
+            self.live_timer.stop()
+            if self.live_source:
+                self.live_source.stop()
+                self.live_source = None
+            self.broker_edit.setEnabled(True)
+            self.live_label.hide()
+            self._set_live_checked(False)
+
+        def _set_live_checked(self, checked: bool) -> None:
+            self.live_button.blockSignals(True)
+            self.live_button.setChecked(checked)
+            self.live_button.blockSignals(False)
+
+        def _poll_live(self) -> None:
+            if not self.live_source:
+                return
+            ingest = self.live_source.ingest
+            if ingest.drain():
+                self._apply_frame(ingest.analyzer.snapshot())
+            now = time.monotonic()
+            previous_count, previous_time = self.live_rate
+            rate = (ingest.received - previous_count) / max(now - previous_time, 1e-6)
+            self.live_rate = (ingest.received, now)
+            dropped = f' • {ingest.dropped} descartadas' if ingest.dropped else ''
+            self.live_label.setText(f'{self.live_source.status} • {ingest.received} mensagens • {rate:.0f}/s{dropped}')
+
+        def _apply_analysis(self, analysis: LogAnalysis) -> None:
             self.analysis = analysis
-            self.file_label.setText(f'Arquivo ativo: {analysis.source_path}')
+            self._sync_window_edits(analysis)
+            self._show_analysis(analysis.window(*self.time_window) if self.time_window else analysis)
+
+        def _apply_frame(self, analysis: LogAnalysis) -> None:
+            self.live_frames += 1
+            full = self.live_frames >= self.live_next_full
+            started = time.perf_counter()
+            self._apply_live_analysis(analysis, full)
+            if full:
+                cost = time.perf_counter() - started
+                frames = math.ceil(cost / (self.live_full_share * LIVE_FRAME_SECONDS))
+                self.live_next_full = self.live_frames + max(self.live_full_frames, frames)
+
+        def _apply_live_analysis(self, analysis: LogAnalysis, full: bool) -> None:
+            # Mensagens ao vivo chegam em ordem de recebimento, então primeiro e último horário
+            # já são os limites e o índice ordenado das colunas não precisa ser refeito a cada quadro.
+            self.analysis = analysis
+            self._sync_window_edits(analysis, (analysis.first_timestamp, analysis.last_timestamp))
+            self.visible_analysis = analysis.window(*self.time_window) if self.time_window else analysis
+            self._show_header(self.visible_analysis)
+            self.stale_tabs = set(range(self.tabs.count()))
+            self._refresh_tab(self.tabs.currentIndex(), full)
+
+        def _sync_window_edits(self, analysis: LogAnalysis, bounds: tuple[datetime, datetime] | None = None) -> None:
+            first, last = (value.replace(microsecond=0) for value in bounds or analysis.columns.time_bounds())
+            for edit in (self.window_start_edit, self.window_end_edit):
+                edit.blockSignals(True)
+                edit.setDateTimeRange(first, last)
+                edit.setEnabled(True)
+            if self.time_window is None:
+                self.window_start_edit.setDateTime(first)
+                self.window_end_edit.setDateTime(last)
+            for edit in (self.window_start_edit, self.window_end_edit):
+                edit.blockSignals(False)
+            self.window_reset_button.setEnabled(True)
+
+        def _apply_time_window(self) -> None:
+            if not self.analysis:
+                return
+            start = self.window_start_edit.dateTime().toPython().replace(microsecond=0)
+            end = self.window_end_edit.dateTime().toPython().replace(microsecond=0)
+            first, last = self.analysis.columns.time_bounds()
+            if start <= first and end >= last.replace(microsecond=0):
+                self.time_window = None
+                self._show_analysis(self.analysis)
+                return
+            self.time_window = (start, end + timedelta(seconds=1))
+            self._show_analysis(self.analysis.window(*self.time_window))
+
+        def reset_time_window(self) -> None:
+            self.time_window = None
+            if self.analysis:
+                self._apply_analysis(self.analysis)
+
+        def _show_analysis(self, analysis: LogAnalysis) -> None:
+            self.visible_analysis = analysis
+            self._show_header(analysis)
+            self._refresh_overview(analysis)
+            self._refresh_sessions(analysis)
+            self._refresh_alerts(analysis)
+            self._refresh_deep(analysis)
+            self._refresh_records(analysis)
+            self.stale_tabs.clear()
+
+        def _refresh_tab(self, index: int, full: bool = True) -> None:
+            analysis = self.visible_analysis
+            if analysis is None:
+                return
+            if index == 0:
+                self._refresh_overview(analysis, trend=full)
+            elif index == 1:
+                self._refresh_sessions(analysis)
+            elif index == 2:
+                self._refresh_alerts(analysis, timeline=full)
+            elif index == 3:
+                self._refresh_deep(analysis)
+            elif index == 4:
+                self._refresh_records(analysis)
+            if full:
+                self.stale_tabs.discard(index)
+
+        def _on_tab_changed(self, index: int) -> None:
+            if index in self.stale_tabs:
+                self._refresh_tab(index)
+
+        def _show_header(self, analysis: LogAnalysis) -> None:
+            file_text = f'Ao vivo: {self.live_source.settings.label}' if self.live_source else f'Arquivo ativo: {analysis.source_path}'
+            if analysis.record_filter:
+                file_text += f' | Filtro: {format_record_filter(analysis.record_filter)}'
+            if analysis.is_window:
+                file_text += f' | Recorte: {analysis.record_count} de {len(analysis.columns)} registros'
+            self.file_label.setText(file_text)
             self.hero_badge.setText(f'{analysis.total_programs} programas • {analysis.total_errors} erros • score {analysis.health_score}/100')
-            self.hero_meta.setText(
-                f'Janela: {analysis.records[0].timestamp:%d/%m/%Y %H:%M:%S} → {analysis.records[-1].timestamp:%d/%m/%Y %H:%M:%S} | '
-                f'Tempo de arco: {format_timedelta(analysis.total_arc_time)}'
-            )
+            self.hero_meta.setText(f'Janela: {format_time_span(analysis)} | Tempo de arco: {format_timedelta(analysis.total_arc_time)}')
 
             services_total = max(len(analysis.service_status_summary), 1)
             services_online = sum(1 for status in analysis.service_status_summary.values() if status == 'Online')
@@ -1326,15 +4133,15 @@ if HAS_QT:
             self.stat_cards[2].update_content(f'{analysis.total_errors}/{analysis.total_warnings}', 'Primeiro número = erros. Segundo número = warnings associados às sessões.')
             self.stat_cards[3].update_content(f'{services_online}/{services_total}', format_services_line(analysis.service_status_summary))
 
-            self._refresh_overview(analysis)
-            self._refresh_sessions(analysis)
-            self._refresh_alerts(analysis)
-            self._refresh_deep(analysis)
+        def _refresh_records(self, analysis: LogAnalysis) -> None:
+            growing = self.live_source or self.follower
+            self.record_browser_model.set_analysis(analysis, recent=self.live_recent_rows if growing else None)
+            self._apply_browser_filter()
 
-        def _refresh_overview(self, analysis: LogAnalysis) -> None:
+        def _refresh_overview(self, analysis: LogAnalysis, trend: bool = True) -> None:
             executive_lines = [
                 'Resumo executivo',
-                f'• Janela analisada: {analysis.records[0].timestamp:%d/%m/%Y %H:%M:%S} até {analysis.records[-1].timestamp:%d/%m/%Y %H:%M:%S}.',
+                f'• Janela analisada: {format_time_span(analysis, " até ")}.',
                 f'• {analysis.total_programs} programas identificados, com {analysis.completed_programs} finalizados.',
                 f'• Tempo total de arco: {format_timedelta(analysis.total_arc_time)} e eficiência média de {analysis.arc_efficiency * 100:.1f}%.',
                 f'• Foram detectados {analysis.total_errors} erros e {analysis.total_warnings} warnings.',
@@ -1381,70 +4188,67 @@ if HAS_QT:
                 (label, float(value), CATEGORY_COLORS[index % len(CATEGORY_COLORS)])
                 for index, (label, value) in enumerate(category_items)
             ])
+            if trend:
+                self._refresh_health_trend(analysis)
 
-        def _refresh_sessions(self, analysis: LogAnalysis) -> None:
-            self._fill_table(
-                self.session_table,
-                [
-                    [
-                        str(session.index),
-                        session.start.strftime('%H:%M:%S'),
-                        format_timedelta(session.duration),
-                        session.cut_mode or '-',
-                        str(session.arc_openings),
-                        f'{session.arc_efficiency * 100:.1f}%',
-                        session.status,
-                        str(len(session.errors)),
-                    ]
-                    for session in analysis.sessions
-                ],
+        def _refresh_health_trend(self, analysis: LogAnalysis) -> None:
+            if not analysis.record_count:
+                self.health_trend.set_data([], [], [])
+                return
+            first, last = (analysis.first_timestamp, analysis.last_timestamp) if analysis.is_window else analysis.columns.time_bounds()
+            bucket = next(
+                (name for name in ('minuto', 'hora') if (last - first) // ROLLUP_BUCKETS[name][0] < self.trend_bucket_limit),
+                'turno',
+            )
+            series = analysis.rollup(bucket).series()
+            label_format = '%d/%m %Hh' if bucket == 'turno' else '%H:%M'
+            self.health_trend.title = f'Saúde x eficiência de arco por {bucket}'
+            self.health_trend.set_data(
+                [totals.start.strftime(label_format) for totals in series],
+                [float(totals.health_score) for totals in series],
+                [totals.arc_efficiency * 100 for totals in series],
             )
+
+        def _refresh_sessions(self, analysis: LogAnalysis) -> None:
+            self._set_rows(self.session_table, analysis.sessions)
             self.session_details.setPlainText('Selecione um programa para ver os detalhes operacionais.')
-            self._fill_table(self.session_events, [])
+            self._set_rows(self.session_events, ())
             if analysis.sessions:
                 self.session_table.selectRow(0)
                 self.on_session_selected()
 
-        def _refresh_alerts(self, analysis: LogAnalysis) -> None:
-            self._fill_table(
-                self.recommendations_table,
-                [[item.priority, item.title, item.metric] for item in analysis.recommendations],
-                color_column=0,
-            )
-            rows: list[list[str]] = []
+        def _refresh_alerts(self, analysis: LogAnalysis, timeline: bool = True) -> None:
+            self._set_rows(self.recommendations_table, analysis.recommendations)
+            error_rows: list[tuple[datetime, str, LogRecord]] = []
             for session in analysis.sessions:
-                for error in session.errors:
-                    rows.append([error.timestamp.strftime('%Y-%m-%d %H:%M:%S'), f'Prog. {session.index}', self._categorize(error), error.message])
-            for error in analysis.unassigned_errors:
-                rows.append([error.timestamp.strftime('%Y-%m-%d %H:%M:%S'), 'Fora prog.', self._categorize(error), error.message])
-            rows.sort(key=lambda row: row[0])
-            self._fill_table(self.error_table, rows)
-
-            timeline_rows = [[event.timestamp.strftime('%Y-%m-%d %H:%M:%S'), 'Serviço', f'{event.service}: {event.status}'] for event in analysis.service_status_history]
-            timeline_rows.extend([[timestamp.strftime('%Y-%m-%d %H:%M:%S'), 'CNC State', state] for timestamp, state in analysis.state_history[-40:]])
-            timeline_rows.sort(key=lambda row: row[0])
-            self._fill_table(self.timeline_table, timeline_rows)
+                origin = f'Prog. {session.index}'
+                error_rows.extend((error.timestamp, origin, error) for error in session.errors)
+            error_rows.extend((error.timestamp, 'Fora prog.', error) for error in analysis.unassigned_errors)
+            error_rows.sort(key=lambda row: row[0])
+            self._set_rows(self.error_table, error_rows)
+
+            if timeline:
+                timeline_rows = list(heapq.merge(
+                    ((event.timestamp, 'Serviço', f'{event.service}: {event.status}') for event in analysis.service_status_history),
+                    ((timestamp, 'CNC State', state) for timestamp, state in analysis.state_history),
+                    key=lambda row: row[0],
+                ))
+                self._set_rows(self.timeline_table, timeline_rows)
             self.recommendation_details.setPlainText('Selecione uma recomendação para abrir a explicação e a métrica gatilho.')
             if analysis.recommendations:
                 self.recommendations_table.selectRow(0)
                 self.on_recommendation_selected()
 
         def _refresh_deep(self, analysis: LogAnalysis) -> None:
-            seen: set[tuple[str, str]] = set()
-            version_rows: list[list[str]] = []
+            unique_versions: dict[tuple[str, str], VersionEntry] = {}
             for entry in analysis.version_inventory:
-                key = (entry.label, entry.value)
-                if key in seen:
-                    continue
-                seen.add(key)
-                version_rows.append([entry.timestamp.strftime('%H:%M:%S'), entry.label, entry.value])
-                if len(version_rows) >= 30:
-                    break
-            self._fill_table(self.version_table, version_rows)
+                unique_versions.setdefault((entry.label, entry.value), entry)
+            version_rows = list(unique_versions.values())
+            self._set_rows(self.version_table, version_rows)
 
-            topic_rows = [[ 'Tópico', name, str(count)] for name, count in analysis.topic_counts.most_common(8)]
-            topic_rows.extend([[ 'Módulo', name, str(count)] for name, count in analysis.source_context_counts.most_common(8)])
-            self._fill_table(self.topic_table, topic_rows)
+            topic_rows = [('Tópico', name, count) for name, count in analysis.topic_counts.most_common()]
+            topic_rows.extend(('Módulo', name, count) for name, count in analysis.source_context_counts.most_common())
+            self._set_rows(self.topic_table, topic_rows)
 
             highlights = [
                 f'• Top categorias: {format_counter(analysis.category_counts, 6)}.',
@@ -1460,10 +4264,9 @@ if HAS_QT:
         def on_session_selected(self) -> None:
             if not self.analysis:
                 return
-            row = self.session_table.currentRow()
-            if row < 0 or row >= len(self.analysis.sessions):
+            session = self._selected_row(self.session_table)
+            if session is None:
                 return
-            session = self.analysis.sessions[row]
             lines = [
                 f'Programa {session.index}',
                 f'Início: {session.start:%Y-%m-%d %H:%M:%S}',
@@ -1483,56 +4286,47 @@ if HAS_QT:
             else:
                 lines.append('• Nenhum erro detectado nesta janela.')
             self.session_details.setPlainText('\n'.join(lines))
-            self._fill_table(
-                self.session_events,
-                [[event.timestamp.strftime('%H:%M:%S'), self._categorize(event), event.message[:180]] for event in session.events[-40:]],
-            )
+            self._set_rows(self.session_events, session.events)
+            self.session_events.scrollToBottom()
 
         def on_recommendation_selected(self) -> None:
             if not self.analysis:
                 return
-            row = self.recommendations_table.currentRow()
-            if row < 0 or row >= len(self.analysis.recommendations):
+            item = self._selected_row(self.recommendations_table)
+            if item is None:
                 return
-            item = self.analysis.recommendations[row]
             self.recommendation_details.setPlainText(
                 f'{item.title}\nPrioridade: {item.priority}\nMétrica gatilho: {item.metric}\n\n{item.description}'
             )
 
         def export_summary(self) -> None:
-            if not self.analysis:
+            if not self.visible_analysis:
                 QMessageBox.information(self, 'Sem dados', 'Carregue um arquivo antes de exportar o resumo.')
                 return
-            path, _ = QFileDialog.getSaveFileName(self, 'Salvar resumo', str(self.analysis.source_path.with_suffix('.summary.json')), 'JSON (*.json)')
+            path, _ = QFileDialog.getSaveFileName(self, 'Salvar resumo', str(self.visible_analysis.source_path.with_suffix('.summary.json')), 'JSON (*.json)')
             if not path:
                 return
-            Path(path).write_text(json.dumps(build_summary_payload(self.analysis), indent=2, ensure_ascii=False), encoding='utf-8')
+            Path(path).write_text(json.dumps(build_summary_payload(self.visible_analysis), indent=2, ensure_ascii=False), encoding='utf-8')
             QMessageBox.information(self, 'Exportação concluída', f'Resumo salvo em:\n{path}')
 
-        def _fill_table(self, table: QTableWidget, rows: list[list[str]], color_column: int | None = None) -> None:
-            table.setRowCount(len(rows))
-            for row_index, row in enumerate(rows):
-                for col_index, value in enumerate(row):
-                    item = QTableWidgetItem(value)
-                    if color_column is not None and col_index == color_column:
-                        item.setForeground(QColor(PRIORITY_COLORS.get(value, '#e2e8f0')))
-                    table.setItem(row_index, col_index, item)
-            table.clearSelection()
-
         def _categorize(self, record: LogRecord) -> str:
-            for category, patterns in CATEGORY_RULES:
-                if any(pattern.search(record.message) or pattern.search(record.topic) for pattern in patterns):
-                    return category
-            return 'Erros diversos' if any(pattern.search(record.message) for pattern in ERROR_PATTERNS) else 'Operação geral'
+            return record.category or CLASSIFIER.classify(record.message, record.topic, record.level).category
 
-def build_summary_payload(analysis: LogAnalysis) -> dict[str, Any]:
+def build_summary_payload(analysis: LogAnalysis, rollup: str | None = None) -> dict[str, Any]:
     error_counter = Counter()
     for session in analysis.sessions:
         error_counter.update(record.message for record in session.errors)
     error_counter.update(record.message for record in analysis.unassigned_errors)
 
-    return {
-        'arquivo': str(analysis.source_path),
+    payload: dict[str, Any] = {'arquivo': str(analysis.source_path)}
+    if analysis.record_filter:
+        payload['filtro'] = analysis.record_filter.describe()
+    if analysis.is_window:
+        payload['janela'] = {
+            'inicio': analysis.window_start.isoformat(sep=' ') if analysis.window_start else None,
+            'fim': analysis.window_end.isoformat(sep=' ') if analysis.window_end else None,
+        }
+    return payload | {
         'resumo': {
             'programas_detectados': analysis.total_programs,
             'programas_finalizados': analysis.completed_programs,
@@ -1559,7 +4353,7 @@ def build_summary_payload(analysis: LogAnalysis) -> dict[str, Any]:
                 'aberturas_de_arco': session.arc_openings,
                 'tempo_total_de_arco': format_timedelta(session.total_arc_time),
                 'eficiencia_percentual': round(session.arc_efficiency * 100, 2),
-                'estados': session.states,
+                'estados': list(session.states),
                 'eventos': session.event_count,
                 'erros': [record.message for record in session.errors],
             }
@@ -1581,7 +4375,49 @@ def build_summary_payload(analysis: LogAnalysis) -> dict[str, Any]:
             {'item': entry.label, 'valor': entry.value, 'horario': entry.timestamp.isoformat(sep=' ')}
             for entry in analysis.version_inventory[:50]
         ],
+    } | ({'serie_temporal': build_rollup_payload(analysis, rollup)} if rollup else {})
+
+
+def build_rollup_payload(analysis: LogAnalysis, bucket: str) -> list[dict[str, Any]]:
+    return [
+        {
+            'inicio': totals.start.isoformat(sep=' '),
+            'registros': totals.records,
+            'programas': totals.programs,
+            'erros': totals.errors,
+            'warnings': totals.warnings,
+            'tempo_de_arco_segundos': round(totals.arc_seconds, 1),
+            'eficiencia_percentual': round(totals.arc_efficiency * 100, 2),
+            'score_operacional': totals.health_score,
+        }
+        for totals in analysis.rollup(bucket).series()
+    ]
+
+
+def build_search_payload(analysis: LogAnalysis, query: str, limit: int) -> dict[str, Any]:
+    hits = analysis.search(query)
+    per_session = Counter(f'Prog. {hit.session}' if hit.session else 'Fora prog.' for hit in hits)
+    payload = {
+        'arquivo': str(analysis.source_path),
+        'consulta': query,
+        'ocorrencias': len(hits),
+        'ocorrencias_por_programa': dict(per_session.most_common()),
+        'resultados': [
+            {
+                'registro': hit.sequence,
+                'horario': hit.timestamp.isoformat(sep=' '),
+                'programa': hit.session,
+                'topico': hit.topic,
+                'nivel': hit.level,
+                'categoria': hit.category,
+                'mensagem': hit.message,
+            }
+            for hit in hits[:limit]
+        ],
     }
+    if analysis.record_filter:
+        payload['filtro'] = analysis.record_filter.describe()
+    return payload
 
 
 def format_timedelta(delta: timedelta) -> str:
@@ -1591,6 +4427,12 @@ def format_timedelta(delta: timedelta) -> str:
     return f'{hours:02d}:{minutes:02d}:{seconds:02d}'
 
 
+def format_time_span(analysis: LogAnalysis, separator: str = ' → ') -> str:
+    if analysis.first_timestamp is None or analysis.last_timestamp is None:
+        return 'nenhum registro no período'
+    return f'{analysis.first_timestamp:%d/%m/%Y %H:%M:%S}{separator}{analysis.last_timestamp:%d/%m/%Y %H:%M:%S}'
+
+
 def format_counter(counter: Counter[str], limit: int) -> str:
     if not counter:
         return 'sem dados'
@@ -1601,21 +4443,325 @@ def format_services_line(statuses: dict[str, str]) -> str:
     return ', '.join(f'{name}={status}' for name, status in statuses.items()) or 'nenhum status disponível'
 
 
-def print_cli_summary(analysis: LogAnalysis) -> None:
-    print(json.dumps(build_summary_payload(analysis), indent=2, ensure_ascii=False))
+def format_record_filter(record_filter: RecordFilter) -> str:
+    return ', '.join(f'{key}={value}' for key, value in record_filter.describe().items())
+
+
+def print_cli_summary(analysis: LogAnalysis, rollup: str | None = None) -> None:
+    print(json.dumps(build_summary_payload(analysis, rollup), indent=2, ensure_ascii=False))
+
+
+@dataclass
+class FleetRollup:
+    files: int = 0
+    failures: int = 0
+    programs: int = 0
+    completed_programs: int = 0
+    arc_seconds: float = 0.0
+    errors: int = 0
+    warnings: int = 0
+    errors_by_category: Counter[str] = field(default_factory=Counter)
+    health_scores: list[tuple[int, str]] = field(default_factory=list)
+
+    def add(self, path: str, payload: dict[str, Any], error_categories: dict[str, int], arc_seconds: float) -> None:
+        summary = payload['resumo']
+        self.files += 1
+        self.programs += summary['programas_detectados']
+        self.completed_programs += summary['programas_finalizados']
+        self.arc_seconds += arc_seconds
+        self.errors += summary['erros_detectados']
+        self.warnings += summary['warnings_detectados']
+        self.errors_by_category.update(error_categories)
+        self.health_scores.append((summary['score_operacional'], path))
+
+    def to_payload(self, limit: int = 10) -> dict[str, Any]:
+        return {
+            'arquivos_analisados': self.files,
+            'arquivos_com_falha': self.failures,
+            'programas_detectados': self.programs,
+            'programas_finalizados': self.completed_programs,
+            'tempo_total_de_arco': format_timedelta(timedelta(seconds=self.arc_seconds)),
+            'erros_detectados': self.errors,
+            'warnings_detectados': self.warnings,
+            'erros_por_categoria': dict(self.errors_by_category.most_common()),
+            'piores_scores': [
+                {'arquivo': path, 'score_operacional': score}
+                for score, path in sorted(self.health_scores)[:limit]
+            ],
+        }
+
+
+def expand_log_inputs(inputs: Iterable[str]) -> list[Path]:
+    paths: dict[Path, Path] = {}
+    for item in inputs:
+        candidate = Path(item)
+        if candidate.is_dir():
+            matches = sorted(path for path in candidate.rglob('*') if path.is_file() and path.suffix.lower() in {'.txt', '.log'})
+        elif candidate.is_file():
+            matches = [candidate]
+        else:
+            matches = sorted(Path(match) for match in glob.glob(item, recursive=True) if Path(match).is_file())
+        for path in matches:
+            paths.setdefault(path.resolve(), path)
+    return list(paths.values())
+
+
+def _analyze_for_batch(
+    path: str,
+    mapped: bool,
+    lazy_json: bool,
+    cache: AnalysisCache | None = None,
+    record_filter: RecordFilter | None = None,
+) -> tuple[str, dict[str, Any], dict[str, int], float]:
+    analysis = analyze_file(path, mapped=mapped, lazy_json=lazy_json, retain_records=False, cache=cache, record_filter=record_filter)
+    errors = [error for session in analysis.sessions for error in session.errors] + analysis.unassigned_errors
+    error_categories = Counter(error.category for error in errors)
+    return path, build_summary_payload(analysis), dict(error_categories), analysis.total_arc_time.total_seconds()
+
+
+def run_batch(
+    inputs: Iterable[str],
+    workers: int,
+    mapped: bool = False,
+    lazy_json: bool = False,
+    cache: AnalysisCache | None = None,
+    record_filter: RecordFilter | None = None,
+) -> FleetRollup:
+    paths = expand_log_inputs(inputs)
+    if not paths:
+        raise SystemExit('Nenhum arquivo de log encontrado nos caminhos informados.')
+    rollup = FleetRollup()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_analyze_for_batch, str(path), mapped, lazy_json, cache, record_filter): str(path) for path in paths}
+        for future in as_completed(futures):
+            try:
+                path, payload, error_categories, arc_seconds = future.result()
+            except Exception as exc:
+                rollup.failures += 1
+                line = {'tipo': 'erro', 'arquivo': futures[future], 'mensagem': str(exc)}
+            else:
+                rollup.add(path, payload, error_categories, arc_seconds)
+                line = {'tipo': 'arquivo', **payload, 'erros_por_categoria': error_categories}
+            print(json.dumps(line, ensure_ascii=False), flush=True)
+    fleet = {'tipo': 'frota', **rollup.to_payload()}
+    if record_filter:
+        fleet['filtro'] = record_filter.describe()
+    print(json.dumps(fleet, ensure_ascii=False), flush=True)
+    return rollup
+
+
+def follow_cli_summary(path: str, interval: float, lazy_json: bool = False, record_filter: RecordFilter | None = None) -> None:
+    follower = LogFollower(path, lazy_json=lazy_json, record_filter=record_filter)
+    analyzer = MonitorAnalyzer(source_path=path, retain_records=False, record_filter=record_filter)
+    try:
+        while True:
+            new_records = follower.poll()
+            if new_records:
+                analyzer.feed_many(new_records)
+                analysis = analyzer.snapshot()
+                line = {
+                    'atualizado_em': datetime.now().isoformat(sep=' ', timespec='seconds'),
+                    'novos_registros': len(new_records),
+                    'rotacoes': follower.rotations,
+                    'resumo': build_summary_payload(analysis)['resumo'],
+                }
+                if record_filter:
+                    line['filtro'] = record_filter.describe()
+                print(json.dumps(line, ensure_ascii=False), flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def live_cli_summary(settings: MqttSettings, interval: float, lazy_json: bool = False, record_filter: RecordFilter | None = None) -> None:
+    ingest = LiveIngest(settings.label, lazy_json=lazy_json, record_filter=record_filter)
+    source = MqttLiveSource(settings, ingest)
+    try:
+        source.start()
+    except (OSError, RuntimeError) as exc:
+        raise SystemExit(str(exc)) from exc
+    try:
+        while True:
+            time.sleep(interval)
+            fed = ingest.drain()
+            if not fed:
+                continue
+            line = {
+                'atualizado_em': datetime.now().isoformat(sep=' ', timespec='seconds'),
+                'broker': settings.label,
+                'status': source.status,
+                'novos_registros': fed,
+                'descartadas': ingest.dropped,
+                'resumo': build_summary_payload(ingest.analyzer.snapshot())['resumo'],
+            }
+            if record_filter:
+                line['filtro'] = record_filter.describe()
+            print(json.dumps(line, ensure_ascii=False), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        source.stop()
+
+
+def run_replay(
+    path: str | Path,
+    speed: float = 1.0,
+    settings: MqttSettings | None = None,
+    record_filter: RecordFilter | None = None,
+    frame: float = LIVE_FRAME_SECONDS,
+    settle: float = 5.0,
+    limit: int | None = None,
+) -> ReplayReport:
+    probe = ReplayProbe()
+    ingest = LiveIngest(str(path))
+    ingest.observer = probe.mark_seen
+    stop = threading.Event()
+
+    def consume() -> None:
+        while not stop.wait(frame):
+            ingest.drain()
+        ingest.drain()
+
+    consumer = threading.Thread(target=consume, name='replay-consumer', daemon=True)
+    source: MqttLiveSource | None = None
+    publisher: Any = None
+    publish: Callable[[str, bytes], Any] = ingest.receive
+    try:
+        if settings:
+            source = MqttLiveSource(settings, ingest)
+            source.start()
+            if not source.subscribed.wait(settle):
+                raise RuntimeError(f'Sem assinatura no broker {settings.label} ({source.status}).')
+            publisher = MqttLiveSource._create_client()
+            if settings.username:
+                publisher.username_pw_set(settings.username, settings.password)
+            publisher.connect(settings.host, settings.port, 60)
+            publisher.loop_start()
+            publish = publisher.publish
+        consumer.start()
+        sent, elapsed = LogReplayer(path, speed, record_filter).run(publish, probe, limit=limit)
+        deadline = time.monotonic() + settle
+        while probe.outstanding and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        stop.set()
+        if consumer.is_alive():
+            consumer.join()
+        if publisher is not None:
+            publisher.disconnect()
+            publisher.loop_stop()
+        if source:
+            source.stop()
+    return ReplayReport(
+        source=str(path),
+        target=settings.label if settings else 'processo',
+        speed=speed,
+        sent=sent,
+        seen=probe.seen,
+        elapsed=elapsed,
+        latencies=probe.latencies,
+        consumer_elapsed=probe.last_seen - probe.first_sent if probe.last_seen is not None and probe.first_sent is not None else 0.0,
+    )
+
+
+def parse_cli_datetime(text: str) -> datetime:
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f'Data/hora inválida: {text!r} (use AAAA-MM-DD ou AAAA-MM-DD HH:MM:SS).') from exc
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Monitor de corte para logs Phoenix.')
     parser.add_argument('logfile', nargs='?', help='Arquivo de log a ser analisado.')
     parser.add_argument('--summary', action='store_true', help='Imprime o resumo JSON no terminal e encerra.')
+    parser.add_argument('--mapped', action='store_true', help='Mapeia o log em memória e decodifica payloads só sob demanda.')
+    parser.add_argument('--lazy-json', action='store_true', help='Lê só os campos Serilog usados na análise e adia o JSON completo.')
+    parser.add_argument('--follow', action='store_true', help='Acompanha o log enquanto ele cresce, lendo só os bytes novos.')
+    parser.add_argument('--interval', type=float, default=2.0, help='Intervalo em segundos entre leituras no modo --follow (e entre resumos com --live --summary).')
+    parser.add_argument('--live', metavar='BROKER', help='Analisa ao vivo as mensagens do broker MQTT (host ou host:porta, porta padrão 1884).')
+    parser.add_argument('--mqtt-topic', default='Phoenix/#', help='Tópico assinado no modo --live.')
+    parser.add_argument('--mqtt-user', help='Usuário do broker MQTT.')
+    parser.add_argument('--mqtt-password', help='Senha do broker MQTT.')
+    parser.add_argument('--replay', action='store_true', help='Republica o log informado (no processo ou no broker de --live) e mede vazão, latência e perdas do modo ao vivo.')
+    parser.add_argument('--speed', type=float, default=1.0, help='Velocidade do --replay: 1 = ritmo original, 10 = dez vezes mais rápido, 0 = sem pausas.')
+    parser.add_argument('--replay-frame', type=float, default=LIVE_FRAME_SECONDS, metavar='S', help=f'Intervalo entre leituras do consumidor no --replay (padrão {LIVE_FRAME_SECONDS}, o quadro da interface).')
+    parser.add_argument('--replay-settle', type=float, default=5.0, metavar='S', help='Espera pelas mensagens em trânsito depois da última publicação do --replay (padrão 5).')
+    parser.add_argument('--workers', type=int, default=None, help='Processos usados para decodificar e classificar o log em paralelo (em lote: arquivos simultâneos).')
+    parser.add_argument('--batch', nargs='+', metavar='CAMINHO', help='Analisa vários arquivos, diretórios ou globs e emite JSON por arquivo e da frota.')
+    parser.add_argument('--no-cache', action='store_true', help='Ignora o cache de análise em disco.')
+    parser.add_argument('--cache-dir', help='Diretório do cache de análise (padrão: $APP_MONITOR_CACHE_DIR ou ~/.cache/app_monitor).')
+    parser.add_argument('--topic', action='append', default=[], metavar='GLOB', help='Analisa só os tópicos que casam com o glob (pode repetir).')
+    parser.add_argument('--min-level', metavar='NIVEL', help='Nível Serilog mínimo (Debug, Information, Warning, Error, Fatal).')
+    parser.add_argument('--since', type=parse_cli_datetime, metavar='DATA', help='Descarta registros anteriores a esta data/hora.')
+    parser.add_argument('--until', type=parse_cli_datetime, metavar='DATA', help='Descarta registros a partir desta data/hora.')
+    parser.add_argument('--source-context', action='append', default=[], metavar='GLOB', help='Analisa só os SourceContext que casam com o glob (pode repetir).')
+    parser.add_argument('--rollup', choices=list(ROLLUP_BUCKETS), help='Inclui no resumo JSON a série de KPIs por minuto, hora ou turno.')
+    parser.add_argument('--search', metavar='CONSULTA', help='Busca palavras ou "frases exatas" nas mensagens e imprime as ocorrências em JSON.')
+    parser.add_argument('--search-limit', type=int, default=50, metavar='N', help='Máximo de ocorrências listadas por --search (o total é sempre informado).')
     args = parser.parse_args()
+    cache = None if args.no_cache else AnalysisCache(args.cache_dir)
+    record_filter = None
+    if args.topic or args.min_level or args.since or args.until or args.source_context:
+        try:
+            record_filter = RecordFilter(
+                topics=tuple(args.topic),
+                min_level=args.min_level,
+                start=args.since,
+                end=args.until,
+                source_contexts=tuple(args.source_context),
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if args.batch:
+        run_batch(args.batch, workers=args.workers or os.cpu_count() or 1, mapped=args.mapped, lazy_json=args.lazy_json, cache=cache, record_filter=record_filter)
+        return
+    workers = args.workers or 1
+    mqtt_settings = None
+    if args.live:
+        try:
+            mqtt_settings = MqttSettings.parse(args.live, topic=args.mqtt_topic, username=args.mqtt_user, password=args.mqtt_password)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if args.follow and not args.logfile:
+        raise SystemExit('Informe o caminho do log ao usar --follow.')
+
+    if args.replay:
+        if not args.logfile:
+            raise SystemExit('Informe o caminho do log ao usar --replay.')
+        try:
+            report = run_replay(args.logfile, args.speed, mqtt_settings, record_filter, frame=args.replay_frame, settle=args.replay_settle)
+        except (OSError, RuntimeError, ValueError) as exc:
+            raise SystemExit(str(exc)) from exc
+        print(json.dumps(report.to_payload(), indent=2, ensure_ascii=False))
+        return
+
+    if args.search is not None:
+        if not args.logfile:
+            raise SystemExit('Informe o caminho do log ao usar --search.')
+        try:
+            analysis = analyze_file(args.logfile, workers=workers, mapped=args.mapped, lazy_json=args.lazy_json, retain_records=False, cache=cache, record_filter=record_filter)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        print(json.dumps(build_search_payload(analysis, args.search, args.search_limit), indent=2, ensure_ascii=False))
+        return
 
     if args.summary:
+        if mqtt_settings:
+            live_cli_summary(mqtt_settings, args.interval, lazy_json=args.lazy_json, record_filter=record_filter)
+            return
         if not args.logfile:
             raise SystemExit('Informe o caminho do log ao usar --summary.')
-        analysis = MonitorAnalyzer(LogParser(args.logfile).parse(), args.logfile).analyze()
-        print_cli_summary(analysis)
+        if args.follow:
+            follow_cli_summary(args.logfile, args.interval, lazy_json=args.lazy_json, record_filter=record_filter)
+            return
+        try:
+            analysis = analyze_file(args.logfile, workers=workers, mapped=args.mapped, lazy_json=args.lazy_json, retain_records=False, cache=cache, record_filter=record_filter)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        print_cli_summary(analysis, args.rollup)
         return
 
     if not HAS_QT:
@@ -1624,7 +4770,18 @@ def main() -> None:
         )
 
     app = QApplication(sys.argv)
-    window = MonitorMainWindow(initial_path=args.logfile)
+    window = MonitorMainWindow(
+        initial_path=args.logfile,
+        mapped=args.mapped,
+        lazy_json=args.lazy_json,
+        follow=args.follow,
+        follow_interval=args.interval,
+        workers=workers,
+        cache=cache,
+        record_filter=record_filter,
+        mqtt_settings=mqtt_settings,
+        live=mqtt_settings is not None,
+    )
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,68 @@
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from monitor_app import LogParser, extract_source_context  # noqa: E402
+
+TOPIC = 'Phoenix/Phoenix/Log'
+STACK = '   at Phoenix.Cnc.Reader.Next() in C:\\src\\Reader.cs:line 42\n' * 20
+
+
+def reference_fields(payload: str) -> tuple:
+    data = json.loads(payload)
+    message = data.get('Message')
+    if not message:
+        template = data.get('MessageTemplate')
+        message = template.get('Text') if isinstance(template, dict) else template
+    return str(message or payload), data.get('Level'), data.get('Timestamp'), extract_source_context(data)
+
+
+def lazy_fields(payload: str) -> tuple:
+    parser = LogParser('nenhum.log', lazy_json=True)
+    message, level, _, timestamp, source_context = parser._extract_fields(TOPIC, payload)
+    return message, level, timestamp, source_context
+
+
+def test_brace_inside_string_does_not_promote_nested_keys():
+    payload = json.dumps({
+        'Timestamp': '2026-03-19T08:15:58.5017398-03:00',
+        'Level': 'Information',
+        'MessageTemplate': 'Leitura ok',
+        'Exception': 'System.FormatException: esperado }\n' + STACK,
+        'Properties': {'Message': 'Colisão detectada'},
+    })
+    assert len(payload) > LogParser.scan_threshold
+    assert lazy_fields(payload) == reference_fields(payload) == (
+        'Leitura ok', 'Information', '2026-03-19T08:15:58.5017398-03:00', None
+    )
+
+
+def test_scanner_matches_json_loads_on_generated_payloads():
+    rng = random.Random(2026)
+    noise = ['{', '}', '[', ']', '"Level":', '"Message": "x"', '\\', ':', ',', 'ok', ' ']
+
+    def text() -> str:
+        return ''.join(rng.choice(noise) for _ in range(rng.randint(0, 12)))
+
+    def nested() -> dict:
+        return {rng.choice(['Message', 'Level', 'Timestamp', 'SourceContext', 'Text']): text() for _ in range(3)}
+
+    for _ in range(3000):
+        data: dict = {}
+        for key in rng.sample(['Timestamp', 'Level', 'Message', 'MessageTemplate', 'Exception', 'Properties', 'Renderings'], rng.randint(2, 7)):
+            if key == 'Properties':
+                properties = nested()
+                if rng.random() < 0.7:
+                    properties['SourceContext'] = rng.choice([{'Value': text()}, text(), [nested()]])
+                data[key] = properties
+            elif key == 'MessageTemplate':
+                data[key] = rng.choice([{'Text': text()}, text()])
+            elif key == 'Renderings':
+                data[key] = [nested(), {'Properties': nested()}]
+            else:
+                data[key] = text() + (STACK if key == 'Exception' else '')
+        payload = json.dumps(data, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2]))
+        assert lazy_fields(payload) == reference_fields(payload), payload
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from monitor_app import LogParser, MonitorAnalyzer  # noqa: E402
+
+SAMPLE_LOG = Path(__file__).resolve().parents[1] / 'log_exemplo.txt'
+
+
+def history(analysis) -> tuple:
+    active = analysis.sessions[-1] if analysis.sessions else None
+    return (
+        list(analysis.records),
+        list(analysis.unassigned_errors),
+        list(analysis.cut_mode_history),
+        list(analysis.state_history),
+        list(analysis.service_status_history),
+        list(analysis.version_inventory),
+        [list(getattr(active, name)) for name in ('errors', 'warnings', 'states', 'events')] if active else None,
+    )
+
+
+def test_snapshot_is_not_changed_by_later_records():
+    records = LogParser(SAMPLE_LOG).parse()
+    analyzer = MonitorAnalyzer(source_path=SAMPLE_LOG)
+    snapshots = []
+    for start in range(0, len(records), 97):
+        analyzer.feed_many(records[start:start + 97])
+        snapshot = analyzer.snapshot()
+        snapshots.append((snapshot, history(snapshot)))
+    for snapshot, expected in snapshots:
+        assert history(snapshot) == expected
+        assert len(snapshot.records) == snapshot.record_count
+    full = MonitorAnalyzer(records, source_path=SAMPLE_LOG).analyze()
+    assert history(snapshots[-1][0]) == history(full)
+
+
+def test_snapshot_views_behave_like_lists():
+    analysis = MonitorAnalyzer(LogParser(SAMPLE_LOG).parse(), source_path=SAMPLE_LOG).analyze()
+    history = analysis.state_history
+    plain = list(history)
+    assert history[1:] + [None] == plain[1:] + [None]
+    assert [None] + history == [None] + plain
+    assert history[-1] == plain[-1] and history[::-2] == plain[::-2]
+    assert history == plain